@@ -0,0 +1,51 @@
+"""Store recipe total_time as a generated column with a keyset index
+
+Revision ID: 0b7e3f5a9c21
+Revises: f41b8d2c6a93
+Create Date: 2026-10-18 17:52:40.318207
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0b7e3f5a9c21"
+down_revision = "f41b8d2c6a93"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The old column was never written, so there is nothing to keep. Adding
+    # the stored generated column rewrites the table, which backfills it.
+    op.drop_column("recipes", "total_time")
+    op.add_column(
+        "recipes",
+        sa.Column(
+            "total_time",
+            sa.Integer(),
+            sa.Computed(
+                "CASE WHEN prep_time IS NOT NULL OR cook_time IS NOT NULL "
+                "THEN coalesce(prep_time, 0) + coalesce(cook_time, 0) END",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_recipes_public_total_time_id",
+        "recipes",
+        ["total_time", "id"],
+        unique=False,
+        postgresql_where=sa.text("is_public"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recipes_public_total_time_id", table_name="recipes")
+    op.drop_column("recipes", "total_time")
+    op.add_column("recipes", sa.Column("total_time", sa.Integer(), nullable=True))
@@ -0,0 +1,41 @@
+"""Add partial indexes for the public cuisine and difficulty filters
+
+Revision ID: 1c9d6e2b4f80
+Revises: 0b7e3f5a9c21
+Create Date: 2026-10-18 18:26:03.551847
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1c9d6e2b4f80"
+down_revision = "0b7e3f5a9c21"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_recipes_public_cuisine_created_id",
+        "recipes",
+        ["cuisine", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("is_public"),
+    )
+    op.create_index(
+        "ix_recipes_public_difficulty_created_id",
+        "recipes",
+        ["difficulty", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("is_public"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recipes_public_difficulty_created_id", table_name="recipes")
+    op.drop_index("ix_recipes_public_cuisine_created_id", table_name="recipes")
@@ -0,0 +1,30 @@
+"""Add recipe version for optimistic concurrency control
+
+Revision ID: 2f6a8d0c7e13
+Revises: 1c9d6e2b4f80
+Create Date: 2026-10-18 19:04:27.615392
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2f6a8d0c7e13"
+down_revision = "1c9d6e2b4f80"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "recipes",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("recipes", "version")
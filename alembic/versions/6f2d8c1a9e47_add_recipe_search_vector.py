@@ -0,0 +1,51 @@
+"""Add weighted full-text search vector to recipes
+
+Revision ID: 6f2d8c1a9e47
+Revises: 40300ba2fe3b
+Create Date: 2026-10-18 09:12:31.402117
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6f2d8c1a9e47"
+down_revision = "40300ba2fe3b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Adding a STORED generated column rewrites the table, which also
+    # backfills the vector for every existing recipe.
+    op.add_column(
+        "recipes",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+                "setweight(to_tsvector('english', coalesce(content, '')), 'C')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_recipes_search_vector",
+        "recipes",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recipes_search_vector", table_name="recipes")
+    op.drop_column("recipes", "search_vector")
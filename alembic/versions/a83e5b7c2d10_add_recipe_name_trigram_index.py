@@ -0,0 +1,34 @@
+"""Add trigram index on recipe names for fuzzy search
+
+Revision ID: a83e5b7c2d10
+Revises: 6f2d8c1a9e47
+Create Date: 2026-10-18 10:04:52.118930
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a83e5b7c2d10"
+down_revision = "6f2d8c1a9e47"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_recipes_name_trgm",
+        "recipes",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recipes_name_trgm", table_name="recipes")
+    # pg_trgm is left installed; other schemas in a shared database may use it.
@@ -0,0 +1,49 @@
+"""Add composite indexes for keyset pagination of recipe listings
+
+Revision ID: c5a1f09d3b62
+Revises: a83e5b7c2d10
+Create Date: 2026-10-18 11:20:07.563204
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c5a1f09d3b62"
+down_revision = "a83e5b7c2d10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_recipes_public_created_id",
+        "recipes",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("is_public"),
+    )
+    op.create_index(
+        "ix_recipes_public_featured_created_id",
+        "recipes",
+        [sa.text("is_featured DESC"), sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("is_public"),
+    )
+    op.create_index(
+        "ix_recipes_public_category_created_id",
+        "recipes",
+        ["category", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("is_public"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recipes_public_category_created_id", table_name="recipes")
+    op.drop_index("ix_recipes_public_featured_created_id", table_name="recipes")
+    op.drop_index("ix_recipes_public_created_id", table_name="recipes")
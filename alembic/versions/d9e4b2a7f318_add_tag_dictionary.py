@@ -0,0 +1,98 @@
+"""Add tag dictionary and recipe_tags association with usage counts
+
+Revision ID: d9e4b2a7f318
+Revises: c5a1f09d3b62
+Create Date: 2026-10-18 12:41:18.270455
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d9e4b2a7f318"
+down_revision = "c5a1f09d3b62"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tags",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("public_count", sa.Integer(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_index(
+        "ix_tags_popular",
+        "tags",
+        [sa.text("public_count DESC"), "name"],
+        unique=False,
+        postgresql_where=sa.text("public_count > 0"),
+    )
+    op.create_index(
+        "ix_tags_name_trgm",
+        "tags",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_table(
+        "recipe_tags",
+        sa.Column("tag_id", sa.Integer(), nullable=False),
+        sa.Column("recipe_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.ForeignKeyConstraint(["tag_id"], ["tags.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["recipe_id"], ["recipes.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tag_id", "recipe_id"),
+    )
+    op.create_index(
+        "ix_recipe_tags_recipe_id", "recipe_tags", ["recipe_id"], unique=False
+    )
+
+    # Backfill from the recipes.tags array column
+    op.execute(
+        """
+        INSERT INTO tags (name)
+        SELECT DISTINCT tag.name
+        FROM recipes CROSS JOIN LATERAL unnest(recipes.tags) AS tag(name)
+        WHERE tag.name IS NOT NULL AND tag.name <> ''
+        ON CONFLICT (name) DO NOTHING
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO recipe_tags (tag_id, recipe_id)
+        SELECT DISTINCT tags.id, recipes.id
+        FROM recipes
+        CROSS JOIN LATERAL unnest(recipes.tags) AS tag(name)
+        JOIN tags ON tags.name = tag.name
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute(
+        """
+        UPDATE tags SET public_count = usage.n
+        FROM (
+            SELECT recipe_tags.tag_id, count(*) AS n
+            FROM recipe_tags JOIN recipes ON recipes.id = recipe_tags.recipe_id
+            WHERE recipes.is_public
+            GROUP BY recipe_tags.tag_id
+        ) AS usage
+        WHERE tags.id = usage.tag_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recipe_tags_recipe_id", table_name="recipe_tags")
+    op.drop_table("recipe_tags")
+    op.drop_index("ix_tags_name_trgm", table_name="tags")
+    op.drop_index("ix_tags_popular", table_name="tags")
+    op.drop_table("tags")
@@ -0,0 +1,31 @@
+"""Add varchar_pattern_ops index on recipes.slug for prefix lookups
+
+Revision ID: e2c7a4f91b05
+Revises: d9e4b2a7f318
+Create Date: 2026-10-18 14:02:51.118307
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e2c7a4f91b05"
+down_revision = "d9e4b2a7f318"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_recipes_slug_pattern",
+        "recipes",
+        ["slug"],
+        unique=False,
+        postgresql_ops={"slug": "varchar_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recipes_slug_pattern", table_name="recipes")
@@ -0,0 +1,27 @@
+"""Add (updated_at, id) index for incremental recipe exports
+
+Revision ID: f41b8d2c6a93
+Revises: e2c7a4f91b05
+Create Date: 2026-10-18 16:37:12.904516
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f41b8d2c6a93"
+down_revision = "e2c7a4f91b05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_recipes_updated_id", "recipes", ["updated_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recipes_updated_id", table_name="recipes")
@@ -1,32 +1,76 @@
 from __future__ import annotations
 
-import contextlib
+import json
 import typing
+import zipfile
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, File, HTTPException, Query, UploadFile
-from fastapi.responses import Response
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cookbook.core.markdown import MarkdownRecipeParser, validate_markdown_recipe
+from cookbook.config import settings
+from cookbook.core.http import (
+    REVALIDATE,
+    SHORT_LIVED,
+    STATIC,
+    conditional_response,
+    is_not_modified,
+    not_modified_response,
+    revalidates_by_date,
+)
+from cookbook.core.markdown import (
+    MARKDOWN_EXPORT_FIELDS,
+    MARKDOWN_SUFFIXES,
+    MarkdownRecipeParser,
+    ParsedEntry,
+    markdown_export_data,
+    parse_import_entry,
+    parse_markdown_recipe,
+)
 from cookbook.crud.recipe import (
+    ListItem,
+    StaleRecipeError,
+    bulk_delete_recipes,
+    bulk_update_recipes,
+    cache_recipe,
     create_recipe,
     delete_recipe,
+    get_cached_recipe,
+    get_catalog,
     get_featured_recipes,
     get_recent_recipes,
     get_recipe,
     get_recipe_by_slug,
-    get_recipe_count,
+    get_recipe_stats,
+    get_recipe_updated_at,
     get_recipes,
     get_recipes_by_category,
-    get_unique_categories,
-    get_unique_cuisines,
-    get_unique_tags,
+    get_search_facets,
+    get_search_suggestions,
+    import_chunk,
+    invalidate_recipe_cache,
+    recipe_cache,
     search_recipes,
+    stream_recipes,
     update_recipe,
 )
-from cookbook.database import get_session
+from cookbook.database import get_read_session, get_session
 from cookbook.dependencies import (
     get_current_admin_user,
     get_current_user,
@@ -34,11 +78,17 @@ from cookbook.dependencies import (
 from cookbook.models.recipe import Recipe
 from cookbook.models.user import User
 from cookbook.schemas.recipe import (
+    FacetCount,
+    RecipeBulkOperation,
+    RecipeBulkResult,
     RecipeCreate,
+    RecipeFacets,
     RecipeListItem,
+    RecipeListParams,
     RecipeResponse,
     RecipeSearchParams,
     RecipeSearchResponse,
+    RecipeStats,
     RecipeUpdate,
 )
 from cookbook.schemas.recipe_schema import (
@@ -49,6 +99,11 @@ from cookbook.schemas.recipe_schema import (
 
 router = APIRouter()
 
+# Response header carrying the cursor for the next page of list endpoints
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+_names = TypeAdapter(list[str])
+
 
 def convert_to_response(db_recipe: Recipe) -> RecipeResponse:
     """Convert a database Recipe model to response schema."""
@@ -58,108 +113,253 @@ def convert_to_response(db_recipe: Recipe) -> RecipeResponse:
     return response
 
 
-def convert_to_list_item(db_recipe: Recipe) -> RecipeListItem:
-    """Convert a database Recipe model to list item schema."""
-    list_item: RecipeListItem = RecipeListItem.model_validate(
-        db_recipe, from_attributes=True
+def next_cursor_headers(next_cursor: str | None) -> dict[str, str]:
+    """Headers exposing the next page cursor of a list endpoint."""
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+
+
+def list_response(
+    request: Request,
+    recipes: list[ListItem],
+    *,
+    next_cursor: str | None = None,
+) -> Response:
+    """
+    Serialize a page of recipes as a conditional response.
+
+    List rows already have the shape of RecipeListItem, so they are encoded
+    directly rather than validated into models first.
+    """
+    return conditional_response(
+        request,
+        to_json(recipes),
+        cache_control=REVALIDATE,
+        headers=next_cursor_headers(next_cursor),
     )
-    return list_item
 
 
 @router.get("/", response_model=list[RecipeListItem])
 async def list_recipes(
-    db: Annotated[AsyncSession, Depends(get_session)],
-    *,
-    skip: Annotated[int, Query(ge=0, description="Offset for pagination")] = 0,
-    limit: Annotated[int, Query(ge=1, le=100, description="Number of results")] = 20,
-    featured_only: Annotated[
-        bool, Query(description="Show only featured recipes")
-    ] = False,
-) -> list[RecipeListItem]:
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_read_session)],
+    params: Annotated[RecipeListParams, Depends()],
+) -> Response:
     """List recipes with pagination."""
-    recipes = await get_recipes(
-        db, skip=skip, limit=limit, public_only=True, featured_only=featured_only
-    )
-    return [convert_to_list_item(recipe) for recipe in recipes]
+    try:
+        page = await get_recipes(db, params, public_only=True)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return list_response(request, page.recipes, next_cursor=page.next_cursor)
 
 
 @router.get("/search", response_model=RecipeSearchResponse)
 async def search_recipes_endpoint(
-    db: Annotated[AsyncSession, Depends(get_session)],
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_read_session)],
     search_params: Annotated[RecipeSearchParams, Depends()],
-) -> RecipeSearchResponse:
+) -> Response:
     """Search recipes with filters."""
-
-    recipes, total = await search_recipes(db, search_params)
-
-    return RecipeSearchResponse(
-        recipes=[convert_to_list_item(recipe) for recipe in recipes],
-        total=total,
+    try:
+        result = await search_recipes(db, search_params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    # Offer close recipe names when the query found nothing
+    did_you_mean: list[str] = []
+    if search_params.q and result.total == 0:
+        did_you_mean = await get_search_suggestions(db, search_params.q)
+
+    facets = None
+    if search_params.facets:
+        facet_counts = await get_search_facets(db, search_params)
+        facets = RecipeFacets(**{
+            name: [
+                FacetCount(value=value, count=count)
+                for value, count in sorted(
+                    counts.items(), key=lambda item: (-item[1], item[0])
+                )
+            ]
+            for name, counts in facet_counts.items()
+        })
+
+    # Validate the envelope only; the rows already match RecipeListItem
+    response = RecipeSearchResponse(
+        recipes=[],
+        total=result.total,
+        total_strategy=result.total_strategy,
         limit=search_params.limit,
         offset=search_params.offset,
+        next_cursor=result.next_cursor,
+        did_you_mean=did_you_mean,
+        facets=facets,
     )
+    body = response.model_dump()
+    body["recipes"] = result.recipes
+    return conditional_response(request, to_json(body), cache_control=REVALIDATE)
 
 
 @router.get("/featured", response_model=list[RecipeListItem])
 async def get_featured_recipes_endpoint(
-    db: Annotated[AsyncSession, Depends(get_session)],
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_read_session)],
     limit: Annotated[
         int, Query(ge=1, le=20, description="Number of featured recipes")
     ] = 5,
-) -> list[RecipeListItem]:
+) -> Response:
     """Get featured recipes."""
     recipes = await get_featured_recipes(db, limit=limit)
-    return [convert_to_list_item(recipe) for recipe in recipes]
+    return list_response(request, recipes)
 
 
 @router.get("/recent", response_model=list[RecipeListItem])
 async def get_recent_recipes_endpoint(
-    db: Annotated[AsyncSession, Depends(get_session)],
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_read_session)],
     limit: Annotated[
         int, Query(ge=1, le=20, description="Number of recent recipes")
     ] = 10,
-) -> list[RecipeListItem]:
+) -> Response:
     """Get recently created recipes."""
     recipes = await get_recent_recipes(db, limit=limit, public_only=True)
-    return [convert_to_list_item(recipe) for recipe in recipes]
+    return list_response(request, recipes)
 
 
 @router.get("/categories", response_model=list[str])
 async def get_categories(
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_session)],
-) -> list[str]:
+) -> Response:
     """Get all unique recipe categories."""
-    return await get_unique_categories(db)
+    catalog = await get_catalog(db)
+    return conditional_response(
+        request, _names.dump_json(catalog.categories), cache_control=SHORT_LIVED
+    )
 
 
 @router.get("/cuisines", response_model=list[str])
-async def get_cuisines(db: Annotated[AsyncSession, Depends(get_session)]) -> list[str]:
+async def get_cuisines(
+    request: Request, db: Annotated[AsyncSession, Depends(get_session)]
+) -> Response:
     """Get all unique cuisines."""
-    return await get_unique_cuisines(db)
+    catalog = await get_catalog(db)
+    return conditional_response(
+        request, _names.dump_json(catalog.cuisines), cache_control=SHORT_LIVED
+    )
 
 
 @router.get("/tags", response_model=list[str])
-async def get_tags(db: Annotated[AsyncSession, Depends(get_session)]) -> list[str]:
+async def get_tags(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_session)],
+    sort: Annotated[
+        typing.Literal["name", "popular"],
+        Query(description="Alphabetical, or most used by public recipes first"),
+    ] = "name",
+    limit: Annotated[
+        int | None, Query(ge=1, le=500, description="Maximum number of tags")
+    ] = None,
+) -> Response:
     """Get all unique tags."""
-    return await get_unique_tags(db)
+    catalog = await get_catalog(db)
+    tags = catalog.popular_tags if sort == "popular" else catalog.tags
+    return conditional_response(
+        request, _names.dump_json(tags[:limit]), cache_control=SHORT_LIVED
+    )
+
+
+# Fields available to /export.ndjson, named as in RecipeResponse
+EXPORT_FIELDS = tuple(RecipeResponse.model_fields)
+
+
+@router.get("/export.ndjson")
+async def export_recipes_ndjson(
+    db: Annotated[AsyncSession, Depends(get_read_session)],
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    updated_since: Annotated[
+        datetime | None, Query(description="Only recipes updated after this time")
+    ] = None,
+    fields: Annotated[
+        list[str] | None,
+        Query(description="Fields to include, repeated or comma-separated"),
+    ] = None,
+) -> StreamingResponse:
+    """
+    Stream every recipe as one JSON object per line (admin only).
+
+    Rows come from a server-side cursor in (updated_at, id) order, so memory
+    use does not grow with the catalog.
+    """
+    selected = list(EXPORT_FIELDS)
+    if fields:
+        selected = [
+            name
+            for value in fields
+            for name in (part.strip() for part in value.split(","))
+            if name
+        ]
+        unknown = sorted(set(selected) - set(EXPORT_FIELDS))
+        if unknown:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown fields: {', '.join(unknown)}"
+            )
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for rows in stream_recipes(db, selected, updated_since=updated_since):
+            yield b"".join(to_json(dict(row)) + b"\n" for row in rows)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.get("/category/{category}", response_model=list[RecipeListItem])
 async def get_recipes_by_category_endpoint(
     category: str,
-    db: Annotated[AsyncSession, Depends(get_session)],
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_read_session)],
     limit: Annotated[int, Query(ge=1, le=100, description="Number of results")] = 20,
-) -> list[RecipeListItem]:
+    cursor: Annotated[
+        str | None, Query(description="Cursor from a previous page's X-Next-Cursor")
+    ] = None,
+) -> Response:
     """Get recipes by category."""
-    recipes = await get_recipes_by_category(db, category, limit=limit, public_only=True)
-    return [convert_to_list_item(recipe) for recipe in recipes]
+    try:
+        page = await get_recipes_by_category(
+            db, category, limit=limit, cursor=cursor, public_only=True
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return list_response(request, page.recipes, next_cursor=page.next_cursor)
 
 
 @router.get("/{recipe_identifier}", response_model=RecipeResponse)
 async def get_recipe_detail(
-    recipe_identifier: str, db: Annotated[AsyncSession, Depends(get_session)]
-) -> RecipeResponse:
+    recipe_identifier: str,
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_session)],
+) -> Response:
     """Get recipe by ID or slug."""
+    cached = await get_cached_recipe(recipe_identifier)
+    if cached is not None:
+        content, updated_at = cached
+        return conditional_response(
+            request, content, cache_control=REVALIDATE, last_modified=updated_at
+        )
+
+    # Revalidation by date alone can be answered without loading the recipe
+    if revalidates_by_date(request):
+        try:
+            lookup: UUID | str = UUID(recipe_identifier)
+        except ValueError:
+            lookup = recipe_identifier
+        last_modified = await get_recipe_updated_at(db, lookup)
+        if last_modified is None:
+            raise HTTPException(status_code=404, detail="Recipe not found")
+        if is_not_modified(request, last_modified=last_modified):
+            return not_modified_response(
+                cache_control=REVALIDATE, last_modified=last_modified
+            )
+
     recipe = None
 
     # Try to parse as UUID first
@@ -171,7 +371,12 @@ async def get_recipe_detail(
         recipe = await get_recipe_by_slug(db, slug=recipe_identifier)
     if not recipe:
         raise HTTPException(status_code=404, detail="Recipe not found")
-    return convert_to_response(recipe)
+
+    response = convert_to_response(recipe)
+    content = await cache_recipe(response)
+    return conditional_response(
+        request, content, cache_control=REVALIDATE, last_modified=response.updated_at
+    )
 
 
 @router.post("/", response_model=RecipeResponse)
@@ -185,10 +390,7 @@ async def create_recipe_endpoint(
     Requires authentication via shared secret token.
     """
     try:
-        recipe_data = recipe.model_dump()
-        recipe_data["author_id"] = current_user.id
-
-        db_recipe = await create_recipe(db, RecipeCreate(**recipe_data))
+        db_recipe = await create_recipe(db, recipe, author_id=current_user.id)
         return convert_to_response(db_recipe)
     except Exception as e:
         raise HTTPException(
@@ -205,24 +407,30 @@ async def update_recipe_endpoint(
 ) -> RecipeResponse:
     """
     Update recipe. Only author or admin can update.
-    """
-    # Only recipe author or admin can update
-    # Get existing recipe
-    existing_recipe = await get_recipe(db, recipe_id)
-    if not existing_recipe:
-        raise HTTPException(status_code=404, detail="Recipe not found")
 
-    is_author = existing_recipe.author_id == current_user.id
-    is_admin = getattr(current_user, "is_admin", False)
-    if not (is_author or is_admin):
+    An update carrying the `version` it was based on fails with 409 if the
+    recipe has changed since; the response tells the current version.
+    """
+    try:
+        updated = await update_recipe(db, recipe_id, recipe_update, editor=current_user)
+    except PermissionError as e:
         raise HTTPException(
             status_code=403,
             detail="You can only update your own recipes",
-        )
+        ) from e
+    except StaleRecipeError as e:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": str(e), "version": e.current_version},
+        ) from e
+    if updated is None:
+        raise HTTPException(status_code=404, detail="Recipe not found")
 
-    recipe = await update_recipe(db, recipe_id, recipe_update)
-    assert recipe is not None
-    return convert_to_response(recipe)
+    recipe = RecipeResponse.model_validate(updated.recipe)
+    await invalidate_recipe_cache(
+        (recipe_id, updated.old_slug), (recipe_id, recipe.slug)
+    )
+    return recipe
 
 
 @router.delete("/{recipe_id}")
@@ -230,44 +438,78 @@ async def delete_recipe_endpoint(
     recipe_id: UUID,
     db: Annotated[AsyncSession, Depends(get_session)],
     current_user: Annotated[User, Depends(get_current_user)],
+    version: Annotated[
+        int | None,
+        Query(ge=1, description="Only delete if this is still the current version"),
+    ] = None,
 ) -> dict[str, str]:
     """
     Delete recipe. Only author or admin can delete.
     """
-    # Get existing recipe
-    existing_recipe = await get_recipe(db, recipe_id)
-    if not existing_recipe:
-        raise HTTPException(status_code=404, detail="Recipe not found")
-
-    is_author = existing_recipe.author_id == current_user.id
-    is_admin = getattr(current_user, "is_admin", False)
-    if not (is_author or is_admin):
+    try:
+        slug = await delete_recipe(db, recipe_id, editor=current_user, version=version)
+    except PermissionError as e:
         raise HTTPException(
             status_code=403,
             detail="You can only delete your own recipes",
-        )
-
-    success = await delete_recipe(db, recipe_id)
-    if not success:
+        ) from e
+    except StaleRecipeError as e:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": str(e), "version": e.current_version},
+        ) from e
+    if slug is None:
         raise HTTPException(status_code=404, detail="Recipe not found")
+    await invalidate_recipe_cache((recipe_id, slug))
 
     return {"message": "Recipe deleted successfully"}
 
 
-@router.get("/stats/summary")
-async def get_recipe_stats(
+@router.post("/bulk", response_model=RecipeBulkResult)
+async def bulk_recipes_endpoint(
+    operation: RecipeBulkOperation,
     db: Annotated[AsyncSession, Depends(get_session)],
     current_user: Annotated[User, Depends(get_current_admin_user)],
-) -> dict[str, int]:
-    """Get recipe statistics (admin only)."""
-    total_recipes = await get_recipe_count(db)
-    public_recipes = await get_recipe_count(db, public_only=True)
+) -> RecipeBulkResult:
+    """
+    Update or delete many recipes in one statement (admin only).
 
-    return {
-        "total_recipes": total_recipes,
-        "public_recipes": public_recipes,
-        "private_recipes": total_recipes - public_recipes,
-    }
+    Recipes are selected by `ids` or by `filter`; caches are invalidated
+    once for the whole batch.
+    """
+    try:
+        if operation.delete:
+            affected = await bulk_delete_recipes(db, operation)
+        else:
+            affected = await bulk_update_recipes(db, operation)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    await invalidate_recipe_cache(*affected)
+    return RecipeBulkResult(affected=len(affected))
+
+
+@router.get("/stats/summary", response_model=RecipeStats)
+async def get_recipe_stats_endpoint(
+    db: Annotated[AsyncSession, Depends(get_read_session)],
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+    weeks: Annotated[int, Query(ge=1, le=104)] = 12,
+) -> RecipeStats:
+    """
+    Get recipe statistics (admin only).
+
+    Counts are broken down by category, cuisine, difficulty, language, author
+    and week of creation. They are cached briefly, so may lag recent writes.
+    """
+    return await get_recipe_stats(db, weeks=weeks)
+
+
+@router.get("/stats/cache")
+async def get_recipe_cache_stats(
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+) -> dict[str, int]:
+    """Get recipe detail cache counters of this worker (admin only)."""
+    return recipe_cache.stats()
 
 
 @router.post("/validate")
@@ -275,16 +517,13 @@ async def validate_recipe_markdown(
     markdown_content: str = Body(..., media_type="text/plain"),
 ) -> dict[str, typing.Any]:
     """Validate markdown recipe content and return errors/warnings."""
-    errors = validate_markdown_recipe(markdown_content)
-
-    # Try to parse to get field info
-    parsed_data = None
-    with contextlib.suppress(Exception):
-        parsed_data = MarkdownRecipeParser.parse_recipe(markdown_content)
+    parsed = parse_markdown_recipe(markdown_content)
+    parsed_data = parsed.recipe
 
     return {
-        "valid": len(errors) == 0,
-        "errors": errors,
+        "valid": not parsed.errors,
+        "errors": [str(error) for error in parsed.errors],
+        "error_fields": [error._asdict() for error in parsed.errors],
         "parsed_fields": {
             "name": parsed_data.name if parsed_data else None,
             "difficulty": parsed_data.difficulty if parsed_data else None,
@@ -297,29 +536,30 @@ async def validate_recipe_markdown(
 
 
 @router.get("/editor/schema")
-async def get_recipe_schema() -> dict[str, typing.Any]:
+async def get_recipe_schema(request: Request) -> Response:
     """Get JSON Schema for recipe frontmatter validation."""
-    return {
+    content = json.dumps({
         "schema": RECIPE_FRONTMATTER_SCHEMA,
         "field_descriptions": get_field_descriptions(),
-    }
+    })
+    return conditional_response(request, content, cache_control=STATIC)
 
 
 @router.get("/editor/autocomplete")
 async def get_autocomplete_data(
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_session)],
-) -> dict[str, list[str]]:
+) -> Response:
     """Get autocomplete data for recipe editor."""
-    cuisines = await get_unique_cuisines(db)
-    categories = await get_unique_categories(db)
-    tags = await get_unique_tags(db)
+    catalog = await get_catalog(db)
 
-    return {
-        "cuisines": cuisines,
-        "categories": categories,
-        "tags": tags,
+    content = json.dumps({
+        "cuisines": catalog.cuisines,
+        "categories": catalog.categories,
+        "tags": catalog.tags,
         "difficulty": typing.cast(list[str], get_enum_values("difficulty")),
-    }
+    })
+    return conditional_response(request, content, cache_control=SHORT_LIVED)
 
 
 @router.post("/upload")
@@ -343,17 +583,13 @@ async def upload_recipe_file(
         content = await file.read()
         content_str = content.decode("utf-8")
 
-        # Validate Markdown
-        validation_errors = validate_markdown_recipe(content_str)
-        if validation_errors:
+        parsed = parse_markdown_recipe(content_str)
+        if parsed.errors or parsed.recipe is None:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid Markdown recipe: {'; '.join(validation_errors)}",
+                detail=f"Invalid Markdown recipe: {parsed.error_message()}",
             )
-
-        # Parse and create recipe
-        recipe_data = MarkdownRecipeParser.parse_recipe(content_str)
-        db_recipe = await create_recipe(db, recipe_data)
+        db_recipe = await create_recipe(db, parsed.recipe, author_id=current_user.id)
 
         return {
             "message": "Recipe uploaded successfully",
@@ -371,11 +607,112 @@ async def upload_recipe_file(
         ) from e
 
 
-@router.get("/{recipe_id}/export/{export_format}")
+# Recipes parsed and inserted per transaction by the bulk import
+IMPORT_CHUNK_SIZE = 100
+
+
+def parse_archive_entries(
+    archive: zipfile.ZipFile, archive_name: str, members: Sequence[zipfile.ZipInfo]
+) -> list[ParsedEntry]:
+    """Read and parse Markdown members of a zip archive (blocking)."""
+    entries: list[ParsedEntry] = []
+    for member in members:
+        name = f"{archive_name}/{member.filename}"
+        if member.file_size > settings.max_file_size:
+            entries.append((name, "File too large"))
+            continue
+        entries.append(parse_import_entry(name, archive.read(member)))
+    return entries
+
+
+async def iter_import_entries(
+    files: Sequence[UploadFile],
+) -> AsyncIterator[list[ParsedEntry]]:
+    """
+    Parse uploaded Markdown files and zip archives, a chunk at a time.
+
+    Reading and parsing run in the threadpool so large imports do not block
+    the event loop; uploads are spooled to disk by the form parser, so only
+    one chunk is held in memory at a time.
+    """
+    pending: list[ParsedEntry] = []
+    for upload in files:
+        filename = upload.filename or "upload"
+        lower_name = filename.lower()
+
+        if lower_name.endswith(".zip"):
+            try:
+                archive = await run_in_threadpool(zipfile.ZipFile, upload.file)
+            except zipfile.BadZipFile:
+                pending.append((filename, "Invalid zip archive"))
+                continue
+            members = [
+                member
+                for member in archive.infolist()
+                if not member.is_dir()
+                and member.filename.lower().endswith(MARKDOWN_SUFFIXES)
+            ]
+            for start in range(0, len(members), IMPORT_CHUNK_SIZE):
+                pending.extend(
+                    await run_in_threadpool(
+                        parse_archive_entries,
+                        archive,
+                        filename,
+                        members[start : start + IMPORT_CHUNK_SIZE],
+                    )
+                )
+                if len(pending) >= IMPORT_CHUNK_SIZE:
+                    yield pending
+                    pending = []
+            continue
+
+        if not lower_name.endswith(MARKDOWN_SUFFIXES):
+            pending.append((filename, "Unsupported file format"))
+        elif upload.size is not None and upload.size > settings.max_file_size:
+            pending.append((filename, "File too large"))
+        else:
+            raw = await upload.read()
+            pending.append(await run_in_threadpool(parse_import_entry, filename, raw))
+        if len(pending) >= IMPORT_CHUNK_SIZE:
+            yield pending
+            pending = []
+
+    if pending:
+        yield pending
+
+
+@router.post("/import")
+async def import_recipe_files(
+    files: Annotated[list[UploadFile], File(...)],
+    db: Annotated[AsyncSession, Depends(get_session)],
+    current_user: Annotated[User, Depends(get_current_admin_user)],
+) -> StreamingResponse:
+    """
+    Import many Markdown recipes, or zip archives of them (admin only).
+
+    Streams one NDJSON line per file as chunks are committed, then a summary
+    line. Each chunk is its own transaction, so a failure part-way keeps the
+    recipes already reported as created.
+    """
+    if not files:
+        raise HTTPException(status_code=400, detail="No file provided")
+
+    async def progress() -> AsyncIterator[str]:
+        summary = {"created": 0, "failed": 0}
+        async for entries in iter_import_entries(files):
+            for result in await import_chunk(db, entries, current_user.id):
+                summary["created" if result["status"] == "created" else "failed"] += 1
+                yield json.dumps(result) + "\n"
+        yield json.dumps({"summary": summary}) + "\n"
+
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
+
+
+@router.get("/{recipe_id}/export/{export_format}", response_model=None)
 async def export_recipe(
     recipe_id: UUID,
     export_format: str,
-    db: Annotated[AsyncSession, Depends(get_session)],
+    db: Annotated[AsyncSession, Depends(get_read_session)],
 ) -> Response | dict[str, typing.Any]:
     """Export recipe in various formats (markdown, json, pdf)."""
     recipe = await get_recipe(db, recipe_id)
@@ -391,28 +728,9 @@ async def export_recipe(
     try:
         if export_format == "markdown":
             # Convert recipe to Markdown
-            recipe_dict = {
-                "name": recipe.name,
-                "description": recipe.description,
-                "servings": recipe.servings,
-                "prep_time": recipe.prep_time,
-                "cook_time": recipe.cook_time,
-                "total_time": (recipe.prep_time or 0) + (recipe.cook_time or 0)
-                if recipe.prep_time or recipe.cook_time
-                else None,
-                "temperature": recipe.temperature,
-                "difficulty": recipe.difficulty,
-                "cuisine": recipe.cuisine,
-                "category": recipe.category,
-                "tags": recipe.tags or [],
-                "notes": recipe.notes or [],
-                "tips": recipe.tips or [],
-                "created_at": recipe.created_at,
-                "updated_at": recipe.updated_at,
-                "content": recipe.content or "",
-                "ingredients_json": recipe.ingredients_json,
-                "instructions_json": recipe.instructions_json,
-            }
+            recipe_dict = markdown_export_data({
+                field: getattr(recipe, field) for field in MARKDOWN_EXPORT_FIELDS
+            })
 
             markdown_content = MarkdownRecipeParser.generate_markdown(recipe_dict)
 
@@ -441,7 +759,7 @@ async def export_recipe(
         return {
             "message": "PDF export not yet implemented",
             "recipe_id": str(recipe_id),
-            "format": format,
+            "format": export_format,
             "note": "PDF export functionality will be added in a future update",
         }
 
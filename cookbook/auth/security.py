@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import hashlib
+import time
 import typing
 
 import jwt
 
 from cookbook.config import settings
+from cookbook.core.cache import LRUCache
+
+# Payloads of tokens that passed verification, by token hash
+_verified_tokens = LRUCache(
+    maxsize=settings.cache.token_maxsize, ttl=settings.cache.token_ttl_seconds
+)
 
 
 def decode_token(
@@ -31,3 +39,30 @@ def decode_token(
         return None
 
     return payload
+
+
+def decode_token_cached(token: str | None) -> dict[str, typing.Any] | None:
+    """
+    decode_token, remembering verified tokens so repeat requests skip the
+    signature check. An entry never outlives the token's own expiry; invalid
+    tokens are not remembered. The returned payload must not be modified.
+    """
+    if not token:
+        return None
+
+    key = hashlib.sha256(token.encode()).hexdigest()
+    payload: dict[str, typing.Any] | None = _verified_tokens.get(key)
+    if payload is not None:
+        return payload
+
+    payload = decode_token(token)
+    if payload is None:
+        return None
+
+    ttl = float(settings.cache.token_ttl_seconds)
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, int | float):
+        ttl = min(ttl, expires_at - time.time())
+    if ttl > 0:
+        _verified_tokens.set(key, payload, ttl=ttl)
+    return payload
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import io
 import logging
+import os
+import tarfile
+import time
+import typing
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import typer
-from cookbook.core.markdown import MarkdownRecipeParser, validate_markdown_recipe
+from cookbook.core.markdown import (
+    MARKDOWN_EXPORT_FIELDS,
+    MARKDOWN_SUFFIXES,
+    MarkdownRecipeParser,
+    ParsedEntry,
+    markdown_export_data,
+    parse_import_entry,
+    validate_markdown_recipe,
+)
+from cookbook.core.slug import slugify
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -217,5 +234,292 @@ Authentic Roman carbonara made with just five ingredients: pasta, eggs, pecorino
     typer.echo(f"\nSample recipes created in {output_dir}")
 
 
+# Files handed to a worker process at a time; amortizes pickling overhead
+_PARSE_CHUNK_SIZE = 32
+
+
+def _parse_files(paths: list[str]) -> list[ParsedEntry]:
+    """Read and parse a chunk of Markdown files (runs in a worker process)."""
+    return [parse_import_entry(path, Path(path).read_bytes()) for path in paths]
+
+
+async def _import_files(
+    paths: list[str], *, jobs: int, batch_size: int, dry_run: bool, upsert: bool
+) -> Counter[str]:
+    """Parse files across a process pool and save them in batches."""
+    # Imported here so that pool workers, which import this module, stay light
+    from cookbook.crud.recipe import import_chunk  # noqa: PLC0415
+    from cookbook.database import AsyncSessionLocal, engine  # noqa: PLC0415
+
+    loop = asyncio.get_running_loop()
+    summary: Counter[str] = Counter()
+    chunks = (
+        paths[start : start + _PARSE_CHUNK_SIZE]
+        for start in range(0, len(paths), _PARSE_CHUNK_SIZE)
+    )
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # Parsing runs ahead in the pool while earlier batches are written,
+        # but only a couple of chunks per worker, so parsed recipes waiting
+        # on a slow database do not pile up in memory
+        parsing: deque[asyncio.Future[list[ParsedEntry]]] = deque()
+
+        def parse_ahead() -> None:
+            while len(parsing) < 2 * jobs and (chunk := next(chunks, None)):
+                parsing.append(loop.run_in_executor(pool, _parse_files, chunk))
+
+        async with AsyncSessionLocal() as db:
+            batch: list[ParsedEntry] = []
+            parse_ahead()
+            while parsing:
+                batch.extend(await parsing.popleft())
+                parse_ahead()
+                if len(batch) < batch_size and parsing:
+                    continue
+
+                if dry_run:
+                    results = [
+                        {"file": name, "status": "error", "error": parsed}
+                        if isinstance(parsed, str)
+                        else {"file": name, "status": "parsed"}
+                        for name, parsed in batch
+                    ]
+                else:
+                    results = await import_chunk(db, batch, None, upsert=upsert)
+                for result in results:
+                    summary[result["status"]] += 1
+                    if result["status"] == "error":
+                        typer.echo(f"❌ {result['file']}: {result['error']}", err=True)
+                batch = []
+        await engine.dispose()
+    return summary
+
+
+@app.command()
+def import_dir(
+    directory: typing.Annotated[
+        str, typer.Argument(help="Directory to import recipes from")
+    ],
+    jobs: typing.Annotated[
+        int, typer.Option("--jobs", "-j", help="Parser processes")
+    ] = os.cpu_count() or 1,
+    batch_size: typing.Annotated[
+        int, typer.Option("--batch-size", help="Recipes written per transaction")
+    ] = 500,
+    *,
+    dry_run: typing.Annotated[
+        bool,
+        typer.Option("--dry-run", help="Parse and validate only, without writing"),
+    ] = False,
+    upsert: typing.Annotated[
+        bool, typer.Option("--upsert", help="Update recipes whose slug already exists")
+    ] = False,
+) -> None:
+    """Import every Markdown recipe below a directory into the database."""
+
+    root = Path(directory)
+    if not root.is_dir():
+        typer.echo(f"Error: Directory '{directory}' does not exist", err=True)
+        raise typer.Exit(1)
+
+    paths = sorted(
+        str(path)
+        for path in root.rglob("*")
+        if path.is_file() and path.suffix.lower() in MARKDOWN_SUFFIXES
+    )
+    if not paths:
+        typer.echo(f"No Markdown files found in {directory}")
+        return
+
+    started = time.perf_counter()
+    summary = asyncio.run(
+        _import_files(
+            paths,
+            jobs=max(jobs, 1),
+            batch_size=max(batch_size, 1),
+            dry_run=dry_run,
+            upsert=upsert,
+        )
+    )
+    elapsed = time.perf_counter() - started
+
+    counts = ", ".join(f"{count} {status}" for status, count in sorted(summary.items()))
+    typer.echo(
+        f"\n{len(paths)} files in {elapsed:.1f}s "
+        f"({len(paths) / elapsed:.1f} files/s): {counts}"
+    )
+    if summary["error"]:
+        raise typer.Exit(1)
+
+
+# An exported file: path relative to the output root, content, mtime
+ExportedFile = tuple[str, bytes, float]
+
+
+def _render_recipes(rows: list[dict[str, typing.Any]]) -> list[ExportedFile]:
+    """Render recipe rows as Markdown files (runs in a worker process)."""
+    files: list[ExportedFile] = []
+    for row in rows:
+        folder = slugify(row["category"]) if row["category"] else "uncategorized"
+        name = str(row["slug"]).replace("/", "-")
+        content = MarkdownRecipeParser.generate_markdown(markdown_export_data(row))
+        mtime = row["updated_at"].timestamp() if row["updated_at"] else time.time()
+        files.append((f"{folder}/{name}.md", content.encode(), mtime))
+    return files
+
+
+class _DirectoryWriter:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def write(self, path: str, content: bytes, mtime: float) -> None:
+        target = self.root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        os.utime(target, (mtime, mtime))
+
+    def close(self) -> None:
+        pass
+
+
+class _TarballWriter:
+    def __init__(self, path: Path) -> None:
+        # "w|gz" writes a stream: nothing is buffered beyond the current member
+        self.tar = tarfile.open(str(path), "w|gz")  # noqa: SIM115
+
+    def write(self, path: str, content: bytes, mtime: float) -> None:
+        info = tarfile.TarInfo(path)
+        info.size = len(content)
+        info.mtime = int(mtime)
+        self.tar.addfile(info, io.BytesIO(content))
+
+    def close(self) -> None:
+        self.tar.close()
+
+
+async def _export_recipes(
+    writer: _DirectoryWriter | _TarballWriter,
+    *,
+    jobs: int,
+    chunk_size: int,
+    public_only: bool,
+) -> int:
+    """Stream recipes through a server-side cursor and render them in a pool."""
+    # Imported here so that pool workers, which import this module, stay light
+    from sqlalchemy import select  # noqa: PLC0415
+
+    from cookbook.database import engine  # noqa: PLC0415
+    from cookbook.models.recipe import Recipe  # noqa: PLC0415
+
+    columns = [getattr(Recipe, field) for field in MARKDOWN_EXPORT_FIELDS]
+    query = select(Recipe.slug, *columns).order_by(Recipe.created_at, Recipe.id)
+    if public_only:
+        query = query.where(Recipe.is_public)
+
+    loop = asyncio.get_running_loop()
+    exported = 0
+    # Rendering is bounded to a few chunks in flight, which keeps memory flat
+    pending: deque[asyncio.Future[list[ExportedFile]]] = deque()
+
+    def write_oldest() -> int:
+        files = pending.popleft().result()
+        for path, content, mtime in files:
+            writer.write(path, content, mtime)
+        return len(files)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        async with engine.connect() as conn:
+            result = await conn.stream(query.execution_options(yield_per=chunk_size))
+            async for partition in result.mappings().partitions():
+                rows = [dict(row) for row in partition]
+                step = -(-len(rows) // jobs)
+                pending.extend(
+                    loop.run_in_executor(pool, _render_recipes, rows[i : i + step])
+                    for i in range(0, len(rows), step)
+                )
+                while len(pending) > 2 * jobs:
+                    await asyncio.wait([pending[0]])
+                    exported += write_oldest()
+
+        while pending:
+            await asyncio.wait([pending[0]])
+            exported += write_oldest()
+    await engine.dispose()
+    return exported
+
+
+@app.command()
+def export_all(
+    output: typing.Annotated[
+        str, typer.Argument(help="Output directory, or a .tar.gz file to create")
+    ],
+    jobs: typing.Annotated[
+        int, typer.Option("--jobs", "-j", help="Renderer processes")
+    ] = os.cpu_count() or 1,
+    chunk_size: typing.Annotated[
+        int,
+        typer.Option("--chunk-size", help="Recipes fetched per database round trip"),
+    ] = 500,
+    *,
+    public_only: typing.Annotated[
+        bool, typer.Option("--public-only", help="Export only public recipes")
+    ] = False,
+) -> None:
+    """Export every recipe as Markdown, in a folder per category."""
+
+    output_path = Path(output)
+    writer: _DirectoryWriter | _TarballWriter
+    if output.endswith((".tar.gz", ".tgz")):
+        writer = _TarballWriter(output_path)
+    else:
+        output_path.mkdir(parents=True, exist_ok=True)
+        writer = _DirectoryWriter(output_path)
+
+    started = time.perf_counter()
+    try:
+        exported = asyncio.run(
+            _export_recipes(
+                writer,
+                jobs=max(jobs, 1),
+                chunk_size=max(chunk_size, 1),
+                public_only=public_only,
+            )
+        )
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - started
+
+    typer.echo(
+        f"✅ Exported {exported} recipes to {output_path} in {elapsed:.1f}s "
+        f"({exported / elapsed:.1f} recipes/s)"
+    )
+
+
+async def _set_admin(email: str, *, is_admin: bool) -> bool:
+    from cookbook.crud.user import set_user_admin  # noqa: PLC0415
+    from cookbook.database import AsyncSessionLocal, engine  # noqa: PLC0415
+
+    async with AsyncSessionLocal() as db:
+        updated = await set_user_admin(db, email, is_admin=is_admin)
+    await engine.dispose()
+    return updated
+
+
+@app.command()
+def set_admin(
+    email: typing.Annotated[str, typer.Argument(help="Email of the user")],
+    *,
+    revoke: typing.Annotated[
+        bool, typer.Option("--revoke", help="Revoke instead of grant")
+    ] = False,
+) -> None:
+    """Grant or revoke admin privileges for a user."""
+
+    if not asyncio.run(_set_admin(email, is_admin=not revoke)):
+        typer.echo(f"Error: No user with email '{email}'", err=True)
+        raise typer.Exit(1)
+    action = "Revoked" if revoke else "Granted"
+    typer.echo(f"✅ {action} admin privileges for {email}")
+
+
 if __name__ == "__main__":
     app()
@@ -14,6 +14,18 @@ class DatabaseSettings(BaseModel):
     password: str = "cookbook"
     name: str = "cookbook"
 
+    # Connection pool, per engine (the primary and each replica)
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout_seconds: float = 30
+    pool_recycle_seconds: int = 1800  # -1 keeps connections forever
+    pool_pre_ping: bool = True
+    # asyncpg prepared statement cache per connection; 0 behind PgBouncer in
+    # transaction pooling mode, where prepared statements do not survive
+    statement_cache_size: int = 100
+    # Full URLs of read replicas; read-only endpoints use them when set
+    replica_urls: list[str] = Field(default_factory=list)
+
     @property
     def url(self) -> str:
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
@@ -23,6 +35,27 @@ class RedisSettings(BaseModel):
     url: str = "redis://localhost:6379/0"
 
 
+class CacheSettings(BaseModel):
+    search_count_ttl_seconds: int = 60
+    # Planner estimates below this are replaced by an exact count
+    estimate_exact_threshold: int = 1000
+    # Catalog values are invalidated by writes; the TTL is only a safety net
+    catalog_ttl_seconds: int = 86400
+    recipe_ttl_seconds: int = 300
+    # Per-process tier; kept short since other workers' invalidations miss it
+    recipe_local_ttl_seconds: int = 30
+    recipe_local_maxsize: int = 1024
+    # Verified access tokens by hash; an entry never outlives the token's exp
+    token_ttl_seconds: int = 300
+    token_maxsize: int = 4096
+    # Users by id; changes made outside this app show up when entries expire
+    user_ttl_seconds: int = 60
+    user_local_ttl_seconds: int = 30
+    user_local_maxsize: int = 1024
+    user_shared: bool = True  # also cache users in Redis
+    stats_ttl_seconds: int = 60
+
+
 class SecuritySettings(BaseModel):
     secret_key: str = Field(default="dev-secret-key")
     algorithm: str = Field(default="HS256")
@@ -39,6 +72,7 @@ class Settings(BaseSettings):
     environment: str = Field(default="development")
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     redis: RedisSettings = Field(default_factory=RedisSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
     security: SecuritySettings = Field(default_factory=SecuritySettings)
     cors_origins: str = Field(
         default="http://localhost,https://localhost,http://localhost:6002"
@@ -60,7 +94,10 @@ class Settings(BaseSettings):
 
     model_config = SettingsConfigDict(
         env_prefix="COOKBOOK_",
+        # Split once only, so multi-word fields of a section are reachable:
+        # COOKBOOK_CACHE_RECIPE_TTL_SECONDS sets cache.recipe_ttl_seconds
         env_nested_delimiter="_",
+        env_nested_max_split=1,
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
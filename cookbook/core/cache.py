@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+import typing
+from collections import OrderedDict
+from collections.abc import Callable
+
+from redis.exceptions import RedisError
+
+from cookbook.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Namespace for every key this app writes, so a shared Redis stays tidy
+KEY_PREFIX = "cookbook:"
+
+# TieredCache.delete() leaves this marker behind for a few seconds, so a fill
+# computed from rows read before the invalidation cannot land after it
+_TOMBSTONE = "\x00deleted"
+TOMBSTONE_TTL_SECONDS = 10
+
+
+def make_key(*parts: str) -> str:
+    """Build a namespaced Redis key."""
+    return KEY_PREFIX + ":".join(parts)
+
+
+def hash_key(*parts: str, payload: typing.Any) -> str:
+    """Build a namespaced key whose last part is a digest of a JSON-able payload."""
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return make_key(*parts, hashlib.sha256(raw.encode()).hexdigest()[:32])
+
+
+async def cache_get_json(key: str) -> typing.Any | None:
+    """Read a JSON value from Redis; cache failures are treated as misses."""
+    try:
+        redis = await get_redis()
+        raw = await redis.get(key)
+    except RedisError:
+        logger.warning("Redis read failed for %s", key, exc_info=True)
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+async def cache_set_json(key: str, value: typing.Any, *, ttl: int) -> None:
+    """Store a JSON value in Redis with a TTL in seconds; failures are logged."""
+    try:
+        redis = await get_redis()
+        await redis.set(key, json.dumps(value, default=str), ex=ttl)
+    except RedisError:
+        logger.warning("Redis write failed for %s", key, exc_info=True)
+
+
+def _catalog_generation_key() -> str:
+    return make_key("catalog", "generation")
+
+
+async def bump_catalog_generation() -> None:
+    """Invalidate every value stored with set_versioned_json; call after writes."""
+    try:
+        redis = await get_redis()
+        await redis.incr(_catalog_generation_key())
+    except RedisError:
+        logger.warning("Redis catalog generation bump failed", exc_info=True)
+
+
+async def get_versioned_json(key: str) -> tuple[int | None, typing.Any | None]:
+    """
+    Read a value stored by set_versioned_json, in one round trip.
+
+    Returns the current catalog generation and the value, which is None when
+    missing or stored under an older generation. The generation is None when
+    Redis is unavailable, in which case nothing should be stored.
+    """
+    try:
+        redis = await get_redis()
+        raw_generation, raw = await redis.mget(_catalog_generation_key(), key)
+    except RedisError:
+        logger.warning("Redis read failed for %s", key, exc_info=True)
+        return None, None
+
+    generation = int(raw_generation or 0)
+    if raw is None:
+        return generation, None
+    entry = json.loads(raw)
+    if entry.get("generation") != generation:
+        return generation, None
+    return generation, entry["data"]
+
+
+async def set_versioned_json(
+    key: str, value: typing.Any, *, generation: int | None, ttl: int
+) -> None:
+    """
+    Store a JSON value tagged with the catalog generation it was computed at.
+
+    Pass the generation returned by get_versioned_json *before* the value was
+    computed, so a write racing with the computation still invalidates it.
+    """
+    if generation is None:
+        return
+    await cache_set_json(key, {"generation": generation, "data": value}, ttl=ttl)
+
+
+class LRUCache:
+    """
+    Bounded in-process LRU whose entries also expire after `ttl` seconds.
+
+    set() takes a shorter per-entry ttl for values with their own expiry.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.evictions = 0
+        self._data: OrderedDict[str, tuple[float, typing.Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> typing.Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: typing.Any, *, ttl: float | None = None) -> None:
+        expires_in = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._data[key] = (time.monotonic() + expires_in, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+
+class TieredCache:
+    """
+    Read-through string cache: a per-process LRU in front of Redis.
+
+    The local tier keeps a short TTL because invalidations only reach the
+    process that made them; other workers catch up when their copy expires.
+    set() is a fill after a miss: it never overwrites a live Redis entry and
+    is dropped while a delete() tombstone stands. Redis failures are logged
+    and treated as misses. With `shared=False` the Redis tier is skipped
+    entirely. Values for which `keep_local` returns False are only kept in
+    Redis, so an invalidation reaches every worker at once.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        namespace: str,
+        *,
+        maxsize: int,
+        local_ttl: float,
+        ttl: int,
+        shared: bool = True,
+        keep_local: Callable[[str], bool] | None = None,
+    ) -> None:
+        self.namespace = namespace
+        self.ttl = ttl
+        self.shared = shared
+        self.keep_local = keep_local
+        self.local = LRUCache(maxsize=maxsize, ttl=local_ttl)
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def _key(self, key: str) -> str:
+        return make_key(self.namespace, key)
+
+    async def get(self, key: str) -> str | None:
+        value = self.local.get(key)
+        if value is not None and value != _TOMBSTONE:
+            self.local_hits += 1
+            return typing.cast(str, value)
+        if not self.shared:
+            self.misses += 1
+            return None
+
+        try:
+            redis = await get_redis()
+            value = await redis.get(self._key(key))
+        except RedisError:
+            logger.warning("Redis read failed for %s", self._key(key), exc_info=True)
+            value = None
+
+        if value is None or value == _TOMBSTONE:
+            self.misses += 1
+            return None
+        self.redis_hits += 1
+        self._set_local(key, value)
+        return typing.cast(str, value)
+
+    def _set_local(self, key: str, value: str) -> None:
+        if self.keep_local is None or self.keep_local(value):
+            self.local.set(key, value)
+
+    async def set(self, key: str, value: str) -> None:
+        if self.local.get(key) == _TOMBSTONE:
+            return
+        if self.shared:
+            try:
+                redis = await get_redis()
+                stored = await redis.set(self._key(key), value, ex=self.ttl, nx=True)
+            except RedisError:
+                logger.warning(
+                    "Redis write failed for %s", self._key(key), exc_info=True
+                )
+            else:
+                if not stored:
+                    return
+        self._set_local(key, value)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        for key in keys:
+            self.local.set(key, _TOMBSTONE, ttl=TOMBSTONE_TTL_SECONDS)
+        if not self.shared:
+            return
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(self._key(key), _TOMBSTONE, ex=TOMBSTONE_TTL_SECONDS)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Redis delete failed in %s", self.namespace, exc_info=True)
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters of this process since startup."""
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "local_size": len(self.local),
+            "local_maxsize": self.local.maxsize,
+            "local_evictions": self.local.evictions,
+        }
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# Cache-Control policies for public read endpoints. Anything that does not set
+# its own policy keeps the no-store default applied by NoCacheMiddleware.
+REVALIDATE = "no-cache"  # may be stored, but must be revalidated on every use
+SHORT_LIVED = "public, max-age=60"
+STATIC = "public, max-age=3600"
+
+
+def make_etag(content: bytes, headers: Mapping[str, str] | None = None) -> str:
+    """Strong ETag over a response body and any headers that vary with it."""
+    digest = hashlib.sha256(content)
+    for name, value in sorted((headers or {}).items()):
+        digest.update(f"\n{name.lower()}:{value}".encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Timestamps are stored as naive UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def format_http_date(value: datetime) -> str:
+    """Format a timestamp for Last-Modified."""
+    return format_datetime(_as_utc(value), usegmt=True)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def revalidates_by_date(request: Request) -> bool:
+    """
+    Whether the request is conditional on If-Modified-Since alone.
+
+    Only then can it be answered from a timestamp; when entity tags are sent,
+    If-None-Match decides and needs the ETag of the full representation.
+    """
+    return (
+        "if-modified-since" in request.headers
+        and "if-none-match" not in request.headers
+    )
+
+
+def is_not_modified(
+    request: Request,
+    *,
+    etag: str | None = None,
+    last_modified: datetime | None = None,
+) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against the current validators.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    the client sent no entity tags (RFC 9110, section 13.2.2).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except ValueError:
+        return False
+    # HTTP dates have whole-second precision
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def not_modified_response(
+    *,
+    cache_control: str,
+    etag: str | None = None,
+    last_modified: datetime | None = None,
+) -> Response:
+    """A 304 carrying the validators and cache policy of the full response."""
+    headers = {"Cache-Control": cache_control}
+    if etag is not None:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = format_http_date(last_modified)
+    return Response(status_code=304, headers=headers)
+
+
+def conditional_response(
+    request: Request,
+    content: bytes | str,
+    *,
+    cache_control: str,
+    last_modified: datetime | None = None,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """
+    Build a JSON response with a content-hash ETag, or a 304 if the client has it.
+
+    Extra `headers` are part of the representation, so they are folded into
+    the ETag as well.
+    """
+    body = content.encode() if isinstance(content, str) else content
+    etag = make_etag(body, headers)
+    if is_not_modified(request, etag=etag, last_modified=last_modified):
+        response = not_modified_response(
+            cache_control=cache_control, etag=etag, last_modified=last_modified
+        )
+        response.headers.update(headers or {})
+        return response
+
+    response = Response(content=body, media_type="application/json", headers=headers)
+    response.headers["Cache-Control"] = cache_control
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_http_date(last_modified)
+    return response
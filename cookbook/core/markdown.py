@@ -2,13 +2,50 @@ from __future__ import annotations
 
 # ruff: noqa: PLR0912, PLR0915, PLR1702
 import re
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 import yaml
+from pydantic import ValidationError
 
 import frontmatter
 from cookbook.schemas.recipe import RecipeCreate
+from cookbook.schemas.recipe_schema import FieldError, validate_frontmatter
+
+# The YAML fence python-frontmatter looks for, so files split exactly as before
+_FENCE = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+
+# libyaml is several times faster than the pure-Python loader, and builds the
+# same values since both share SafeLoader's constructor
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)\s*(minutes?|mins?|hours?|hrs?|h)?")
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)\s*(minutes?|mins?|hours?|hrs?|h)\b")
+_HOUR_UNITS = frozenset({"hours", "hour", "hrs", "hr", "h"})
+
+
+def split_frontmatter(text: str) -> tuple[dict[str, Any], str]:
+    """
+    Split a Markdown recipe into its frontmatter metadata and body.
+
+    Gives the same result as python-frontmatter, without its copies of the
+    document: both fences are found by scanning from an offset, and only the
+    header is handed to YAML. Other frontmatter formats (TOML, JSON) are
+    still left to python-frontmatter.
+    """
+    text = text.strip()
+    opening = _FENCE.match(text)
+    if opening is None:
+        return frontmatter.parse(text)
+    closing = _FENCE.search(text, opening.end())
+    if closing is None:
+        return {}, text
+
+    metadata = yaml.load(text[opening.end() : closing.start()], Loader=_YAML_LOADER)
+    if not isinstance(metadata, dict):
+        metadata = {}
+    return metadata, text[closing.end() :].strip()
 
 
 class MarkdownRecipeParser:
@@ -17,11 +54,13 @@ class MarkdownRecipeParser:
     @staticmethod
     def parse_recipe(markdown_content: str) -> RecipeCreate:
         """Parse a Markdown recipe file into a RecipeCreate object."""
-        # Parse frontmatter and content
-        post = frontmatter.loads(markdown_content)
-        metadata = post.metadata
-        content = post.content
+        return MarkdownRecipeParser.recipe_from_parts(
+            *split_frontmatter(markdown_content)
+        )
 
+    @staticmethod
+    def recipe_from_parts(metadata: dict[str, Any], content: str) -> RecipeCreate:
+        """Build a RecipeCreate from already split frontmatter and content."""
         # Extract basic information
         name = metadata.get("name", "Untitled Recipe")
         description = metadata.get("description")
@@ -95,8 +134,16 @@ class MarkdownRecipeParser:
 
         time_str: str = str(time_val).lower().strip()
 
+        # Compound durations, as written by _format_time: "1 hours 30 minutes"
+        parts = _DURATION_PART.findall(time_str)
+        if len(parts) > 1:
+            return sum(
+                int(float(value) * 60) if unit in _HOUR_UNITS else int(float(value))
+                for value, unit in parts
+            )
+
         # Extract number and unit
-        match = re.match(r"(\d+(?:\.\d+)?)\s*(minutes?|mins?|hours?|hrs?|h)?", time_str)
+        match = _DURATION.match(time_str)
         if not match:
             return None
 
@@ -104,7 +151,7 @@ class MarkdownRecipeParser:
         unit = match.group(2) or "minutes"
 
         # Convert to minutes
-        if unit in {"hours", "hour", "hrs", "hr", "h"}:
+        if unit in _HOUR_UNITS:
             return int(value * 60)
         return int(value)
 
@@ -126,6 +173,7 @@ class MarkdownRecipeParser:
                 recipe_data.get("total_time")
             ),
             "temperature": recipe_data.get("temperature"),
+            "image": recipe_data.get("image_url"),
             "difficulty": recipe_data.get("difficulty"),
             "cuisine": recipe_data.get("cuisine"),
             "category": recipe_data.get("category"),
@@ -251,38 +299,111 @@ class MarkdownRecipeParser:
         return "\n".join(content_parts).strip()
 
 
-def validate_markdown_recipe(markdown_content: str) -> list[str]:
-    """Validate a Markdown recipe and return list of errors."""
-    errors = []
-
+MARKDOWN_SUFFIXES = (".md", ".markdown")
+
+# Recipe columns rendered by generate_markdown
+MARKDOWN_EXPORT_FIELDS = (
+    "name",
+    "description",
+    "servings",
+    "prep_time",
+    "cook_time",
+    "total_time",
+    "temperature",
+    "image_url",
+    "difficulty",
+    "cuisine",
+    "category",
+    "tags",
+    "notes",
+    "tips",
+    "is_public",
+    "is_featured",
+    "language",
+    "created_at",
+    "updated_at",
+    "content",
+    "ingredients_json",
+    "instructions_json",
+)
+
+
+def markdown_export_data(recipe: Mapping[str, Any]) -> dict[str, Any]:
+    """Build generate_markdown input from a recipe's MARKDOWN_EXPORT_FIELDS."""
+    data = {field: recipe[field] for field in MARKDOWN_EXPORT_FIELDS}
+    for field in ("tags", "notes", "tips"):
+        data[field] = data[field] or []
+    data["content"] = data["content"] or ""
+    return data
+
+
+# A file name with its parsed recipe, or why it could not be parsed
+ParsedEntry = tuple[str, RecipeCreate | str]
+
+
+def parse_import_entry(name: str, raw: bytes) -> ParsedEntry:
+    """Parse one Markdown file for import; the error message if it is invalid."""
     try:
-        post = frontmatter.loads(markdown_content)
-        metadata = post.metadata
+        content = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return name, "File is not valid UTF-8"
 
-        # Check required fields
-        if not metadata.get("name"):
-            errors.append("Recipe name is required in frontmatter")
+    parsed = parse_markdown_recipe(content)
+    if parsed.errors:
+        return name, f"Invalid Markdown recipe: {parsed.error_message()}"
+    assert parsed.recipe is not None
+    return name, parsed.recipe
 
-        # Validate time formats - use list.extend to satisfy ruff
-        errors.extend([
-            f"Invalid time format for {tf}"
-            for tf in ["prep_time", "cook_time"]
-            if tf in metadata and not MarkdownRecipeParser.parse_duration(metadata[tf])
-        ])
 
-        # Validate difficulty
-        difficulty = metadata.get("difficulty")
-        if difficulty and difficulty not in {"easy", "medium", "hard"}:
-            errors.append("Difficulty must be 'easy', 'medium', or 'hard'")
+class ParsedRecipe(NamedTuple):
+    """A Markdown recipe as parsed, with everything wrong with it."""
+
+    # None when the file could not be turned into a recipe at all
+    recipe: RecipeCreate | None
+    errors: list[FieldError]
+
+    def error_message(self) -> str:
+        return "; ".join(map(str, self.errors))
+
 
-        # Check content sections
-        content = post.content.lower()
-        if "ingredients" not in content and "instructions" not in content:
-            errors.append("Recipe should contain ingredients and instructions sections")
+def parse_markdown_recipe(markdown_content: str) -> ParsedRecipe:
+    """
+    Parse and validate a Markdown recipe, reading its YAML only once.
 
+    Frontmatter is checked against RECIPE_FRONTMATTER_SCHEMA. The recipe is
+    still built when that fails, so callers can show what was understood;
+    it is only valid to store when there are no errors.
+    """
+    try:
+        metadata, body = split_frontmatter(markdown_content)
     except yaml.YAMLError as e:
-        errors.append(f"Invalid YAML frontmatter: {e}")
+        return ParsedRecipe(None, [FieldError("", f"Invalid YAML frontmatter: {e}")])
     except Exception as e:
-        errors.append(f"Error parsing recipe: {e}")
+        return ParsedRecipe(None, [FieldError("", f"Error parsing recipe: {e}")])
+
+    errors = validate_frontmatter(metadata)
+
+    content = body.lower()
+    if "ingredients" not in content and "instructions" not in content:
+        message = "Recipe should contain ingredients and instructions sections"
+        errors.append(FieldError("", message))
 
-    return errors
+    try:
+        recipe = MarkdownRecipeParser.recipe_from_parts(metadata, body)
+    except ValidationError as e:
+        # Anything the schema already reported would only be repeated here
+        if not errors:
+            errors.extend(
+                FieldError(".".join(map(str, error["loc"])), error["msg"])
+                for error in e.errors()
+            )
+        return ParsedRecipe(None, errors)
+    except Exception as e:
+        errors.append(FieldError("", f"Error parsing recipe: {e}"))
+        return ParsedRecipe(None, errors)
+    return ParsedRecipe(recipe, errors)
+
+
+def validate_markdown_recipe(markdown_content: str) -> list[str]:
+    """Validate a Markdown recipe and return list of errors."""
+    return [str(error) for error in parse_markdown_recipe(markdown_content).errors]
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import typing
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+
+def _encode_value(value: typing.Any) -> typing.Any:
+    """JSON fallback for sort key values that are not JSON-native."""
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"$uuid": str(value)}
+    msg = f"Unsupported cursor value: {value!r}"
+    raise TypeError(msg)
+
+
+def _decode_value(obj: dict[str, typing.Any]) -> typing.Any:
+    if isinstance(obj.get("$dt"), str):
+        return datetime.fromisoformat(obj["$dt"])
+    if isinstance(obj.get("$uuid"), str):
+        return UUID(obj["$uuid"])
+    return obj
+
+
+def _has_type(value: typing.Any, expected: type) -> bool:
+    # NULL sort keys are encoded as they are
+    if value is None:
+        return True
+    # JSON does not tell bools from ints, nor whole floats from ints
+    if isinstance(value, bool):
+        return expected is bool
+    if expected is float:
+        return isinstance(value, int | float)
+    # Integer sort keys are int4 columns, and timestamps are stored as naive UTC
+    if expected is int:
+        return isinstance(value, int) and -(2**31) <= value < 2**31
+    if expected is datetime:
+        return isinstance(value, datetime) and value.tzinfo is None
+    return isinstance(value, expected)
+
+
+def encode_cursor(values: Sequence[typing.Any]) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    raw = json.dumps(list(values), default=_encode_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *, types: Sequence[type]) -> list[typing.Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises ValueError if the cursor is malformed or does not hold one
+    value of the given `types` per sort key, so a tampered cursor never
+    reaches the database.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode())
+        values = json.loads(raw, object_hook=_decode_value)
+    except (binascii.Error, ValueError) as e:
+        msg = "Invalid cursor"
+        raise ValueError(msg) from e
+
+    if not (
+        isinstance(values, list)
+        and len(values) == len(types)
+        and all(_has_type(v, t) for v, t in zip(values, types, strict=True))
+    ):
+        msg = "Invalid cursor"
+        raise ValueError(msg)
+    return values
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+
+# Room left after the base for a "-<n>" de-duplication suffix; recipes.slug
+# is a varchar(200)
+MAX_BASE_LENGTH = 190
+
+# Latin letters that have no decomposition into ASCII
+_SPECIAL = str.maketrans({
+    "ß": "ss",
+    "æ": "ae",
+    "Æ": "ae",
+    "œ": "oe",
+    "Œ": "oe",
+    "ø": "o",
+    "Ø": "o",
+    "ł": "l",
+    "Ł": "l",
+    "đ": "d",
+    "Đ": "d",
+    "ð": "d",
+    "Ð": "d",
+    "þ": "th",
+    "Þ": "th",
+    "\u0131": "i",
+    "&": " and ",
+})
+
+_SEPARATORS = re.compile(r"[^\w]+|_+")
+
+
+def slugify(text: str) -> str:
+    """
+    Turn a recipe name into a URL slug.
+
+    Accented Latin letters are transliterated ("Crème Brûlée" -> "creme-brulee");
+    letters of other scripts are kept as they are, since they have no
+    unambiguous ASCII form and browsers handle them in URLs.
+    """
+    decomposed = unicodedata.normalize("NFKD", text.translate(_SPECIAL))
+    # Drop accents from Latin letters only; other scripts (e.g. Japanese
+    # voicing marks) need theirs
+    kept: list[str] = []
+    for ch in decomposed:
+        if unicodedata.combining(ch) and kept and kept[-1].isascii():
+            continue
+        kept.append(ch)
+    stripped = "".join(kept)
+    # Apostrophes join rather than separate: "Grandma's" -> "grandmas"
+    stripped = stripped.replace("'", "").replace("\u2019", "")
+    slug = _SEPARATORS.sub("-", unicodedata.normalize("NFC", stripped).lower())
+    slug = slug[:MAX_BASE_LENGTH].strip("-")
+    return slug or "recipe"
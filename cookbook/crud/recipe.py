@@ -1,111 +1,660 @@
+import json
 import typing
-from uuid import UUID
-
-from sqlalchemy import and_, desc, func, or_
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    ARRAY,
+    REAL,
+    Integer,
+    Row,
+    RowMapping,
+    Select,
+    SQLColumnExpression,
+    String,
+    all_,
+    and_,
+    any_,
+    case,
+    cast,
+    column,
+    delete,
+    desc,
+    distinct,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    true,
+    tuple_,
+    union_all,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import undefer_group
 from sqlalchemy.sql.elements import ColumnElement
 
-from cookbook.models.recipe import Recipe
-from cookbook.schemas.recipe import RecipeCreate, RecipeSearchParams, RecipeUpdate
+from cookbook.config import settings
+from cookbook.core.cache import (
+    TieredCache,
+    bump_catalog_generation,
+    cache_get_json,
+    cache_set_json,
+    get_versioned_json,
+    hash_key,
+    make_key,
+    set_versioned_json,
+)
+from cookbook.core.markdown import ParsedEntry
+from cookbook.core.pagination import decode_cursor, encode_cursor
+from cookbook.core.slug import slugify
+from cookbook.crud.tag import RecipeTagChange, apply_tag_changes, has_tag
+from cookbook.models.recipe import BODY_GROUP, SEARCH_CONFIG, Recipe
+from cookbook.models.tag import Tag
+from cookbook.models.user import User
+from cookbook.schemas.recipe import (
+    CountStrategy,
+    RecipeBulkOperation,
+    RecipeCreate,
+    RecipeListItem,
+    RecipeListParams,
+    RecipeResponse,
+    RecipeSearchParams,
+    RecipeStats,
+    RecipeUpdate,
+    StatsBucket,
+)
+
+# A recipe list row: RecipeListItem fields, ready to be serialized as is
+ListItem = dict[str, typing.Any]
+
+
+class RecipePage(typing.NamedTuple):
+    """One page of recipes plus the cursor for the next page, if any."""
+
+    recipes: list[ListItem]
+    next_cursor: str | None
+
+
+class _PageWindow(typing.NamedTuple):
+    """Which page to fetch: the one after `cursor`, else past `offset` rows."""
+
+    limit: int
+    cursor: str | None = None
+    offset: int = 0
+
+
+class SearchResult(typing.NamedTuple):
+    """One page of search results with the total match count."""
+
+    recipes: list[ListItem]
+    total: int
+    next_cursor: str | None
+    total_strategy: CountStrategy
+
+
+class SavedRecipe(typing.NamedTuple):
+    """Identity of a recipe written by a bulk create."""
+
+    id: UUID
+    slug: str
+    created: bool
+
+
+class UpdatedRecipe(typing.NamedTuple):
+    """A recipe's columns as written by update_recipe, and its previous slug."""
+
+    recipe: dict[str, typing.Any]
+    old_slug: str
+
+
+class StaleRecipeError(Exception):
+    """A write was based on an older version of the recipe than the stored one."""
+
+    def __init__(self, current_version: int) -> None:
+        super().__init__(f"Recipe has changed; current version is {current_version}")
+        self.current_version = current_version
+
+
+class Catalog(typing.NamedTuple):
+    """Vocabularies of public recipes, as offered to filters and the editor."""
+
+    categories: list[str]
+    cuisines: list[str]
+    tags: list[str]
+    popular_tags: list[str]
+
+
+# List queries select exactly the fields of RecipeListItem, in order and with
+# its defaults applied in SQL, so rows serialize to the same JSON without
+# building ORM instances or models in between
+_LIST_ITEM_DEFAULTS: dict[str, ColumnElement[typing.Any]] = {
+    "tags": func.coalesce(Recipe.tags, literal([], Recipe.tags.type)),
+    "is_featured": func.coalesce(Recipe.is_featured, false()),
+}
+_LIST_ITEM_FIELDS = tuple(RecipeListItem.model_fields)
+_LIST_ITEM_COLUMNS = tuple(
+    _LIST_ITEM_DEFAULTS[field].label(field)
+    if field in _LIST_ITEM_DEFAULTS
+    else getattr(Recipe, field)
+    for field in _LIST_ITEM_FIELDS
+)
 
 
-async def create_recipe(db: AsyncSession, recipe: RecipeCreate) -> Recipe:
+def _list_items(rows: typing.Iterable[Row[typing.Any]]) -> list[ListItem]:
+    """Map rows starting with _LIST_ITEM_COLUMNS to list items."""
+    # Anything after the list columns (sort keys, window totals) is dropped
+    return [dict(zip(_LIST_ITEM_FIELDS, row, strict=False)) for row in rows]
+
+
+# Everything a full recipe view reads, for refreshing written instances
+_DETAIL_ATTRIBUTES = [
+    prop.key for prop in Recipe.__mapper__.column_attrs if prop.key != "search_vector"
+]
+_RECIPE_COLUMNS = tuple(getattr(Recipe, key) for key in _DETAIL_ATTRIBUTES)
+
+# Default sort keys for list pages, all descending and unique thanks to id
+_NEWEST_FIRST: tuple[ColumnElement[typing.Any], ...] = (Recipe.created_at, Recipe.id)
+
+# Upper bounds (minutes) of the total time facet, matching max_total_time values
+TIME_FACET_BOUNDS = (15, 30, 60, 120)
+
+
+def _python_type(key: ColumnElement[typing.Any]) -> type:
+    """The Python type of a sort key's values; object if SQLAlchemy cannot tell."""
+    try:
+        return key.type.python_type
+    except NotImplementedError:
+        return object
+
+
+async def _fetch_rows(
+    db: AsyncSession,
+    query: Select[typing.Any],
+    sort_keys: typing.Sequence[ColumnElement[typing.Any]],
+    window: _PageWindow,
+    *,
+    ascending: bool = False,
+) -> tuple[list[Row[typing.Any]], str | None]:
+    """
+    Fetch the `window` page of `query` ordered by `sort_keys`, all descending
+    or all ascending. Rows with a NULL sort key cannot be paged past with a
+    cursor.
+
+    With a cursor the page starts right after the row it was taken from
+    (keyset pagination, served by the matching composite index); otherwise
+    the legacy OFFSET is applied. One extra row is read to tell whether a
+    next page exists. The sort keys are appended as the last columns of
+    each returned row.
+    """
+    limit, cursor, offset = window
+    if cursor:
+        values = decode_cursor(cursor, types=[_python_type(key) for key in sort_keys])
+        position = tuple_(
+            *(
+                literal(value, key.type)
+                for key, value in zip(sort_keys, values, strict=True)
+            )
+        )
+        keys = tuple_(*sort_keys)
+        query = query.where(keys > position if ascending else keys < position)
+    elif offset:
+        query = query.offset(offset)
+
+    query = (
+        query
+        .add_columns(*sort_keys)
+        .order_by(*(key if ascending else desc(key) for key in sort_keys))
+        .limit(limit + 1)
+    )
+
+    result = await db.execute(query)
+    rows = list(result.all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(tuple(rows[-1])[-len(sort_keys) :])
+
+    return rows, next_cursor
+
+
+async def _fetch_page(
+    db: AsyncSession,
+    query: Select[typing.Any],
+    sort_keys: typing.Sequence[ColumnElement[typing.Any]],
+    window: _PageWindow,
+) -> RecipePage:
+    """Fetch one page of recipes; see _fetch_rows."""
+    rows, next_cursor = await _fetch_rows(db, query, sort_keys, window)
+    return RecipePage(_list_items(rows), next_cursor)
+
+
+# Concurrent writers can claim the slug we picked; try again this many times
+_SLUG_ATTEMPTS = 5
+
+
+async def _free_slugs(
+    db: AsyncSession, bases: typing.Sequence[str], *, exclude_id: UUID | None = None
+) -> list[str]:
+    """
+    Pick a free slug for each base in one query: the base itself, or
+    `base-<n>` past the highest suffix in use. Repeated bases get
+    consecutive suffixes.
+
+    The prefix range scan per base is served by the varchar_pattern_ops
+    index on slug ('.' is the byte after '-').
+    """
+    base_values = values(column("base", String), name="bases").data([
+        (base,) for base in set(bases)
+    ])
+    base_value = base_values.c.base
+    suffix = func.substr(Recipe.slug, func.length(base_value) + 2)
+    usage = select(
+        func.bool_or(Recipe.slug == base_value).label("base_taken"),
+        func.max(
+            case((suffix.regexp_match("^[0-9]{1,9}$"), cast(suffix, Integer)))
+        ).label("max_suffix"),
+    ).where(
+        or_(
+            Recipe.slug == base_value,
+            and_(
+                Recipe.slug.op("~>=~", is_comparison=True)(
+                    (base_value + "-").self_group()
+                ),
+                Recipe.slug.op("~<~", is_comparison=True)(
+                    (base_value + ".").self_group()
+                ),
+            ),
+        )
+    )
+    if exclude_id is not None:
+        usage = usage.where(Recipe.id != exclude_id)
+    usage_lateral = usage.lateral("usage")
+
+    result = await db.execute(
+        select(base_value, usage_lateral.c.base_taken, usage_lateral.c.max_suffix)
+        .select_from(base_values)
+        .join(usage_lateral, true())
+    )
+    base_free: dict[str, bool] = {}
+    next_suffix: dict[str, int] = {}
+    for base, base_taken, max_suffix in result.tuples().all():
+        base_free[base] = not base_taken
+        next_suffix[base] = (max_suffix or 0) + 1
+
+    slugs = []
+    for base in bases:
+        if base_free[base]:
+            slugs.append(base)
+            base_free[base] = False
+        else:
+            slugs.append(f"{base}-{next_suffix[base]}")
+            next_suffix[base] += 1
+    return slugs
+
+
+def _is_slug_conflict(error: IntegrityError) -> bool:
+    return "ix_recipes_slug" in str(error.orig)
+
+
+async def _claim_slug(db: AsyncSession, db_recipe: Recipe, base: str) -> None:
+    """
+    Give a recipe a free slug derived from `base` and flush it.
+
+    Instead of locking, each attempt flushes inside a savepoint and picks
+    again if a concurrent writer took the slug first.
+    """
+    for attempt in range(_SLUG_ATTEMPTS):
+        [slug] = await _free_slugs(db, [base])
+        try:
+            async with db.begin_nested():
+                db_recipe.slug = slug
+                db.add(db_recipe)
+                await db.flush()
+        except IntegrityError as e:
+            if not _is_slug_conflict(e) or attempt == _SLUG_ATTEMPTS - 1:
+                raise
+        else:
+            return
+
+
+def _recipe_values(recipe: RecipeCreate) -> dict[str, typing.Any]:
+    """Column values for a new recipe, slug excepted."""
+    return {
+        "name": recipe.name,
+        "language": recipe.language or "en",
+        "description": recipe.description,
+        "servings": recipe.servings,
+        "prep_time": recipe.prep_time,
+        "cook_time": recipe.cook_time,
+        "temperature": recipe.temperature,
+        "content": recipe.content,
+        "difficulty": recipe.difficulty,
+        "cuisine": recipe.cuisine,
+        "category": recipe.category,
+        "tags": recipe.tags or [],
+        "image_url": recipe.image_url,
+        "notes": recipe.notes or [],
+        "tips": recipe.tips or [],
+        "is_public": recipe.is_public,
+        "is_featured": recipe.is_featured,
+    }
+
+
+async def create_recipe(
+    db: AsyncSession, recipe: RecipeCreate, *, author_id: UUID | None = None
+) -> Recipe:
     """Create a new recipe."""
-    # Generate slug from name
-    slug = recipe.name.lower().replace(" ", "-").replace("'", "")
-
-    # Ensure slug is unique
-    base_slug = slug
-    counter = 1
-    while await get_recipe_by_slug(db, slug):
-        slug = f"{base_slug}-{counter}"
-        counter += 1
-
-    db_recipe = Recipe(
-        name=recipe.name,
-        slug=slug,
-        language=recipe.language or "en",
-        description=recipe.description,
-        servings=recipe.servings,
-        prep_time=recipe.prep_time,
-        cook_time=recipe.cook_time,
-        temperature=recipe.temperature,
-        content=recipe.content,
-        difficulty=recipe.difficulty,
-        cuisine=recipe.cuisine,
-        category=recipe.category,
-        tags=recipe.tags or [],
-        image_url=recipe.image_url,
-        notes=recipe.notes or [],
-        tips=recipe.tips or [],
-        is_public=recipe.is_public,
-        is_featured=recipe.is_featured,
-    )
-
-    db.add(db_recipe)
+    values = {**_recipe_values(recipe), "id": uuid4(), "author_id": author_id}
+    db_recipe = Recipe(**values)
+
+    await _claim_slug(db, db_recipe, slugify(recipe.name))
+    await apply_tag_changes(
+        db,
+        [
+            RecipeTagChange(
+                values["id"], None, None, values["tags"], values["is_public"]
+            )
+        ],
+    )
     await db.commit()
-    await db.refresh(db_recipe)
+    await bump_catalog_generation()
+    await db.refresh(db_recipe, _DETAIL_ATTRIBUTES)
     return db_recipe
 
 
+async def _existing_by_slug(
+    db: AsyncSession, slugs: typing.Collection[str]
+) -> dict[str, tuple[UUID, list[str], bool]]:
+    """Id, tags and visibility of the recipes holding any of the slugs."""
+    result = await db.execute(
+        select(Recipe.slug, Recipe.id, Recipe.tags, Recipe.is_public).where(
+            Recipe.slug.in_(slugs)
+        )
+    )
+    return {slug: (recipe_id, tags, public) for slug, recipe_id, tags, public in result}
+
+
+async def _insert_recipes(
+    db: AsyncSession, rows: list[dict[str, typing.Any]], bases: typing.Sequence[str]
+) -> None:
+    """
+    INSERT new recipe rows, each with a free slug derived from its base.
+
+    Retries like _claim_slug when a concurrent writer takes a slug first.
+    """
+    for attempt in range(_SLUG_ATTEMPTS):
+        slugs = await _free_slugs(db, bases)
+        for row, slug in zip(rows, slugs, strict=True):
+            row["slug"] = slug
+        try:
+            async with db.begin_nested():
+                await db.execute(insert(Recipe), rows)
+        except IntegrityError as e:
+            if not _is_slug_conflict(e) or attempt == _SLUG_ATTEMPTS - 1:
+                raise
+        else:
+            return
+
+
+async def create_recipes(
+    db: AsyncSession,
+    recipes: typing.Sequence[RecipeCreate],
+    *,
+    author_id: UUID | None = None,
+    upsert: bool = False,
+) -> list[SavedRecipe]:
+    """
+    Create many recipes in one transaction, with multi-row INSERTs.
+
+    Slugs for the whole batch are allocated in one query. If a concurrent
+    writer claims one first, the batch picks again, as for a single recipe.
+    With `upsert`, a recipe whose name maps to an existing slug overwrites
+    that recipe instead (keeping its id, slug and author).
+    Returns one SavedRecipe per recipe, in input order.
+    """
+    bases = [slugify(recipe.name) for recipe in recipes]
+    existing = await _existing_by_slug(db, bases) if upsert else {}
+
+    # Keyed by id: the last of several versions of a recipe in a batch wins
+    updates: dict[UUID, dict[str, typing.Any]] = {}
+    update_changes: dict[UUID, RecipeTagChange] = {}
+    rows: list[dict[str, typing.Any]] = []
+    new_bases: list[str] = []
+    tag_changes: list[RecipeTagChange] = []
+    saved: list[SavedRecipe | None] = []
+    for recipe, base in zip(recipes, bases, strict=True):
+        values = _recipe_values(recipe)
+        if base in existing:
+            recipe_id, old_tags, old_public = existing[base]
+            updates[recipe_id] = {**values, "id": recipe_id}
+            update_changes[recipe_id] = RecipeTagChange(
+                recipe_id, old_tags, old_public, values["tags"], values["is_public"]
+            )
+            saved.append(SavedRecipe(recipe_id, base, created=False))
+        else:
+            row = {**values, "id": uuid4(), "author_id": author_id}
+            rows.append(row)
+            new_bases.append(base)
+            tag_changes.append(
+                RecipeTagChange(row["id"], None, None, row["tags"], row["is_public"])
+            )
+            saved.append(None)
+
+    if updates:
+        await db.execute(update(Recipe), list(updates.values()))
+        await db.execute(
+            update(Recipe)
+            .where(Recipe.id.in_(updates))
+            .values(version=Recipe.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        tag_changes.extend(update_changes.values())
+
+    if rows:
+        await _insert_recipes(db, rows, new_bases)
+
+    await apply_tag_changes(db, tag_changes)
+    await db.commit()
+    await bump_catalog_generation()
+    inserted = (SavedRecipe(row["id"], row["slug"], created=True) for row in rows)
+    return [item or next(inserted) for item in saved]
+
+
+# Serialized RecipeResponse by id (prefixed with its updated_at), plus
+# slug -> id aliases. Endpoints that fill this cache or the catalog cache read
+# from the primary: a lagging replica could re-cache what a write just
+# invalidated. Other read-only endpoints use get_read_session.
+recipe_cache = TieredCache(
+    "recipe",
+    maxsize=settings.cache.recipe_local_maxsize,
+    local_ttl=settings.cache.recipe_local_ttl_seconds,
+    ttl=settings.cache.recipe_ttl_seconds,
+)
+
+
+def _recipe_key(recipe_id: UUID | str) -> str:
+    return f"id:{recipe_id}"
+
+
+def _slug_key(slug: str) -> str:
+    return f"slug:{slug}"
+
+
+async def get_cached_recipe(
+    recipe_identifier: str,
+) -> tuple[str, datetime] | None:
+    """Look up a cached recipe JSON document and its updated_at by id or slug."""
+    try:
+        recipe_id: UUID | str = UUID(recipe_identifier)
+    except ValueError:
+        alias = await recipe_cache.get(_slug_key(recipe_identifier))
+        if alias is None:
+            return None
+        recipe_id = alias
+    cached = await recipe_cache.get(_recipe_key(recipe_id))
+    if cached is None:
+        return None
+    # Compact JSON never contains a raw newline, so it is a safe separator
+    updated_at, _, content = cached.partition("\n")
+    return content, datetime.fromisoformat(updated_at)
+
+
+async def cache_recipe(recipe: RecipeResponse) -> str:
+    """Serialize a recipe response and store it with its slug alias."""
+    content = recipe.model_dump_json()
+    await recipe_cache.set(
+        _recipe_key(recipe.id), f"{recipe.updated_at.isoformat()}\n{content}"
+    )
+    await recipe_cache.set(_slug_key(recipe.slug), str(recipe.id))
+    return content
+
+
+async def invalidate_recipe_cache(*recipes: tuple[UUID, str]) -> None:
+    """Drop cached documents and slug aliases, given (id, slug) pairs."""
+    keys = {_recipe_key(recipe_id) for recipe_id, _ in recipes}
+    keys.update(_slug_key(slug) for _, slug in recipes)
+    await recipe_cache.delete(*keys)
+
+
+async def import_chunk(
+    db: AsyncSession,
+    entries: Sequence[ParsedEntry],
+    author_id: UUID | None,
+    *,
+    upsert: bool = False,
+) -> list[dict[str, typing.Any]]:
+    """
+    Save the parsed recipes of a chunk and report on every entry.
+
+    With `upsert`, recipes whose slug already exists are updated in place.
+    """
+    # Parse errors now; the saved recipe or an insert error filled in below
+    outcomes: list[SavedRecipe | str] = [
+        parsed if isinstance(parsed, str) else "" for _, parsed in entries
+    ]
+    valid = [
+        (index, parsed)
+        for index, (_, parsed) in enumerate(entries)
+        if isinstance(parsed, RecipeCreate)
+    ]
+
+    if valid:
+        try:
+            created = await create_recipes(
+                db, [recipe for _, recipe in valid], author_id=author_id, upsert=upsert
+            )
+            for (index, _), row in zip(valid, created, strict=True):
+                outcomes[index] = row
+        except SQLAlchemyError:
+            await db.rollback()
+            # Retry one by one so a single bad recipe does not fail its chunk
+            for index, recipe in valid:
+                try:
+                    [outcomes[index]] = await create_recipes(
+                        db, [recipe], author_id=author_id, upsert=upsert
+                    )
+                except SQLAlchemyError as e:
+                    await db.rollback()
+                    outcomes[index] = (
+                        f"Error creating recipe: {getattr(e, 'orig', None) or e!s}"
+                    )
+
+    await invalidate_recipe_cache(
+        *(
+            (outcome.id, outcome.slug)
+            for outcome in outcomes
+            if isinstance(outcome, SavedRecipe) and not outcome.created
+        )
+    )
+
+    results: list[dict[str, typing.Any]] = []
+    for (name, parsed), outcome in zip(entries, outcomes, strict=True):
+        if isinstance(outcome, str):
+            results.append({"file": name, "status": "error", "error": outcome})
+            continue
+        results.append({
+            "file": name,
+            "status": "created" if outcome.created else "updated",
+            "recipe_id": str(outcome.id),
+            "recipe_name": typing.cast(RecipeCreate, parsed).name,
+            "recipe_slug": outcome.slug,
+        })
+    return results
+
+
 async def get_recipe(db: AsyncSession, recipe_id: UUID) -> Recipe | None:
     """Get a recipe by ID."""
-    result = await db.execute(select(Recipe).where(Recipe.id == recipe_id))
+    result = await db.execute(
+        select(Recipe).options(undefer_group(BODY_GROUP)).where(Recipe.id == recipe_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_recipe_updated_at(
+    db: AsyncSession, recipe_identifier: UUID | str
+) -> datetime | None:
+    """Get when a recipe, by id or slug, last changed, without loading it."""
+    column = Recipe.id if isinstance(recipe_identifier, UUID) else Recipe.slug
+    result = await db.execute(
+        select(Recipe.updated_at).where(column == recipe_identifier)
+    )
     return result.scalar_one_or_none()
 
 
 async def get_recipe_by_slug(db: AsyncSession, slug: str) -> Recipe | None:
     """Get a recipe by slug."""
-    result = await db.execute(select(Recipe).where(Recipe.slug == slug))
+    result = await db.execute(
+        select(Recipe).options(undefer_group(BODY_GROUP)).where(Recipe.slug == slug)
+    )
     return result.scalar_one_or_none()
 
 
 async def get_recipes(
     db: AsyncSession,
+    params: RecipeListParams | None = None,
     *,
-    skip: int = 0,
-    limit: int = 20,
     public_only: bool = False,
-    featured_only: bool = False,
-) -> list[Recipe]:
-    """Get recipes with pagination."""
-    query = select(Recipe)
+) -> RecipePage:
+    """Get recipes with pagination, newest first."""
+    params = params or RecipeListParams()
+    query = select(*_LIST_ITEM_COLUMNS)
 
     if public_only:
         query = query.where(Recipe.is_public)
 
-    if featured_only:
+    if params.featured_only:
         query = query.where(Recipe.is_featured)
 
-    query = query.order_by(desc(Recipe.created_at)).offset(skip).limit(limit)
-
-    result = await db.execute(query)
-    return list(result.scalars().all())
-
+    return await _fetch_page(
+        db, query, _NEWEST_FIRST, _PageWindow(params.limit, params.cursor, params.skip)
+    )
 
-async def search_recipes(
-    db: AsyncSession, search_params: RecipeSearchParams
-) -> tuple[list[Recipe], int]:
-    """Search recipes with filters."""
-    query = select(Recipe)
-    count_query = select(func.count(Recipe.id))
 
+def _search_conditions(search_params: RecipeSearchParams) -> list[ColumnElement[bool]]:
+    """Build the WHERE conditions shared by search queries."""
     # conditions collects SQLAlchemy boolean expressions (ColumnElement[bool])
     conditions: list[ColumnElement[bool]] = []
 
     # Public recipes only for non-authenticated users
     conditions.append(Recipe.is_public)
 
-    # Text search
+    # Text search, backed by the GIN index on search_vector
     if search_params.q:
-        search_text = f"%{search_params.q}%"
-        text_conditions = or_(
-            Recipe.name.ilike(search_text),
-            Recipe.description.ilike(search_text),
-            Recipe.content.ilike(search_text),
+        text_match: ColumnElement[bool] = Recipe.search_vector.bool_op("@@")(
+            _text_query(search_params.q)
         )
-        conditions.append(text_conditions)
+        if search_params.fuzzy:
+            # Typo-tolerant name match, backed by the trigram index on name
+            text_match = or_(text_match, _name_matches(search_params.q))
+        conditions.append(text_match)
 
     # Category filter
     if search_params.category:
@@ -119,10 +668,9 @@ async def search_recipes(
     if search_params.difficulty:
         conditions.append(Recipe.difficulty == search_params.difficulty)
 
-    # Tags filter
+    # Tags filter, resolved through the recipe_tags association
     if search_params.tags:
-        # SQLAlchemy's ARRAY.contains returns ColumnElement[bool]; keep conditions as ColumnElement
-        conditions.extend(Recipe.tags.contains([tag]) for tag in search_params.tags)
+        conditions.extend(has_tag(Recipe.id, tag) for tag in search_params.tags)
 
     # Time filters
     if search_params.max_prep_time:
@@ -132,173 +680,758 @@ async def search_recipes(
         conditions.append(Recipe.cook_time <= search_params.max_cook_time)
 
     if search_params.max_total_time:
-        # Filter by total time (prep + cook)
-        conditions.append(
-            (Recipe.prep_time + Recipe.cook_time) <= search_params.max_total_time
-        )
+        # Stored total_time, backed by ix_recipes_public_total_time_id
+        conditions.append(Recipe.total_time <= search_params.max_total_time)
+
+    # Recipes without a known time have no place in a quickest-first order
+    if search_params.sort == "total_time":
+        conditions.append(Recipe.total_time.is_not(None))
 
     # Featured filter
     if search_params.is_featured is not None:
         conditions.append(Recipe.is_featured == search_params.is_featured)
 
-    # Apply conditions
-    if conditions:
-        query = query.where(and_(*conditions))
-        count_query = count_query.where(and_(*conditions))
+    return conditions
+
+
+def _text_query(q: str) -> ColumnElement[typing.Any]:
+    """Turn free-form user input into a tsquery (quotes, OR and -negation allowed)."""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, q)
+
+
+def _name_matches(q: str) -> ColumnElement[bool]:
+    """Trigram word-similarity match of q against recipe names (name %> q)."""
+    return Recipe.name.bool_op("%>")(q)
+
+
+def _count_cache_key(search_params: RecipeSearchParams) -> str:
+    """Cache key for the total of a search, independent of paging and spelling."""
+    filters = search_params.model_dump(
+        exclude={"limit", "offset", "cursor", "count"}, exclude_none=True
+    )
+    if "q" in filters:
+        filters["q"] = " ".join(filters["q"].lower().split())
+    if "tags" in filters:
+        filters["tags"] = sorted(set(filters["tags"]))
+    return hash_key("search", "count", payload=filters)
+
+
+async def _exact_count(
+    db: AsyncSession, conditions: typing.Sequence[ColumnElement[bool]]
+) -> int:
+    """Count every recipe matching the conditions."""
+    result = await db.execute(select(func.count(Recipe.id)).where(and_(*conditions)))
+    count = result.scalar()
+    return int(count) if count is not None else 0
+
 
-    # Get total count
-    count_result = await db.execute(count_query)
-    total = count_result.scalar()
+async def _estimated_count(
+    db: AsyncSession, conditions: typing.Sequence[ColumnElement[bool]]
+) -> int:
+    """Read the planner's row estimate for the conditions without running them."""
+    query = select(Recipe.id).where(and_(*conditions))
+    compiled = query.compile(dialect=db.get_bind().dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup or ())
+
+    # Executed at driver level so user input in bound values is never
+    # re-parsed as SQL or as SQLAlchemy bind markers
+    connection = await db.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", params
+    )
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _count_matches(
+    db: AsyncSession,
+    search_params: RecipeSearchParams,
+    conditions: typing.Sequence[ColumnElement[bool]],
+) -> tuple[int, CountStrategy]:
+    """Compute a search total with a separate query, per the requested strategy."""
+    if search_params.count == "cached":
+        key = _count_cache_key(search_params)
+        cached = await cache_get_json(key)
+        if cached is not None:
+            return int(cached), "cached"
+        total = await _exact_count(db, conditions)
+        await cache_set_json(key, total, ttl=settings.cache.search_count_ttl_seconds)
+        return total, "exact"
+
+    if search_params.count == "estimate":
+        # Estimates are only worth it (and only reasonably accurate) for large
+        # result sets; small ones are cheap to count exactly
+        estimate = await _estimated_count(db, conditions)
+        if estimate >= settings.cache.estimate_exact_threshold:
+            return estimate, "estimate"
+
+    return await _exact_count(db, conditions), "exact"
 
-    # Apply ordering, offset, and limit
+
+async def search_recipes(
+    db: AsyncSession, search_params: RecipeSearchParams
+) -> SearchResult:
+    """Search recipes with filters."""
+    conditions = _search_conditions(search_params)
+    query = select(*_LIST_ITEM_COLUMNS).where(and_(*conditions))
+
+    # Exact totals ride along with the page as a window aggregate. A cursor
+    # narrows the WHERE clause to the rows after it, so it needs a separate count.
+    windowed = search_params.count == "exact" and not search_params.cursor
+    if windowed:
+        query = query.add_columns(func.count().over())
+
+    # Quickest first; otherwise best text matches first, then featured and newest
+    sort_keys: list[ColumnElement[typing.Any]] = []
+    ascending = search_params.sort == "total_time"
+    if ascending:
+        sort_keys.extend((Recipe.total_time, Recipe.id))
+    elif search_params.q:
+        sort_keys.append(
+            func.ts_rank(Recipe.search_vector, _text_query(search_params.q), type_=REAL)
+        )
+        if search_params.fuzzy:
+            sort_keys.append(
+                func.word_similarity(search_params.q, Recipe.name, type_=REAL)
+            )
+    if not ascending:
+        sort_keys.extend((Recipe.is_featured, *_NEWEST_FIRST))
+
+    rows, next_cursor = await _fetch_rows(
+        db,
+        query,
+        sort_keys,
+        _PageWindow(search_params.limit, search_params.cursor, search_params.offset),
+        ascending=ascending,
+    )
+    recipes = _list_items(rows)
+
+    # An empty page past the end carries no window total; fall back to counting
+    total_strategy: CountStrategy = "exact"
+    if windowed and (rows or not search_params.offset):
+        total = int(rows[0][len(_LIST_ITEM_COLUMNS)]) if rows else 0
+    else:
+        total, total_strategy = await _count_matches(db, search_params, conditions)
+
+    return SearchResult(recipes, total, next_cursor, total_strategy)
+
+
+async def get_search_facets(
+    db: AsyncSession, search_params: RecipeSearchParams
+) -> dict[str, dict[str, int]]:
+    """
+    Count matching recipes per category, cuisine, difficulty, tag and time bucket.
+
+    All facets come from one GROUPING SETS query over the filtered result set;
+    tags are unnested laterally, so recipes are counted distinctly.
+    """
+    matches = (
+        select(
+            Recipe.id,
+            Recipe.category,
+            Recipe.cuisine,
+            Recipe.difficulty,
+            Recipe.tags,
+            case(
+                *((Recipe.total_time <= bound, bound) for bound in TIME_FACET_BOUNDS),
+                else_=None,
+            ).label("time_bucket"),
+        )
+        .where(and_(*_search_conditions(search_params)))
+        .subquery()
+    )
+    tag = func.unnest(matches.c.tags).table_valued("tag").render_derived().lateral()
+
+    dimensions = {
+        "category": matches.c.category,
+        "cuisine": matches.c.cuisine,
+        "difficulty": matches.c.difficulty,
+        "tags": tag.c.tag,
+        "total_time": matches.c.time_bucket,
+    }
     query = (
-        query
-        .order_by(desc(Recipe.is_featured), desc(Recipe.created_at))
-        .offset(search_params.offset)
-        .limit(search_params.limit)
+        select(
+            *(func.grouping(column) for column in dimensions.values()),
+            *dimensions.values(),
+            func.count(distinct(matches.c.id)),
+        )
+        .select_from(matches.outerjoin(tag, true()))
+        .group_by(
+            func.grouping_sets(*(tuple_(column) for column in dimensions.values()))
+        )
     )
 
     result = await db.execute(query)
-    recipes = list(result.scalars().all())
-
-    # total may be None if count query returned no rows; coerce to int if present
-    total_int: int = int(total) if total is not None else 0
-    return recipes, total_int
 
+    facets: dict[str, dict[str, int]] = {name: {} for name in dimensions}
+    size = len(dimensions)
+    for row in result.all():
+        # grouping(col) is 0 for the column the row is grouped by
+        index = list(row[:size]).index(0)
+        value = row[size + index]
+        if value is not None:
+            facets[list(dimensions)[index]][str(value)] = row[-1]
+
+    # Time buckets are counted disjointly; report them cumulatively so each
+    # count matches what the max_total_time filter would return
+    buckets = facets["total_time"]
+    facets["total_time"] = {
+        str(bound): sum(
+            count for value, count in buckets.items() if int(value) <= bound
+        )
+        for bound in TIME_FACET_BOUNDS
+    }
+    return facets
+
+
+async def get_search_suggestions(
+    db: AsyncSession, q: str, *, limit: int = 5
+) -> list[str]:
+    """Get public recipe names and tags similar to a (possibly misspelled) query."""
+    candidates = union_all(
+        select(
+            Recipe.name.label("suggestion"),
+            func.word_similarity(q, Recipe.name).label("score"),
+        ).where(and_(Recipe.is_public, _name_matches(q))),
+        select(
+            Tag.name.label("suggestion"),
+            func.word_similarity(q, Tag.name).label("score"),
+        ).where(and_(Tag.public_count > 0, Tag.name.bool_op("%>")(q))),
+    ).subquery()
+    query = (
+        select(candidates.c.suggestion)
+        .group_by(candidates.c.suggestion)
+        .order_by(desc(func.max(candidates.c.score)))
+        .limit(limit)
+    )
 
-async def update_recipe(
-    db: AsyncSession, recipe_id: UUID, recipe_update: RecipeUpdate
-) -> Recipe | None:
-    """Update a recipe."""
-    db_recipe = await get_recipe(db, recipe_id)
-    if not db_recipe:
-        return None
+    result = await db.execute(query)
+    return list(result.scalars().all())
 
-    update_data = recipe_update.model_dump(exclude_unset=True)
 
-    # Update slug if name changed
-    if "name" in update_data:
-        new_slug = update_data["name"].lower().replace(" ", "-").replace("'", "")
+def _slug_fits(base: str) -> ColumnElement[bool]:
+    """Condition: the recipe's slug is `base` or `base-<n>`."""
+    suffix = func.substr(Recipe.slug, len(base) + 2)
+    return or_(
+        Recipe.slug == base,
+        and_(
+            Recipe.slug.startswith(f"{base}-", autoescape=True),
+            suffix.regexp_match("^[0-9]{1,9}$"),
+        ),
+    )
 
-        # Ensure slug is unique (unless it's the same recipe)
-        base_slug = new_slug
-        counter = 1
-        while True:
-            existing = await get_recipe_by_slug(db, new_slug)
-            if not existing or existing.id == recipe_id:
-                break
-            new_slug = f"{base_slug}-{counter}"
-            counter += 1
 
-        update_data["slug"] = new_slug
+def _write_conditions(
+    recipe_id: UUID, editor: User | None, version: int | None
+) -> list[ColumnElement[bool]]:
+    """WHERE conditions of a guarded single-recipe write."""
+    conditions = [Recipe.id == recipe_id]
+    if editor is not None and not editor.is_admin:
+        conditions.append(Recipe.author_id == editor.id)
+    if version is not None:
+        conditions.append(Recipe.version == version)
+    return conditions
+
+
+async def _check_missed_write(
+    db: AsyncSession, recipe_id: UUID, editor: User | None
+) -> None:
+    """
+    Explain a guarded write that matched no row: return if the recipe does
+    not exist, otherwise raise PermissionError or StaleRecipeError.
+    """
+    result = await db.execute(
+        select(Recipe.author_id, Recipe.version).where(Recipe.id == recipe_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return
+    if editor is not None and not editor.is_admin and row.author_id != editor.id:
+        msg = "Only the author or an admin may change this recipe"
+        raise PermissionError(msg)
+    raise StaleRecipeError(row.version)
+
+
+async def _execute_with_slug(
+    db: AsyncSession, statement: typing.Any, recipe_id: UUID, base: str
+) -> RowMapping | None:
+    """
+    Run a recipe UPDATE that also moves the slug to `base`, unless the
+    current slug already fits it. Retries like _claim_slug when a
+    concurrent writer takes the slug first.
+    """
+    for attempt in range(_SLUG_ATTEMPTS):
+        [candidate] = await _free_slugs(db, [base], exclude_id=recipe_id)
+        slug = case((_slug_fits(base), Recipe.slug), else_=candidate)
+        try:
+            async with db.begin_nested():
+                result = await db.execute(statement.values(slug=slug))
+                return result.mappings().one_or_none()
+        except IntegrityError as e:
+            if not _is_slug_conflict(e) or attempt == _SLUG_ATTEMPTS - 1:
+                raise
+    return None
 
-    for field, value in update_data.items():
-        setattr(db_recipe, field, value)
 
-    await db.commit()
-    await db.refresh(db_recipe)
-    return db_recipe
+async def update_recipe(
+    db: AsyncSession,
+    recipe_id: UUID,
+    recipe_update: RecipeUpdate,
+    *,
+    editor: User | None = None,
+) -> UpdatedRecipe | None:
+    """
+    Update a recipe with a single UPDATE ... RETURNING.
+
+    The write only applies when `editor` is the author or an admin (None
+    skips the check) and, if the update carries a version, when that is
+    still the current one; every write bumps the version. Returns None if
+    there is no such recipe, raises PermissionError or StaleRecipeError if
+    the write was refused.
+    """
+    update_data = recipe_update.model_dump(exclude_unset=True)
+    version = update_data.pop("version", None)
+
+    # The row as it was before the write, locked, for the old slug and tags
+    old = (
+        select(Recipe.id, Recipe.slug, Recipe.tags, Recipe.is_public)
+        .where(Recipe.id == recipe_id)
+        .with_for_update()
+        .subquery("old")
+    )
+    statement = (
+        update(Recipe)
+        .where(Recipe.id == old.c.id, *_write_conditions(recipe_id, editor, version))
+        .values(**update_data, version=Recipe.version + 1)
+        .returning(
+            *_RECIPE_COLUMNS,
+            old.c.slug.label("old_slug"),
+            old.c.tags.label("old_tags"),
+            old.c.is_public.label("old_public"),
+        )
+        .execution_options(synchronize_session=False)
+    )
 
+    # Keep the slug if it already fits the new name
+    if "name" in update_data:
+        row = await _execute_with_slug(
+            db, statement, recipe_id, slugify(update_data["name"])
+        )
+    else:
+        row = (await db.execute(statement)).mappings().one_or_none()
+    if row is None:
+        await _check_missed_write(db, recipe_id, editor)
+        return None
 
-async def delete_recipe(db: AsyncSession, recipe_id: UUID) -> bool:
-    """Delete a recipe."""
-    db_recipe = await get_recipe(db, recipe_id)
-    if not db_recipe:
-        return False
+    if "tags" in update_data or "is_public" in update_data:
+        await apply_tag_changes(
+            db,
+            [
+                RecipeTagChange(
+                    recipe_id,
+                    row["old_tags"],
+                    row["old_public"],
+                    row["tags"],
+                    row["is_public"],
+                )
+            ],
+        )
 
-    await db.delete(db_recipe)
     await db.commit()
-    return True
+    await bump_catalog_generation()
+    recipe = {column.key: row[column.key] for column in _RECIPE_COLUMNS}
+    return UpdatedRecipe(recipe, row["old_slug"])
 
 
-async def get_recipe_count(db: AsyncSession, *, public_only: bool = False) -> int:
-    """Get total number of recipes."""
-    query = select(func.count(Recipe.id))
+async def delete_recipe(
+    db: AsyncSession,
+    recipe_id: UUID,
+    *,
+    editor: User | None = None,
+    version: int | None = None,
+) -> str | None:
+    """
+    Delete a recipe with a single DELETE ... RETURNING.
+
+    Guarded like update_recipe. Returns the slug the recipe had, or None if
+    there is no such recipe.
+    """
+    result = await db.execute(
+        delete(Recipe)
+        .where(*_write_conditions(recipe_id, editor, version))
+        .returning(Recipe.slug, Recipe.tags, Recipe.is_public)
+        .execution_options(synchronize_session=False)
+    )
+    row = result.one_or_none()
+    if row is None:
+        await _check_missed_write(db, recipe_id, editor)
+        return None
 
-    if public_only:
-        query = query.where(Recipe.is_public)
+    await apply_tag_changes(
+        db, [RecipeTagChange(recipe_id, row.tags, row.is_public, None, None)]
+    )
+    await db.commit()
+    await bump_catalog_generation()
+    return str(row.slug)
+
+
+# Fields of RecipeBulkOperation that change recipes, as opposed to selecting them
+_BULK_CHANGES = {"is_public", "is_featured", "category", "add_tags", "remove_tags"}
+
+
+def _bulk_target(operation: RecipeBulkOperation) -> ColumnElement[bool]:
+    """WHERE condition selecting the recipes of a bulk operation."""
+    if (operation.ids is None) == (operation.filter is None):
+        msg = "Select recipes by either ids or filter"
+        raise ValueError(msg)
+    if operation.ids is not None:
+        return Recipe.id == any_(literal(operation.ids, ARRAY(Recipe.id.type)))
+
+    assert operation.filter is not None
+    criteria = operation.filter.model_dump(exclude_none=True)
+    if not criteria:
+        msg = "A bulk filter needs at least one criterion"
+        raise ValueError(msg)
+    tags = criteria.pop("tags", [])
+    conditions = [getattr(Recipe, field) == value for field, value in criteria.items()]
+    conditions.extend(has_tag(Recipe.id, tag) for tag in tags)
+    return and_(*conditions)
+
+
+def _retagged(add: list[str], remove: list[str]) -> ColumnElement[typing.Any]:
+    """New recipes.tags: `remove` taken out, then missing `add` tags appended."""
+    current = func.coalesce(Recipe.tags, literal([], Recipe.tags.type))
+    tags: ColumnElement[typing.Any] = current
+    if remove:
+        tag = func.unnest(current).table_valued("tag").render_derived()
+        tags = func.array(
+            select(tag.c.tag)
+            .where(tag.c.tag != all_(literal(remove, Recipe.tags.type)))
+            .scalar_subquery(),
+            type_=Recipe.tags.type,
+        )
+    if add:
+        new = (
+            func
+            .unnest(literal(add, Recipe.tags.type))
+            .table_valued("tag")
+            .render_derived()
+        )
+        tags = tags.op("||")(
+            func.array(
+                select(new.c.tag).where(new.c.tag != all_(current)).scalar_subquery(),
+                type_=Recipe.tags.type,
+            )
+        )
+    return tags
+
+
+async def bulk_update_recipes(
+    db: AsyncSession, operation: RecipeBulkOperation
+) -> list[tuple[UUID, str]]:
+    """
+    Apply the changes of a bulk operation with one UPDATE ... RETURNING.
+
+    Tag and catalog bookkeeping is batched for all recipes. Returns the
+    (id, slug) of every updated recipe.
+    """
+    target = _bulk_target(operation)
+    changes = {
+        field: value
+        for field, value in operation.model_dump(
+            include={"is_public", "is_featured", "category"}, exclude_unset=True
+        ).items()
+        # null clears the category; flags cannot be cleared
+        if value is not None or field == "category"
+    }
+    add_tags = list(dict.fromkeys(operation.add_tags))
+    remove_tags = list(dict.fromkeys(operation.remove_tags))
+    if set(add_tags) & set(remove_tags):
+        msg = "A tag cannot be both added and removed"
+        raise ValueError(msg)
+    if add_tags or remove_tags:
+        changes["tags"] = _retagged(add_tags, remove_tags)
+    if not changes:
+        msg = "Nothing to change"
+        raise ValueError(msg)
+
+    # The rows as they were, locked, for tag bookkeeping
+    old = (
+        select(Recipe.id, Recipe.tags, Recipe.is_public)
+        .where(target)
+        .with_for_update()
+        .subquery("old")
+    )
+    result = await db.execute(
+        update(Recipe)
+        .where(Recipe.id == old.c.id)
+        .values(**changes, version=Recipe.version + 1)
+        .returning(
+            Recipe.id,
+            Recipe.slug,
+            Recipe.tags,
+            Recipe.is_public,
+            old.c.tags.label("old_tags"),
+            old.c.is_public.label("old_public"),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
+
+    if "tags" in changes or "is_public" in changes:
+        await apply_tag_changes(
+            db,
+            [
+                RecipeTagChange(
+                    row.id, row.old_tags, row.old_public, row.tags, row.is_public
+                )
+                for row in rows
+            ],
+        )
+    await db.commit()
+    await bump_catalog_generation()
+    return [(row.id, row.slug) for row in rows]
+
+
+async def bulk_delete_recipes(
+    db: AsyncSession, operation: RecipeBulkOperation
+) -> list[tuple[UUID, str]]:
+    """
+    Delete the recipes of a bulk operation with one DELETE ... RETURNING.
+
+    Returns the (id, slug) of every deleted recipe.
+    """
+    if operation.model_fields_set & _BULK_CHANGES:
+        msg = "A bulk delete cannot change recipes as well"
+        raise ValueError(msg)
+    result = await db.execute(
+        delete(Recipe)
+        .where(_bulk_target(operation))
+        .returning(Recipe.id, Recipe.slug, Recipe.tags, Recipe.is_public)
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
 
-    result = await db.execute(query)
-    count = result.scalar()
-    return int(count) if count is not None else 0
+    await apply_tag_changes(
+        db,
+        [RecipeTagChange(row.id, row.tags, row.is_public, None, None) for row in rows],
+    )
+    await db.commit()
+    await bump_catalog_generation()
+    return [(row.id, row.slug) for row in rows]
 
 
-async def get_featured_recipes(db: AsyncSession, limit: int = 5) -> list[Recipe]:
+async def get_featured_recipes(db: AsyncSession, limit: int = 5) -> list[ListItem]:
     """Get featured recipes."""
     query = (
-        select(Recipe)
+        select(*_LIST_ITEM_COLUMNS)
         .where(and_(Recipe.is_public, Recipe.is_featured))
         .order_by(desc(Recipe.created_at))
         .limit(limit)
     )
 
     result = await db.execute(query)
-    return typing.cast(list[Recipe], list(result.scalars().all()))
+    return _list_items(result.all())
 
 
 async def get_recent_recipes(
     db: AsyncSession, *, limit: int = 10, public_only: bool = True
-) -> list[Recipe]:
+) -> list[ListItem]:
     """Get recently created recipes."""
-    query = select(Recipe).order_by(desc(Recipe.created_at)).limit(limit)
+    query = select(*_LIST_ITEM_COLUMNS).order_by(desc(Recipe.created_at)).limit(limit)
 
     if public_only:
         query = query.where(Recipe.is_public)
 
     result = await db.execute(query)
-    return typing.cast(list[Recipe], list(result.scalars().all()))
+    return _list_items(result.all())
 
 
-async def get_recipes_by_category(
-    db: AsyncSession, category: str, *, limit: int = 20, public_only: bool = True
-) -> list[Recipe]:
-    """Get recipes by category."""
-    query = (
-        select(Recipe)
-        .where(Recipe.category == category)
-        .order_by(desc(Recipe.created_at))
-        .limit(limit)
+async def stream_recipes(
+    db: AsyncSession,
+    fields: typing.Sequence[str],
+    *,
+    updated_since: datetime | None = None,
+    chunk_size: int = 1000,
+) -> typing.AsyncIterator[typing.Sequence[RowMapping]]:
+    """
+    Stream recipe columns in chunks through a server-side cursor.
+
+    Rows come in (updated_at, id) order so incremental consumers can resume
+    from the last updated_at they saw.
+    """
+    query = select(*(getattr(Recipe, field) for field in fields)).order_by(
+        Recipe.updated_at, Recipe.id
     )
+    if updated_since is not None:
+        if updated_since.tzinfo is not None:
+            # Timestamps are stored as naive UTC
+            updated_since = updated_since.astimezone(UTC).replace(tzinfo=None)
+        query = query.where(Recipe.updated_at > updated_since)
+
+    result = await db.stream(query.execution_options(yield_per=chunk_size))
+    async for partition in result.mappings().partitions():
+        yield partition
+
+
+async def get_recipes_by_category(
+    db: AsyncSession,
+    category: str,
+    *,
+    limit: int = 20,
+    cursor: str | None = None,
+    public_only: bool = True,
+) -> RecipePage:
+    """Get recipes by category, newest first."""
+    query = select(*_LIST_ITEM_COLUMNS).where(Recipe.category == category)
 
     if public_only:
         query = query.where(Recipe.is_public)
 
-    result = await db.execute(query)
-    return typing.cast(list[Recipe], list(result.scalars().all()))
+    return await _fetch_page(db, query, _NEWEST_FIRST, _PageWindow(limit, cursor))
 
 
-async def get_unique_categories(db: AsyncSession) -> list[str]:
-    """Get all unique categories."""
-    query = (
-        select(Recipe.category)
-        .where(and_(Recipe.category.is_not(None), Recipe.is_public))
-        .distinct()
-    )
+async def _load_catalog(db: AsyncSession) -> Catalog:
+    """Fetch every catalog vocabulary in a single round trip."""
 
-    result = await db.execute(query)
-    return [cat for cat in result.scalars().all() if cat]
+    def distinct_values(column: ColumnElement[str]) -> ColumnElement[typing.Any]:
+        # Neither NULL nor the empty string
+        return (
+            select(func.array_agg(aggregate_order_by(distinct(column), column)))
+            .where(Recipe.is_public, func.nullif(column, "").is_not(None))
+            .scalar_subquery()
+        )
 
+    def tag_names(
+        *order_by: SQLColumnExpression[typing.Any],
+    ) -> ColumnElement[typing.Any]:
+        return (
+            select(func.array_agg(aggregate_order_by(Tag.name, *order_by)))
+            .where(Tag.public_count > 0)
+            .scalar_subquery()
+        )
 
-async def get_unique_cuisines(db: AsyncSession) -> list[str]:
-    """Get all unique cuisines."""
-    query = (
-        select(Recipe.cuisine)
-        .where(and_(Recipe.cuisine.is_not(None), Recipe.is_public))
-        .distinct()
+    result = await db.execute(
+        select(
+            distinct_values(Recipe.category),
+            distinct_values(Recipe.cuisine),
+            tag_names(Tag.name),
+            tag_names(desc(Tag.public_count), Tag.name),
+        )
     )
-
+    row = result.one()
+    return Catalog(*(list(values or []) for values in row))
+
+
+async def get_catalog(db: AsyncSession) -> Catalog:
+    """
+    Get the catalog vocabularies, cached until the next recipe write.
+
+    A warm read is one Redis round trip; see bump_catalog_generation.
+    """
+    key = make_key("catalog", "vocabulary")
+    generation, cached = await get_versioned_json(key)
+    if cached is not None:
+        return Catalog(**cached)
+
+    catalog = await _load_catalog(db)
+    await set_versioned_json(
+        key,
+        catalog._asdict(),
+        generation=generation,
+        ttl=settings.cache.catalog_ttl_seconds,
+    )
+    return catalog
+
+
+# Dimensions of the admin statistics; created_per_week is computed separately
+_STATS_DIMENSIONS = ("category", "cuisine", "difficulty", "language", "author_id")
+
+
+async def _load_recipe_stats(db: AsyncSession, *, weeks: int) -> RecipeStats:
+    """
+    Compute every statistic in one aggregate pass over recipes.
+
+    Each dimension is one grouping set, next to the empty set for the
+    totals; public and featured counts are FILTERed aggregates.
+    """
+    since = datetime.now(UTC).replace(tzinfo=None) - timedelta(weeks=weeks)
+    recipes = select(
+        *(getattr(Recipe, name) for name in _STATS_DIMENSIONS),
+        case(
+            (Recipe.created_at >= since, func.date_trunc("week", Recipe.created_at)),
+            else_=None,
+        ).label("week"),
+        Recipe.is_public,
+        Recipe.is_featured,
+    ).subquery()
+
+    dimensions = [recipes.c[name] for name in (*_STATS_DIMENSIONS, "week")]
+    query = select(
+        *(func.grouping(column) for column in dimensions),
+        *dimensions,
+        func.count(),
+        func.count().filter(recipes.c.is_public),
+        func.count().filter(recipes.c.is_featured),
+    ).group_by(func.grouping_sets(tuple_(), *(tuple_(column) for column in dimensions)))
     result = await db.execute(query)
-    return [cuisine for cuisine in result.scalars().all() if cuisine]
 
+    size = len(dimensions)
+    buckets: dict[str, list[StatsBucket]] = {
+        name: [] for name in (*_STATS_DIMENSIONS, "week")
+    }
+    totals = (0, 0, 0)
+    for row in result.all():
+        total, public, featured = row[-3:]
+        grouped = list(row[:size])
+        if 0 not in grouped:
+            totals = (total, public, featured)
+            continue
+        index = grouped.index(0)
+        value = row[size + index]
+        name = dimensions[index].name
+        if name == "week":
+            if value is None:
+                continue  # recipes created before the window
+            value = value.date()
+        buckets[name].append(
+            StatsBucket(
+                value=None if value is None else str(value),
+                total=total,
+                public=public,
+                featured=featured,
+            )
+        )
+
+    def by_size(name: str) -> list[StatsBucket]:
+        return sorted(buckets[name], key=lambda b: (-b.total, b.value or ""))
+
+    total, public, featured = totals
+    return RecipeStats(
+        total_recipes=total,
+        public_recipes=public,
+        private_recipes=total - public,
+        featured_recipes=featured,
+        by_category=by_size("category"),
+        by_cuisine=by_size("cuisine"),
+        by_difficulty=by_size("difficulty"),
+        by_language=by_size("language"),
+        by_author=by_size("author_id"),
+        created_per_week=sorted(buckets["week"], key=lambda b: b.value or ""),
+    )
 
-async def get_unique_tags(db: AsyncSession) -> list[str]:
-    """Get all unique tags."""
-    query = select(Recipe.tags).where(and_(Recipe.tags.is_not(None), Recipe.is_public))
 
-    result = await db.execute(query)
-    all_tags = set()
-    for tag_list in result.scalars().all():
-        if tag_list:
-            all_tags.update(tag_list)
+async def get_recipe_stats(db: AsyncSession, *, weeks: int = 12) -> RecipeStats:
+    """Get catalog statistics, cached for a short while."""
+    key = make_key("stats", "summary", str(weeks))
+    cached = await cache_get_json(key)
+    if cached is not None:
+        return RecipeStats.model_validate(cached)
 
-    return sorted(all_tags)
+    stats = await _load_recipe_stats(db, weeks=weeks)
+    await cache_set_json(
+        key, stats.model_dump(mode="json"), ttl=settings.cache.stats_ttl_seconds
+    )
+    return stats
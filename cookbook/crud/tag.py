@@ -0,0 +1,103 @@
+import typing
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from uuid import UUID
+
+from sqlalchemy import Integer, column, delete, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.sql.elements import ColumnElement
+
+from cookbook.models.tag import Tag, recipe_tags
+
+
+class RecipeTagChange(typing.NamedTuple):
+    """Tags and visibility of one recipe before and after a write."""
+
+    recipe_id: UUID
+    old_tags: Sequence[str] | None
+    old_public: bool | None
+    new_tags: Sequence[str] | None
+    new_public: bool | None
+
+
+def _tag_set(tags: Iterable[str] | None) -> set[str]:
+    return {tag for tag in tags or () if tag}
+
+
+async def _ensure_tags(db: AsyncSession, names: set[str]) -> dict[str, int]:
+    """Create missing dictionary entries and return ids for all names."""
+    if not names:
+        return {}
+
+    await db.execute(
+        insert(Tag)
+        .values([{"name": name} for name in sorted(names)])
+        .on_conflict_do_nothing(index_elements=[Tag.name])
+    )
+    result = await db.execute(select(Tag.name, Tag.id).where(Tag.name.in_(names)))
+    return dict(result.tuples().all())
+
+
+async def apply_tag_changes(
+    db: AsyncSession, changes: Sequence[RecipeTagChange]
+) -> None:
+    """
+    Keep recipe_tags links and per-tag public counts in sync with recipe writes.
+
+    Runs in the caller's transaction; a deleted recipe is a change to no tags.
+    Work is batched across all changes, so bulk writes cost the same number of
+    statements as a single one.
+    """
+    names: set[str] = set()
+    for change in changes:
+        names |= _tag_set(change.old_tags) | _tag_set(change.new_tags)
+    tag_ids = await _ensure_tags(db, names)
+
+    unlink: list[tuple[int, UUID]] = []
+    link: list[dict[str, typing.Any]] = []
+    deltas: Counter[int] = Counter()
+    for change in changes:
+        old = _tag_set(change.old_tags)
+        new = _tag_set(change.new_tags)
+        unlink.extend((tag_ids[name], change.recipe_id) for name in old - new)
+        link.extend(
+            {"tag_id": tag_ids[name], "recipe_id": change.recipe_id}
+            for name in new - old
+        )
+
+        # Only public recipes count towards tag usage
+        old_counted = old if change.old_public else set()
+        new_counted = new if change.new_public else set()
+        deltas.update(tag_ids[name] for name in new_counted - old_counted)
+        deltas.subtract(tag_ids[name] for name in old_counted - new_counted)
+
+    if unlink:
+        await db.execute(
+            delete(recipe_tags).where(
+                tuple_(recipe_tags.c.tag_id, recipe_tags.c.recipe_id).in_(unlink)
+            )
+        )
+    if link:
+        await db.execute(insert(recipe_tags).values(link).on_conflict_do_nothing())
+
+    changed = [(tag_id, delta) for tag_id, delta in deltas.items() if delta]
+    if changed:
+        delta_table = values(
+            column("id", Integer), column("delta", Integer), name="delta"
+        ).data(changed)
+        await db.execute(
+            update(Tag)
+            .where(Tag.id == delta_table.c.id)
+            .values(public_count=Tag.public_count + delta_table.c.delta)
+        )
+
+
+def has_tag(recipe_id: ColumnElement[typing.Any], name: str) -> ColumnElement[bool]:
+    """Condition: the recipe identified by `recipe_id` is linked to tag `name`."""
+    return recipe_id.in_(
+        select(recipe_tags.c.recipe_id)
+        .join(Tag, Tag.id == recipe_tags.c.tag_id)
+        .where(Tag.name == name)
+    )
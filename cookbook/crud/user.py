@@ -0,0 +1,79 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from cookbook.config import settings
+from cookbook.core.cache import TieredCache
+from cookbook.models.user import User
+
+
+class _CachedUser(BaseModel):
+    id: UUID
+    email: str
+    username: str | None
+    full_name: str | None
+    is_admin: bool
+    created_at: datetime
+    updated_at: datetime | None
+
+
+def _not_admin(raw: str) -> bool:
+    # Compact model_dump_json output; admins stay out of the per-process
+    # tier so a revoked admin loses access on every worker immediately
+    return '"is_admin":false' in raw
+
+
+# Serialized users by id, looked up on every authenticated request
+user_cache = TieredCache(
+    "user",
+    maxsize=settings.cache.user_local_maxsize,
+    local_ttl=settings.cache.user_local_ttl_seconds,
+    ttl=settings.cache.user_ttl_seconds,
+    shared=settings.cache.user_shared,
+    keep_local=_not_admin,
+)
+
+
+async def get_user(db: AsyncSession, user_id: UUID) -> User | None:
+    """
+    Get a user by ID, through the user cache.
+
+    Cached users come back as detached instances; they carry every column
+    but are not part of the session.
+    """
+    cached = await user_cache.get(str(user_id))
+    if cached is not None:
+        return User(**_CachedUser.model_validate_json(cached).model_dump())
+
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
+    if user is not None:
+        data = _CachedUser.model_validate(user, from_attributes=True)
+        await user_cache.set(str(user_id), data.model_dump_json())
+    return user
+
+
+async def invalidate_user(user_id: UUID) -> None:
+    """Drop a cached user; call after changing the row."""
+    await user_cache.delete(str(user_id))
+
+
+async def set_user_admin(db: AsyncSession, email: str, *, is_admin: bool) -> bool:
+    """Grant or revoke admin privileges; False if there is no such user."""
+    result = await db.execute(
+        update(User)
+        .where(User.email == email)
+        # The column is naive UTC; the model's onupdate default is aware
+        .values(is_admin=is_admin, updated_at=datetime.now(UTC).replace(tzinfo=None))
+        .returning(User.id)
+    )
+    user_id = result.scalar_one_or_none()
+    await db.commit()
+    if user_id is None:
+        return False
+    await invalidate_user(user_id)
+    return True
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import itertools
+import typing
 from collections.abc import AsyncGenerator
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base
 
 from cookbook.config import settings
 
 
-def get_database_url() -> str:
+def get_database_url(db_url: str | None = None) -> str:
     """
     Get database URL with optional schema prefix for integrated mode.
 
     In integrated mode, appends PostgreSQL search_path to use cookbook schema.
-    In development mode, uses database URL as-is.
+    In development mode, uses database URL as-is. Defaults to the primary.
     """
-    db_url = settings.database_url
+    if db_url is None:
+        db_url = settings.database_url
 
     # In integrated mode, add schema prefix if not already present
     if settings.is_integrated and "search_path" not in db_url:
@@ -25,11 +34,50 @@ def get_database_url() -> str:
     return db_url
 
 
-engine = create_async_engine(get_database_url(), echo=False)
+def _connect_args() -> dict[str, typing.Any]:
+    cache_size = settings.database.statement_cache_size
+    connect_args: dict[str, typing.Any] = {
+        # asyncpg's own cache, and SQLAlchemy's cache of asyncpg statements
+        "statement_cache_size": cache_size,
+        "prepared_statement_cache_size": cache_size,
+    }
+    if cache_size == 0:
+        # PgBouncer may hand the next statement to another server connection,
+        # so unnamed statements must not collide there either
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+    return connect_args
+
+
+def create_engine(db_url: str) -> AsyncEngine:
+    """Create an engine with the configured pool and statement cache settings."""
+    database = settings.database
+    return create_async_engine(
+        get_database_url(db_url),
+        echo=False,
+        pool_size=database.pool_size,
+        max_overflow=database.max_overflow,
+        pool_timeout=database.pool_timeout_seconds,
+        pool_recycle=database.pool_recycle_seconds,
+        pool_pre_ping=database.pool_pre_ping,
+        connect_args=_connect_args(),
+    )
+
+
+engine = create_engine(settings.database_url)
 AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# Read replicas, used in turn; without any, reads go to the primary
+replica_engines = [create_engine(url) for url in settings.database.replica_urls]
+_read_sessions = itertools.cycle(
+    [
+        async_sessionmaker(replica, class_=AsyncSession, expire_on_commit=False)
+        for replica in replica_engines
+    ]
+    or [AsyncSessionLocal]
+)
+
 Base = declarative_base()
 
 
@@ -37,3 +85,14 @@ async def get_session() -> AsyncGenerator[AsyncSession]:
     """Provide a database session as an async generator for FastAPI dependencies."""
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession]:
+    """
+    Provide a session for read-only endpoints, on the next read replica.
+
+    Replicas may lag behind the primary, so anything that writes, or must
+    see its own writes, uses get_session instead.
+    """
+    async with next(_read_sessions)() as session:
+        yield session
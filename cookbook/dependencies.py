@@ -1,11 +1,12 @@
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cookbook.auth.security import decode_token
+from cookbook.auth.security import decode_token_cached
 from cookbook.config import settings
+from cookbook.crud.user import get_user
 from cookbook.database import get_session
 from cookbook.models.user import User
 
@@ -16,7 +17,8 @@ async def get_current_user_optional(
 ) -> User | None:
     """
     Get current user from JWT token (cookie or header), or None if not authenticated.
-    Uses shared secret validation.
+    Uses shared secret validation; verified tokens and users are cached, so a
+    repeat request needs neither a signature check nor a query.
     """
     token = request.cookies.get(settings.security.cookie_name)
     if not token:
@@ -27,7 +29,7 @@ async def get_current_user_optional(
     if not token:
         return None
 
-    payload = decode_token(token)
+    payload = decode_token_cached(token)
     if not payload:
         return None
 
@@ -35,9 +37,11 @@ async def get_current_user_optional(
     if not user_id:
         return None
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user: User | None = result.scalar_one_or_none()
-    return user
+    try:
+        user_uuid = UUID(str(user_id))
+    except ValueError:
+        return None
+    return await get_user(db, user_uuid)
 
 
 def get_current_user(
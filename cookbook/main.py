@@ -40,6 +40,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[recipes.NEXT_CURSOR_HEADER, "ETag", "Last-Modified"],
 )
 
 
@@ -51,7 +52,11 @@ class NoCacheMiddleware(BaseHTTPMiddleware):
         call_next: typing.Callable[[Request], typing.Awaitable[Response]],
     ) -> Response:
         response = await call_next(request)
-        if request.url.path.startswith("/api/"):
+        # Routes with their own cache policy (see cookbook.core.http) keep it
+        if (
+            request.url.path.startswith("/api/")
+            and "Cache-Control" not in response.headers
+        ):
             response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
             response.headers["Pragma"] = "no-cache"
             response.headers["Expires"] = "0"
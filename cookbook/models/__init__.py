@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from cookbook.models.recipe import Recipe
+from cookbook.models.tag import Tag, recipe_tags
 from cookbook.models.user import User
 
-__all__ = ["Recipe", "User"]
+__all__ = ["Recipe", "Tag", "User", "recipe_tags"]
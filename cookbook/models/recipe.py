@@ -4,28 +4,53 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import (
-    ARRAY,
     Boolean,
     Column,
+    Computed,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
 )
-from sqlalchemy.dialects.postgresql import JSON, UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, TSVECTOR, UUID
+from sqlalchemy.orm import Mapped, deferred, mapped_column
 
 from cookbook.database import Base
 
+# Text search configuration used for both the stored vector and incoming queries
+SEARCH_CONFIG = "english"
+
+# Deferred group of the large content columns; only the full recipe view needs
+# them, so queries opt in with undefer_group(BODY_GROUP)
+BODY_GROUP = "body"
+
 
 class Recipe(Base):
     __tablename__ = "recipes"
+    __table_args__ = (
+        Index("ix_recipes_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_recipes_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        # Prefix (LIKE 'base-%') lookups for slug allocation
+        Index(
+            "ix_recipes_slug_pattern",
+            "slug",
+            postgresql_ops={"slug": "varchar_pattern_ops"},
+        ),
+    )
 
     # Primary identification
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(200), nullable=False, index=True)
-    slug = Column(String(200), unique=True, nullable=False, index=True)
+    slug: Mapped[str] = mapped_column(
+        String(200), unique=True, nullable=False, index=True
+    )
     language = Column(String(20), default="en")
 
     # Basic recipe info
@@ -35,16 +60,25 @@ class Recipe(Base):
     # Timing
     prep_time = Column(Integer)  # minutes
     cook_time = Column(Integer)  # minutes
-    total_time = Column(Integer)  # computed or manual override
+    # Either time alone counts as the total; NULL only when both are unknown
+    total_time = Column(
+        Integer,
+        Computed(
+            "CASE WHEN prep_time IS NOT NULL OR cook_time IS NOT NULL "
+            "THEN coalesce(prep_time, 0) + coalesce(cook_time, 0) END",
+            persisted=True,
+        ),
+    )
     temperature = Column(Integer, default=0)
 
     # Content (will be stored as Markdown after migration)
-    content = Column(Text)  # Full Markdown content
-    ingredients_json = Column(JSON)  # Legacy JSON format during transition
-    instructions_json = Column(JSON)  # Legacy JSON format during transition
+    content = deferred(Column(Text), group=BODY_GROUP)  # Full Markdown content
+    # Legacy JSON format during transition
+    ingredients_json = deferred(Column(JSON), group=BODY_GROUP)
+    instructions_json = deferred(Column(JSON), group=BODY_GROUP)
 
     # Additional content
-    changelog = Column(JSON)
+    changelog = deferred(Column(JSON), group=BODY_GROUP)
     notes: Mapped[list[str] | None] = mapped_column(ARRAY(Text))
     tips: Mapped[list[str] | None] = mapped_column(ARRAY(Text))
 
@@ -71,6 +105,23 @@ class Recipe(Base):
         index=True,
     )
 
+    # Full-text search document, weighted name > description > content.
+    # Only used inside queries, so never loaded onto instances.
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B') || "
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(content, '')), 'C')",
+                persisted=True,
+            ),
+        )
+    )
+
+    # Bumped by every write; edits based on an older version are rejected
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -80,3 +131,51 @@ class Recipe(Base):
 
     def __repr__(self) -> str:
         return f"<Recipe(id={self.id}, name='{self.name}')>"
+
+
+# Keyset pagination indexes; column order and direction must match the
+# sort keys used by cookbook.crud.recipe for public listings.
+Index(
+    "ix_recipes_public_created_id",
+    Recipe.created_at.desc(),
+    Recipe.id.desc(),
+    postgresql_where=Recipe.is_public,
+)
+# Quickest-first search order and max_total_time range scans
+Index(
+    "ix_recipes_public_total_time_id",
+    Recipe.total_time,
+    Recipe.id,
+    postgresql_where=Recipe.is_public,
+)
+Index(
+    "ix_recipes_public_featured_created_id",
+    Recipe.is_featured.desc(),
+    Recipe.created_at.desc(),
+    Recipe.id.desc(),
+    postgresql_where=Recipe.is_public,
+)
+Index(
+    "ix_recipes_public_category_created_id",
+    Recipe.category,
+    Recipe.created_at.desc(),
+    Recipe.id.desc(),
+    postgresql_where=Recipe.is_public,
+)
+Index(
+    "ix_recipes_public_cuisine_created_id",
+    Recipe.cuisine,
+    Recipe.created_at.desc(),
+    Recipe.id.desc(),
+    postgresql_where=Recipe.is_public,
+)
+Index(
+    "ix_recipes_public_difficulty_created_id",
+    Recipe.difficulty,
+    Recipe.created_at.desc(),
+    Recipe.id.desc(),
+    postgresql_where=Recipe.is_public,
+)
+
+# Incremental exports (updated_since) stream in this order
+Index("ix_recipes_updated_id", Recipe.updated_at, Recipe.id)
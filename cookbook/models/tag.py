@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Table
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from cookbook.database import Base
+
+# Association between recipes and their tags. Recipe.tags stays the source of
+# the tag list shown to clients; this table makes tag lookups index-backed.
+recipe_tags = Table(
+    "recipe_tags",
+    Base.metadata,
+    Column(
+        "tag_id",
+        Integer,
+        ForeignKey("tags.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "recipe_id",
+        UUID(as_uuid=True),
+        ForeignKey("recipes.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Index("ix_recipe_tags_recipe_id", "recipe_id"),
+)
+
+
+class Tag(Base):
+    """Tag dictionary with the number of public recipes using each tag."""
+
+    __tablename__ = "tags"
+    __table_args__ = (
+        Index(
+            "ix_tags_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    # Maintained by cookbook.crud.tag on every recipe write
+    public_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    def __repr__(self) -> str:
+        return f"<Tag(name='{self.name}', public_count={self.public_count})>"
+
+
+# Serves popular-tag listings ordered by usage, then name
+Index(
+    "ix_tags_popular",
+    Tag.public_count.desc(),
+    Tag.name,
+    postgresql_where=Tag.public_count > 0,
+)
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field, computed_field
 
+# How the total of a search response was produced: "exact" counts every match,
+# "cached" reuses a recent exact count, "estimate" comes from the query planner
+CountStrategy = Literal["exact", "cached", "estimate"]
+
+# Order of search results: best match first, or quickest to make first
+SearchSort = Literal["relevance", "total_time"]
+
 
 class RecipeBase(BaseModel):
     """Base recipe fields."""
@@ -64,6 +72,9 @@ class RecipeUpdate(BaseModel):
     tips: list[str] | None = None
     is_public: bool | None = None
     is_featured: bool | None = None
+    version: int | None = Field(
+        None, ge=1, description="Version the edit is based on; stale edits fail"
+    )
 
 
 class RecipeResponse(RecipeBase):
@@ -72,16 +83,14 @@ class RecipeResponse(RecipeBase):
     id: UUID
     slug: str
     language: str
+    version: int = Field(1, description="Send back with edits to detect conflicts")
     created_at: datetime
     updated_at: datetime
     published_at: datetime | None = None
 
-    @computed_field
-    def total_time(self) -> int | None:
-        """Compute total time from prep and cook times."""
-        if self.prep_time is not None and self.cook_time is not None:
-            return self.prep_time + self.cook_time
-        return None
+    total_time: int | None = Field(
+        None, description="Prep plus cook time in minutes, if either is known"
+    )
 
     model_config = {"from_attributes": True}
 
@@ -107,10 +116,22 @@ class RecipeListItem(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class RecipeListParams(BaseModel):
+    """Schema for recipe list parameters."""
+
+    skip: int = Field(default=0, ge=0, description="Offset for pagination")
+    limit: int = Field(default=20, ge=1, le=100, description="Number of results")
+    cursor: str | None = Field(
+        default=None, description="Cursor from a previous page's X-Next-Cursor"
+    )
+    featured_only: bool = Field(default=False, description="Show only featured recipes")
+
+
 class RecipeSearchParams(BaseModel):
     """Schema for recipe search parameters."""
 
     q: str | None = Field(None, description="Search query")
+    fuzzy: bool = Field(default=False, description="Also match misspelled recipe names")
     category: str | None = Field(None, description="Filter by category")
     cuisine: str | None = Field(None, description="Filter by cuisine")
     difficulty: str | None = Field(None, description="Filter by difficulty")
@@ -118,9 +139,43 @@ class RecipeSearchParams(BaseModel):
     max_prep_time: int | None = Field(None, ge=0, description="Maximum prep time")
     max_cook_time: int | None = Field(None, ge=0, description="Maximum cook time")
     max_total_time: int | None = Field(None, ge=0, description="Maximum total time")
+    sort: SearchSort = Field(
+        "relevance",
+        description="relevance, or total_time for quickest first; sorting by "
+        "time leaves out recipes without a known time",
+    )
     is_featured: bool | None = Field(None, description="Filter featured recipes")
     limit: int = Field(20, ge=1, le=100, description="Number of results")
     offset: int = Field(0, ge=0, description="Offset for pagination")
+    cursor: str | None = Field(
+        None, description="Cursor from a previous page; takes precedence over offset"
+    )
+    count: CountStrategy = Field(
+        "exact", description="How to compute the total: exact, cached or estimate"
+    )
+    facets: bool = Field(
+        default=False, description="Include per-filter counts for the result set"
+    )
+
+
+class FacetCount(BaseModel):
+    """Number of matching recipes for one filter value."""
+
+    value: str
+    count: int
+
+
+class RecipeFacets(BaseModel):
+    """Filter values available within a search result set, with counts."""
+
+    category: list[FacetCount] = Field(default_factory=list)
+    cuisine: list[FacetCount] = Field(default_factory=list)
+    difficulty: list[FacetCount] = Field(default_factory=list)
+    tags: list[FacetCount] = Field(default_factory=list)
+    total_time: list[FacetCount] = Field(
+        default_factory=list,
+        description="Recipes at or under each max_total_time value (minutes)",
+    )
 
 
 class RecipeSearchResponse(BaseModel):
@@ -128,10 +183,84 @@ class RecipeSearchResponse(BaseModel):
 
     recipes: list[RecipeListItem]
     total: int
+    total_strategy: CountStrategy = Field(
+        "exact", description="How total was computed; only 'exact' is precise"
+    )
     limit: int
     offset: int
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, or null on the last page"
+    )
+    did_you_mean: list[str] = Field(
+        default_factory=list, description="Similar recipe names for the query"
+    )
+    facets: RecipeFacets | None = Field(
+        None, description="Facet counts, when requested with facets=true"
+    )
 
     @computed_field
     def has_more(self) -> bool:
         """Check if there are more results."""
-        return self.offset + self.limit < self.total
+        return self.next_cursor is not None
+
+
+class RecipeBulkFilter(BaseModel):
+    """Recipes selected by a bulk operation; all given criteria must match."""
+
+    category: str | None = None
+    cuisine: str | None = None
+    difficulty: str | None = None
+    tags: list[str] | None = Field(None, description="Recipes having all these tags")
+    is_public: bool | None = None
+    is_featured: bool | None = None
+
+
+class RecipeBulkOperation(BaseModel):
+    """
+    Admin bulk operation: select recipes by `ids` or by `filter`, then either
+    delete them or apply every change given.
+    """
+
+    ids: list[UUID] | None = Field(None, max_length=10000)
+    filter: RecipeBulkFilter | None = None
+    delete: bool = Field(default=False, description="Delete the selected recipes")
+    is_public: bool | None = None
+    is_featured: bool | None = None
+    category: str | None = Field(None, max_length=50)
+    add_tags: list[str] = Field(default_factory=list)
+    remove_tags: list[str] = Field(default_factory=list)
+
+
+class RecipeBulkResult(BaseModel):
+    """Outcome of a bulk operation."""
+
+    affected: int = Field(..., description="Recipes updated or deleted")
+
+
+class StatsBucket(BaseModel):
+    """Recipe counts for one value of a statistics dimension."""
+
+    value: str | None
+    total: int
+    public: int
+    featured: int
+
+
+class RecipeStats(BaseModel):
+    """Catalog statistics for the admin dashboard."""
+
+    total_recipes: int
+    public_recipes: int
+    private_recipes: int
+    featured_recipes: int
+    by_category: list[StatsBucket] = Field(default_factory=list)
+    by_cuisine: list[StatsBucket] = Field(default_factory=list)
+    by_difficulty: list[StatsBucket] = Field(default_factory=list)
+    by_language: list[StatsBucket] = Field(default_factory=list)
+    by_author: list[StatsBucket] = Field(
+        default_factory=list, description="Values are author ids"
+    )
+    created_per_week: list[StatsBucket] = Field(
+        default_factory=list,
+        description="Recent weeks, oldest first; values are the weeks' Mondays",
+    )
@@ -1,7 +1,17 @@
+import re
 import typing
+from collections.abc import Callable
 from typing import Any
 
-# JSON Schema for recipe frontmatter validation
+# Durations as parse_duration reads them: "15 minutes", "1.5 hours",
+# "1 hours 30 minutes"; bare integers are minutes
+_DURATION_PATTERN = (
+    "^\\d+(\\.\\d+)?\\s*(minutes?|mins?|hours?|hrs?|h)?(\\s+\\d+\\s*(minutes?|mins?))?$"
+)
+
+# JSON Schema for recipe frontmatter validation. It describes everything the
+# Markdown parser accepts, including what generate_markdown writes, so that
+# exported recipes validate when imported again.
 RECIPE_FRONTMATTER_SCHEMA: dict[str, Any] = {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "type": "object",
@@ -20,18 +30,32 @@ RECIPE_FRONTMATTER_SCHEMA: dict[str, Any] = {
         },
         "servings": {
             "type": "string",
+            "maxLength": 100,
             "description": "Number of servings (e.g., '4 people', '12 cookies')",
         },
-        "prep_time": {
+        "makes": {
             "type": "string",
-            "pattern": "^\\d+\\s*(minutes?|mins?|hours?|hrs?|h)?(\\s+\\d+\\s*(minutes?|mins?))?$",
+            "maxLength": 100,
+            "description": "What the recipe yields, used when servings is not set",
+        },
+        "prep_time": {
+            "type": ["string", "integer"],
+            "pattern": _DURATION_PATTERN,
+            "minimum": 0,
             "description": "Preparation time (e.g., '15 minutes', '1 hour 30 minutes')",
         },
         "cook_time": {
-            "type": "string",
-            "pattern": "^\\d+\\s*(minutes?|mins?|hours?|hrs?|h)?(\\s+\\d+\\s*(minutes?|mins?))?$",
+            "type": ["string", "integer"],
+            "pattern": _DURATION_PATTERN,
+            "minimum": 0,
             "description": "Cooking time (e.g., '30 minutes', '2 hours')",
         },
+        "total_time": {
+            "type": ["string", "integer"],
+            "pattern": _DURATION_PATTERN,
+            "minimum": 0,
+            "description": "Informational; computed from prep_time and cook_time",
+        },
         "temperature": {
             "type": "integer",
             "minimum": 0,
@@ -53,19 +77,23 @@ RECIPE_FRONTMATTER_SCHEMA: dict[str, Any] = {
             "maxLength": 100,
             "description": "Recipe category (e.g., 'dessert', 'main', 'appetizer')",
         },
+        "image": {
+            "type": "string",
+            "description": "Recipe image URL",
+        },
         "tags": {
-            "type": "array",
+            "type": ["array", "string"],
             "items": {"type": "string", "maxLength": 50},
             "uniqueItems": True,
             "description": "Recipe tags for categorization",
         },
         "notes": {
-            "type": "array",
+            "type": ["array", "string"],
             "items": {"type": "string"},
             "description": "Additional notes about the recipe",
         },
         "tips": {
-            "type": "array",
+            "type": ["array", "string"],
             "items": {"type": "string"},
             "description": "Cooking tips and tricks",
         },
@@ -85,6 +113,8 @@ RECIPE_FRONTMATTER_SCHEMA: dict[str, Any] = {
             "pattern": "^[a-z]{2}$",
             "description": "Recipe language code (ISO 639-1)",
         },
+        "created_at": {"description": "Informational; set by the server"},
+        "updated_at": {"description": "Informational; set by the server"},
     },
     "additionalProperties": False,
 }
@@ -107,3 +137,180 @@ def get_enum_values(field: str) -> list[str] | None:
     if props and "enum" in props:
         return typing.cast(list[str], props["enum"])
     return None
+
+
+class FieldError(typing.NamedTuple):
+    """A problem with one frontmatter field, or with the whole recipe if no field."""
+
+    field: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.field} {self.message}" if self.field else self.message
+
+
+# A compiled check of one value; yields what is wrong with it
+_Check = Callable[[Any], typing.Iterator[str]]
+
+_TYPES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+
+_TYPE_NAMES = {
+    "string": "a string",
+    "integer": "an integer",
+    "number": "a number",
+    "boolean": "true or false",
+    "array": "a list",
+    "object": "a mapping",
+}
+
+# Keywords compile_validator understands; annotations are accepted and ignored
+_KEYWORDS = {
+    "$schema",
+    "description",
+    "default",
+    "type",
+    "enum",
+    "minLength",
+    "maxLength",
+    "pattern",
+    "minimum",
+    "maximum",
+    "items",
+    "uniqueItems",
+}
+_OBJECT_KEYWORDS = {"required", "properties", "additionalProperties"}
+
+
+def _is_type(value: Any, name: str) -> bool:
+    # YAML booleans are ints to Python, but not to JSON Schema
+    if isinstance(value, bool) and name != "boolean":
+        return False
+    return isinstance(value, _TYPES[name])
+
+
+def _string_errors(
+    value: str,
+    min_length: int | None,
+    max_length: int | None,
+    pattern: re.Pattern[str] | None,
+) -> typing.Iterator[str]:
+    if min_length is not None and len(value) < min_length:
+        yield (
+            "must not be empty"
+            if min_length == 1
+            else f"must be at least {min_length} characters"
+        )
+    if max_length is not None and len(value) > max_length:
+        yield f"must be at most {max_length} characters"
+    if pattern is not None and not pattern.search(value):
+        yield "has an invalid format"
+
+
+def _number_errors(
+    value: float, minimum: float | None, maximum: float | None
+) -> typing.Iterator[str]:
+    if minimum is not None and value < minimum:
+        yield f"must be at least {minimum}"
+    if maximum is not None and value > maximum:
+        yield f"must be at most {maximum}"
+
+
+def _list_errors(
+    value: list[Any], items: _Check | None, *, unique: bool
+) -> typing.Iterator[str]:
+    if items is not None:
+        for index, item in enumerate(value):
+            for message in items(item):
+                yield f"item {index + 1} {message}"
+    if unique and any(item in value[:i] for i, item in enumerate(value)):
+        yield "must not contain duplicates"
+
+
+def _compile_value(schema: dict[str, Any]) -> _Check:
+    unsupported = set(schema) - _KEYWORDS
+    if unsupported:
+        msg = f"Unsupported schema keywords: {sorted(unsupported)}"
+        raise ValueError(msg)
+
+    types = schema.get("type", [])
+    types = [types] if isinstance(types, str) else list(types)
+    enum = schema.get("enum")
+    min_length = schema.get("minLength")
+    max_length = schema.get("maxLength")
+    pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+    items = _compile_value(schema["items"]) if "items" in schema else None
+    unique = schema.get("uniqueItems", False)
+
+    def check(value: Any) -> typing.Iterator[str]:
+        if types and not any(_is_type(value, name) for name in types):
+            yield "must be " + " or ".join(_TYPE_NAMES[name] for name in types)
+            return
+        if enum is not None and value not in enum:
+            yield "must be one of: " + ", ".join(map(str, enum))
+
+        if isinstance(value, str):
+            yield from _string_errors(value, min_length, max_length, pattern)
+        elif _is_type(value, "number"):
+            yield from _number_errors(value, minimum, maximum)
+        elif isinstance(value, list):
+            yield from _list_errors(value, items, unique=unique)
+
+    return check
+
+
+def compile_validator(schema: dict[str, Any]) -> Callable[[Any], list[FieldError]]:
+    """
+    Compile an object JSON Schema into a function returning its violations.
+
+    Only the draft-07 keywords used by RECIPE_FRONTMATTER_SCHEMA are supported,
+    so a schema using anything else fails here rather than being half-enforced.
+    Patterns are compiled and per-field checks built once, up front.
+    """
+    unsupported = set(schema) - _KEYWORDS - _OBJECT_KEYWORDS
+    if unsupported:
+        msg = f"Unsupported schema keywords: {sorted(unsupported)}"
+        raise ValueError(msg)
+
+    required: list[str] = schema.get("required", [])
+    properties = {
+        name: _compile_value(field)
+        for name, field in schema.get("properties", {}).items()
+    }
+    additional = schema.get("additionalProperties", True)
+    if additional is not False and additional is not True:
+        msg = "additionalProperties must be a boolean"
+        raise ValueError(msg)
+
+    def validate(document: Any) -> list[FieldError]:
+        if not isinstance(document, dict):
+            return [FieldError("", "Frontmatter must be a mapping of fields")]
+        errors = [
+            FieldError(name, "is required") for name in required if name not in document
+        ]
+        for name, value in document.items():
+            check = properties.get(name)
+            if check is None:
+                if not additional:
+                    errors.append(FieldError(str(name), "is not a known field"))
+                continue
+            errors.extend(FieldError(name, message) for message in check(value))
+        return errors
+
+    return validate
+
+
+# Compiled once at import. Uploads and imports have always accepted keys the
+# schema does not know, so only the editor schema forbids them
+validate_frontmatter = compile_validator({
+    **RECIPE_FRONTMATTER_SCHEMA,
+    "additionalProperties": True,
+})
@@ -5,3 +5,6 @@ class Post:
     content: str
 
 def loads(s: str) -> Post: ...
+def parse(
+    text: str, encoding: str = ..., handler: Any = ..., **defaults: Any
+) -> tuple[dict[str, Any], str]: ...
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import typing
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from datetime import datetime
+from uuid import uuid4
+
+import fakeredis
+import fakeredis.aioredis
+import httpx
+import jwt
+import pytest
+import redis.asyncio
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+import cookbook.models  # noqa: F401  # registers every table on Base.metadata
+from cookbook.config import settings
+from cookbook.core import redis as cookbook_redis
+from cookbook.core.cache import LRUCache
+from cookbook.crud.recipe import recipe_cache
+from cookbook.crud.user import user_cache
+from cookbook.database import Base, get_read_session, get_session
+from cookbook.main import app
+from cookbook.models import Recipe, User
+
+# Tests using the `db` fixture run against this Postgres; its schema is
+# dropped and recreated, so never point it at a database you care about
+TEST_DATABASE_URL = os.environ.get("COOKBOOK_TEST_DATABASE_URL")
+
+
+class _FakeConnection(fakeredis.aioredis.FakeConnection):
+    async def can_read_destructive(self) -> bool:  # noqa: PLR6301
+        # redis 7.4 probes pooled connections with at_eof(), which the
+        # fakeredis 2.20 reader lacks; a fake socket never has stale replies
+        return False
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> fakeredis.aioredis.FakeRedis:
+    pool = redis.asyncio.ConnectionPool(
+        connection_class=_FakeConnection,
+        server=fakeredis.FakeServer(),
+        decode_responses=True,
+        version=(7,),
+    )
+    client = fakeredis.aioredis.FakeRedis(connection_pool=pool, decode_responses=True)
+    monkeypatch.setattr(cookbook_redis, "redis_client", client)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def empty_local_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    # In-process tiers outlive the test transactions, like the Redis above
+    for cache in (recipe_cache, user_cache):
+        monkeypatch.setattr(
+            cache, "local", LRUCache(maxsize=cache.local.maxsize, ttl=cache.local.ttl)
+        )
+
+
+async def _create_schema(url: str) -> None:
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def database_url() -> str:
+    if not TEST_DATABASE_URL:
+        pytest.skip("COOKBOOK_TEST_DATABASE_URL is not set")
+    asyncio.run(_create_schema(TEST_DATABASE_URL))
+    return TEST_DATABASE_URL
+
+
+@pytest.fixture
+async def db(database_url: str) -> AsyncGenerator[AsyncSession]:
+    """A session whose commits are rolled back after the test."""
+    engine = create_async_engine(database_url, poolclass=NullPool)
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+    await engine.dispose()
+
+
+@pytest.fixture
+def add_recipes(db: AsyncSession) -> Callable[..., Awaitable[None]]:
+    """Insert recipe rows as given, bypassing slug allocation and tag upkeep."""
+
+    async def add(*rows: dict[str, typing.Any]) -> None:
+        await db.execute(
+            insert(Recipe),
+            [
+                {"name": "Recipe", "slug": f"recipe-{uuid4().hex}", **row}
+                for row in rows
+            ],
+        )
+
+    return add
+
+
+@pytest.fixture
+async def client(db: AsyncSession) -> AsyncGenerator[httpx.AsyncClient]:
+    """An API client whose requests all run in the `db` test transaction."""
+    app.dependency_overrides[get_session] = lambda: db
+    app.dependency_overrides[get_read_session] = lambda: db
+    transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+async def _auth_headers(db: AsyncSession, *, is_admin: bool) -> dict[str, str]:
+    created = datetime(2024, 5, 1, 12, 0)
+    user = User(
+        email=f"{uuid4().hex}@example.com",
+        is_admin=is_admin,
+        created_at=created,
+        updated_at=created,
+    )
+    db.add(user)
+    # Committed, so a request that rolls back keeps its user
+    await db.commit()
+    token = jwt.encode(
+        {"sub": str(user.id), "exp": int(time.time()) + 600},
+        settings.security.secret_key,
+        algorithm=settings.security.algorithm,
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+async def admin_headers(db: AsyncSession) -> dict[str, str]:
+    """Authorization headers of a new admin user."""
+    return await _auth_headers(db, is_admin=True)
+
+
+@pytest.fixture
+async def user_headers(db: AsyncSession) -> dict[str, str]:
+    """Authorization headers of a new user without admin privileges."""
+    return await _auth_headers(db, is_admin=False)
+
+
+# Generated recipes: every 10th is private, one in 500 is a saffron paella
+_SEED_RECIPES = text("""
+    INSERT INTO recipes (
+        id, name, slug, description, content, category, cuisine, difficulty,
+        tags, prep_time, cook_time, is_public, is_featured, created_at, updated_at
+    )
+    SELECT
+        gen_random_uuid(),
+        CASE WHEN i % 500 = 1 THEN 'Saffron paella' ELSE
+            (ARRAY['Chicken soup', 'Lemon tart', 'Garlic bread', 'Beef stew',
+                   'Pea risotto'])[i % 5 + 1]
+        END || ' ' || i,
+        'seeded-' || i || '-' || md5(random()::text),
+        'A ' || (ARRAY['quick', 'hearty', 'light', 'classic'])[i % 4 + 1]
+            || ' dish for ' || (i % 8 + 1) || ' people',
+        '## Ingredients' || chr(10) || chr(10) || '- ' || md5(i::text)
+            || chr(10) || chr(10) || '## Instructions' || chr(10) || chr(10)
+            || '1. Cook the ' || (ARRAY['onions', 'carrots', 'rice'])[i % 3 + 1],
+        (ARRAY['main', 'dessert', 'soup', 'bread'])[i % 4 + 1],
+        (ARRAY['italian', 'thai', 'french'])[i % 3 + 1],
+        (ARRAY['easy', 'medium', 'hard'])[i % 3 + 1],
+        ARRAY[(ARRAY['vegetarian', 'quick', 'spicy'])[i % 3 + 1]]::varchar(50)[],
+        i % 60,
+        i % 90,
+        i % 10 <> 0,
+        i % 100 = 0,
+        timestamp '2024-01-01' + i * interval '1 minute',
+        timestamp '2024-01-01' + i * interval '1 minute'
+    FROM generate_series(1, :count) AS i
+""")
+
+
+@pytest.fixture
+def seed_recipes(db: AsyncSession) -> Callable[[int], Awaitable[None]]:
+    """Insert many generated recipes in one statement, for benchmarks."""
+
+    async def seed(count: int) -> None:
+        await db.execute(_SEED_RECIPES, {"count": count})
+        await db.execute(text("ANALYZE recipes"))
+
+    return seed
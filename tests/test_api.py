@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import typing
+
+import httpx
+import pytest
+
+pytestmark = [pytest.mark.database, pytest.mark.recipe]
+
+RECIPES_URL = "/api/recipes/"
+
+RECIPE_MARKDOWN = """---
+name: Leek soup
+description: Warming
+difficulty: easy
+cuisine: french
+category: soup
+tags: [winter]
+prep_time: 10 minutes
+cook_time: 1 hour
+---
+
+## Ingredients
+
+- 2 leeks
+
+## Instructions
+
+1. Simmer
+"""
+
+
+@pytest.fixture
+async def recipes(
+    client: httpx.AsyncClient, user_headers: dict[str, str]
+) -> list[dict[str, typing.Any]]:
+    """Three public recipes and a private one, created through the API."""
+    created = []
+    for fields in (
+        {"name": "Leek soup", "category": "soup", "cuisine": "french"},
+        {"name": "Pea soup", "category": "soup", "tags": ["quick", "green"]},
+        {"name": "Lemon tart", "category": "dessert", "is_featured": True},
+        {"name": "Secret stew", "category": "main", "is_public": False},
+    ):
+        response = await client.post(RECIPES_URL, json=fields, headers=user_headers)
+        created.append(response.json())
+    return created
+
+
+def names(response: httpx.Response) -> list[str]:
+    return [recipe["name"] for recipe in response.json()]
+
+
+async def test_service_endpoints(client: httpx.AsyncClient) -> None:
+    assert (await client.get("/health")).json() == {"status": "healthy"}
+    assert (await client.get("/")).json()["message"] == "Cookbook API"
+
+
+@pytest.mark.usefixtures("recipes")
+async def test_list_endpoints_show_public_recipes(client: httpx.AsyncClient) -> None:
+    response = await client.get(RECIPES_URL, params={"limit": 2})
+    assert names(response) == ["Lemon tart", "Pea soup"]
+    assert "content" not in response.json()[0]
+
+    response = await client.get(f"{RECIPES_URL}recent")
+    assert names(response) == ["Lemon tart", "Pea soup", "Leek soup"]
+    response = await client.get(f"{RECIPES_URL}featured")
+    assert names(response) == ["Lemon tart"]
+    response = await client.get(f"{RECIPES_URL}category/soup")
+    assert names(response) == ["Pea soup", "Leek soup"]
+
+
+@pytest.mark.usefixtures("recipes")
+async def test_vocabulary_endpoints(client: httpx.AsyncClient) -> None:
+    categories = await client.get(f"{RECIPES_URL}categories")
+    assert categories.json() == ["dessert", "soup"]
+    assert (await client.get(f"{RECIPES_URL}cuisines")).json() == ["french"]
+    assert (await client.get(f"{RECIPES_URL}tags")).json() == ["green", "quick"]
+    response = await client.get(f"{RECIPES_URL}tags", params={"limit": 1})
+    assert response.json() == ["green"]
+
+    autocomplete = (await client.get(f"{RECIPES_URL}editor/autocomplete")).json()
+    assert autocomplete["categories"] == ["dessert", "soup"]
+    assert autocomplete["difficulty"] == ["easy", "medium", "hard"]
+
+
+@pytest.mark.usefixtures("recipes")
+async def test_search(client: httpx.AsyncClient) -> None:
+    response = await client.get(f"{RECIPES_URL}search", params={"q": "soup"})
+
+    body = response.json()
+    assert body["total"] == 2
+    assert sorted(recipe["name"] for recipe in body["recipes"]) == [
+        "Leek soup",
+        "Pea soup",
+    ]
+
+    response = await client.get(
+        f"{RECIPES_URL}search", params={"q": "soup", "facets": True}
+    )
+    facets = response.json()["facets"]
+    assert facets["category"] == [{"value": "soup", "count": 2}]
+    assert facets["tags"] == [
+        {"value": "green", "count": 1},
+        {"value": "quick", "count": 1},
+    ]
+
+    response = await client.get(
+        f"{RECIPES_URL}search", params={"category": "dessert", "is_featured": True}
+    )
+    assert [recipe["name"] for recipe in response.json()["recipes"]] == ["Lemon tart"]
+
+
+async def test_recipe_detail_by_id_or_slug(
+    client: httpx.AsyncClient, recipes: list[dict[str, typing.Any]]
+) -> None:
+    leek = recipes[0]
+
+    by_id = await client.get(f"{RECIPES_URL}{leek['id']}")
+    by_slug = await client.get(f"{RECIPES_URL}{leek['slug']}")
+
+    assert by_id.json() == by_slug.json() == leek
+    assert (await client.get(f"{RECIPES_URL}no-such-recipe")).status_code == 404
+
+
+async def test_validate_markdown(client: httpx.AsyncClient) -> None:
+    response = await client.post(
+        f"{RECIPES_URL}validate",
+        content=RECIPE_MARKDOWN,
+        headers={"Content-Type": "text/plain"},
+    )
+    body = response.json()
+    assert body["valid"]
+    assert body["parsed_fields"] == {
+        "name": "Leek soup",
+        "difficulty": "easy",
+        "cuisine": "french",
+        "category": "soup",
+    }
+
+    response = await client.post(
+        f"{RECIPES_URL}validate",
+        content="---\ndifficulty: extreme\n---\n",
+        headers={"Content-Type": "text/plain"},
+    )
+    body = response.json()
+    assert not body["valid"]
+    assert {error["field"] for error in body["error_fields"]} >= {"name", "difficulty"}
+
+
+async def test_editor_schema(client: httpx.AsyncClient) -> None:
+    body = (await client.get(f"{RECIPES_URL}editor/schema")).json()
+
+    assert body["schema"]["required"] == ["name"]
+    assert "name" in body["field_descriptions"]
+
+
+async def test_upload(client: httpx.AsyncClient, admin_headers: dict[str, str]) -> None:
+    url = f"{RECIPES_URL}upload"
+
+    response = await client.post(
+        url, files={"file": ("leek.md", RECIPE_MARKDOWN)}, headers=admin_headers
+    )
+    assert response.json()["recipe_slug"] == "leek-soup"
+    detail = (await client.get(f"{RECIPES_URL}leek-soup")).json()
+    assert (detail["prep_time"], detail["cook_time"]) == (10, 60)
+
+    for filename, content, message in (
+        ("leek.txt", RECIPE_MARKDOWN, "Unsupported file format"),
+        ("leek.md", "---\ndescription: nameless\n---\n", "Invalid Markdown recipe"),
+        ("leek.md", b"\xff\xfe", "Error processing file"),
+    ):
+        response = await client.post(
+            url, files={"file": (filename, content)}, headers=admin_headers
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith(message)
+
+
+async def test_upload_is_admin_only(
+    client: httpx.AsyncClient, user_headers: dict[str, str]
+) -> None:
+    response = await client.post(
+        f"{RECIPES_URL}upload",
+        files={"file": ("leek.md", RECIPE_MARKDOWN)},
+        headers=user_headers,
+    )
+
+    assert response.status_code == 403
+
+
+async def test_export_recipe(
+    client: httpx.AsyncClient, recipes: list[dict[str, typing.Any]]
+) -> None:
+    url = f"{RECIPES_URL}{recipes[1]['id']}/export"
+
+    markdown = await client.get(f"{url}/markdown")
+    assert markdown.headers["content-type"].startswith("text/markdown")
+    assert 'filename="pea-soup.md"' in markdown.headers["content-disposition"]
+    assert markdown.text.startswith("---\n")
+    assert "\nname: Pea soup\n" in markdown.text
+    assert "- quick" in markdown.text
+
+    exported = await client.get(f"{url}/json")
+    assert exported.json()["tags"] == ["quick", "green"]
+    pdf = await client.get(f"{url}/pdf")
+    assert pdf.json()["message"] == "PDF export not yet implemented"
+    assert (await client.get(f"{url}/docx")).status_code == 400
+
+    private = f"{RECIPES_URL}{recipes[3]['id']}/export/json"
+    assert (await client.get(private)).status_code == 404
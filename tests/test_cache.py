@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import fakeredis.aioredis
+import httpx
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from cookbook.core.cache import LRUCache, TieredCache
+
+
+def _cache(namespace: str = "test") -> TieredCache:
+    return TieredCache(namespace, maxsize=8, local_ttl=30, ttl=300)
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    lru = LRUCache(maxsize=2, ttl=30)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+
+    assert (lru.get("a"), lru.get("b"), lru.get("c")) == (1, None, 3)
+    assert lru.evictions == 1
+
+
+def test_lru_entry_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr("cookbook.core.cache.time.monotonic", lambda: now)
+    lru = LRUCache(maxsize=2, ttl=30)
+    lru.set("a", 1, ttl=5)
+
+    now += 6
+
+    assert lru.get("a") is None
+    assert len(lru) == 0
+
+
+async def test_get_falls_back_to_redis_and_fills_local() -> None:
+    writer, reader = _cache(), _cache()
+    await writer.set("k", "v")
+
+    assert await reader.get("k") == "v"
+    assert await reader.get("k") == "v"
+    assert reader.stats()["redis_hits"] == 1
+    assert reader.stats()["local_hits"] == 1
+
+
+async def test_fill_after_delete_is_dropped(
+    fake_redis: fakeredis.aioredis.FakeRedis,
+) -> None:
+    # A reader computed the value before a writer invalidated it
+    reader, writer = _cache(), _cache()
+    await writer.delete("k")
+    await reader.set("k", "stale")
+    await writer.set("k", "stale")
+
+    assert await reader.get("k") is None
+    assert await writer.get("k") is None
+    assert await _cache().get("k") is None
+
+    await fake_redis.delete("cookbook:test:k")
+    await reader.set("k", "fresh")
+    assert await _cache().get("k") == "fresh"
+
+
+async def test_fill_does_not_overwrite_live_entry() -> None:
+    first, second = _cache(), _cache()
+    await first.set("k", "one")
+    await second.set("k", "two")
+
+    assert await _cache().get("k") == "one"
+    assert await second.get("k") == "one"
+
+
+async def test_redis_failure_is_a_miss(monkeypatch: pytest.MonkeyPatch) -> None:
+    def unavailable() -> None:
+        raise RedisConnectionError
+
+    monkeypatch.setattr("cookbook.core.cache.get_redis", unavailable)
+    cache = _cache()
+
+    assert await cache.get("k") is None
+    await cache.set("k", "v")
+    assert await cache.get("k") == "v"
+    await cache.delete("k")
+    assert await cache.get("k") is None
+
+
+async def test_keep_local_false_reads_through_to_redis() -> None:
+    def keep_local(value: str) -> bool:
+        return value != "admin"
+
+    cache = TieredCache("test", maxsize=8, local_ttl=30, ttl=300, keep_local=keep_local)
+    await cache.set("a", "admin")
+    await cache.set("m", "member")
+
+    assert (await cache.get("a"), await cache.get("m")) == ("admin", "member")
+    assert cache.local.get("a") is None
+    assert cache.stats()["redis_hits"] == 1
+
+
+@pytest.mark.database
+async def test_recipe_detail_is_cached_until_edited(
+    client: httpx.AsyncClient,
+    user_headers: dict[str, str],
+    admin_headers: dict[str, str],
+) -> None:
+    created = await client.post(
+        "/api/recipes/", json={"name": "Leek soup"}, headers=user_headers
+    )
+    recipe_id = created.json()["id"]
+
+    async def cache_stats() -> dict[str, int]:
+        response = await client.get("/api/recipes/stats/cache", headers=admin_headers)
+        return dict(response.json())
+
+    before = await cache_stats()
+    await client.get(f"/api/recipes/{recipe_id}")
+    await client.get(f"/api/recipes/{recipe_id}")
+    await client.put(
+        f"/api/recipes/{recipe_id}", json={"servings": "4"}, headers=user_headers
+    )
+    detail = await client.get("/api/recipes/leek-soup")
+    after = await cache_stats()
+
+    assert detail.json()["servings"] == "4"
+    assert after["local_hits"] - before["local_hits"] == 1
+    assert after["misses"] - before["misses"] == 2
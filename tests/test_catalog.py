@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cookbook.crud.recipe import get_catalog
+
+pytestmark = pytest.mark.database
+
+
+async def test_catalog_skips_blank_and_private_values(
+    db: AsyncSession, add_recipes: Callable[..., Awaitable[None]]
+) -> None:
+    await add_recipes(
+        {"category": "soup", "cuisine": "thai"},
+        {"category": "bread", "cuisine": ""},
+        {"category": "", "cuisine": None},
+        {"category": "soup", "cuisine": "thai"},
+        {"category": "secret", "cuisine": "secret", "is_public": False},
+    )
+
+    catalog = await get_catalog(db)
+
+    assert catalog.categories == ["bread", "soup"]
+    assert catalog.cuisines == ["thai"]
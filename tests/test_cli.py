@@ -0,0 +1,265 @@
+# ruff: noqa: SLF001  # the commands run their async helpers with asyncio.run
+
+from __future__ import annotations
+
+import contextlib
+import tarfile
+import typing
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from typer.testing import CliRunner
+
+from cookbook import cli, database
+from cookbook.core.markdown import parse_markdown_recipe
+from cookbook.models import Recipe, User
+
+runner = CliRunner()
+
+
+def write_recipe(path: Path, name: str) -> None:
+    path.write_text(
+        f"---\nname: {name}\ncategory: soup\n---\n\n## Ingredients\n\n- 1 leek\n",
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.unit
+def test_sample_recipes_validate_and_parse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(cli.app, ["export-sample-recipes"])
+    assert result.exit_code == 0
+    sample = tmp_path / "sample_recipes" / "spaghetti-carbonara.md"
+
+    result = runner.invoke(cli.app, ["validate-markdown-recipe-file", str(sample)])
+    assert result.exit_code == 0
+    assert "is valid" in result.stdout
+
+    result = runner.invoke(cli.app, ["parse-markdown-recipe", str(sample)])
+    assert result.exit_code == 0
+    assert result.stdout.splitlines()[:3] == [
+        "Recipe: Authentic Spaghetti Carbonara",
+        "Description: Traditional Roman pasta dish with eggs, cheese, and pancetta",
+        "Servings: 4 people",
+    ]
+    assert "Tags: pasta, italian, quick, traditional" in result.stdout
+
+
+@pytest.mark.unit
+def test_invalid_recipe_files_fail(tmp_path: Path) -> None:
+    broken = tmp_path / "broken.md"
+    broken.write_text("---\nname: [unclosed\n---\n", encoding="utf-8")
+    missing = str(tmp_path / "missing.md")
+
+    for command in ("validate-markdown-recipe-file", "parse-markdown-recipe"):
+        result = runner.invoke(cli.app, [command, missing])
+        assert result.exit_code == 1
+        assert "does not exist" in result.stderr
+
+    result = runner.invoke(cli.app, ["validate-markdown-recipe-file", str(broken)])
+    assert result.exit_code == 1
+    assert "Validation failed" in result.stdout
+    result = runner.invoke(cli.app, ["parse-markdown-recipe", str(broken)])
+    assert result.exit_code == 1
+    assert "Failed to parse recipe" in result.stderr
+
+
+@pytest.fixture
+def cli_db(db: AsyncSession, monkeypatch: pytest.MonkeyPatch) -> AsyncSession:
+    """Point the CLI's sessions at the test transaction."""
+
+    def session() -> AsyncSession:
+        return AsyncSession(
+            bind=db.bind,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+    monkeypatch.setattr(database, "AsyncSessionLocal", session)
+    return db
+
+
+@pytest.mark.database
+async def test_import_files_in_batches(tmp_path: Path, cli_db: AsyncSession) -> None:
+    prefix = uuid4().hex
+    paths = []
+    for index in range(70):
+        path = tmp_path / f"{index:03}.md"
+        write_recipe(path, f"{prefix} {index}")
+        paths.append(str(path))
+    broken = tmp_path / "broken.md"
+    broken.write_text("---\nname: [unclosed\n---\n", encoding="utf-8")
+    paths.append(str(broken))
+
+    summary = await cli._import_files(
+        paths, jobs=2, batch_size=25, dry_run=False, upsert=False
+    )
+
+    assert summary == {"created": 70, "error": 1}
+    result = await cli_db.execute(
+        select(Recipe.name).where(Recipe.name.startswith(prefix))
+    )
+    assert len(result.scalars().all()) == 70
+
+
+@pytest.mark.database
+async def test_import_files_dry_run_writes_nothing(
+    tmp_path: Path, cli_db: AsyncSession
+) -> None:
+    name = uuid4().hex
+    write_recipe(tmp_path / "dish.md", name)
+
+    summary = await cli._import_files(
+        [str(tmp_path / "dish.md")], jobs=1, batch_size=10, dry_run=True, upsert=False
+    )
+
+    assert summary == {"parsed": 1}
+    result = await cli_db.execute(select(Recipe.id).where(Recipe.name == name))
+    assert result.first() is None
+
+
+@pytest.mark.database
+async def test_import_files_upsert_updates_existing(
+    tmp_path: Path, cli_db: AsyncSession
+) -> None:
+    name = uuid4().hex
+    write_recipe(tmp_path / "dish.md", name)
+    paths = [str(tmp_path / "dish.md")]
+
+    await cli._import_files(paths, jobs=1, batch_size=10, dry_run=False, upsert=False)
+    summary = await cli._import_files(
+        paths, jobs=1, batch_size=10, dry_run=False, upsert=True
+    )
+
+    assert summary == {"updated": 1}
+
+
+@pytest.mark.unit
+def test_import_dir_dry_run(tmp_path: Path) -> None:
+    write_recipe(tmp_path / "soup.md", "Leek soup")
+    (tmp_path / "nested").mkdir()
+    write_recipe(tmp_path / "nested" / "stew.markdown", "Stew")
+    (tmp_path / "notes.txt").write_text("not a recipe", encoding="utf-8")
+
+    result = runner.invoke(
+        cli.app, ["import-dir", str(tmp_path), "-j", "1", "--dry-run"]
+    )
+
+    assert result.exit_code == 0
+    assert result.stdout.strip().endswith(": 2 parsed")
+
+    (tmp_path / "broken.md").write_bytes(b"\xff")
+    result = runner.invoke(
+        cli.app, ["import-dir", str(tmp_path), "-j", "1", "--dry-run"]
+    )
+
+    assert result.exit_code == 1
+    assert "broken.md: File is not valid UTF-8" in result.stderr
+    assert result.stdout.strip().endswith(": 1 error, 2 parsed")
+
+
+@pytest.mark.unit
+def test_import_dir_needs_markdown_files(tmp_path: Path) -> None:
+    result = runner.invoke(cli.app, ["import-dir", str(tmp_path / "missing")])
+    assert result.exit_code == 1
+    assert "does not exist" in result.stderr
+
+    result = runner.invoke(cli.app, ["import-dir", str(tmp_path)])
+    assert result.exit_code == 0
+    assert "No Markdown files found" in result.stdout
+
+
+@pytest.fixture
+def cli_engine(db: AsyncSession, monkeypatch: pytest.MonkeyPatch) -> AsyncSession:
+    """Point the CLI's engine at the test transaction."""
+
+    class Engine:
+        @staticmethod
+        @contextlib.asynccontextmanager
+        async def connect() -> AsyncIterator[AsyncConnection]:
+            yield typing.cast(AsyncConnection, db.bind)
+
+        async def dispose(self) -> None:
+            pass
+
+    monkeypatch.setattr(database, "engine", Engine())
+    return db
+
+
+@pytest.mark.database
+@pytest.mark.parametrize("scope", ["all", "public"])
+async def test_export_recipes_to_directory(
+    tmp_path: Path,
+    cli_engine: AsyncSession,
+    add_recipes: Callable[..., Awaitable[None]],
+    scope: str,
+) -> None:
+    public_only = scope == "public"
+    await add_recipes(
+        {
+            "slug": "leek-soup",
+            "name": "Leek soup",
+            "category": "Soup & Stew",
+            "tags": ["winter"],
+            "content": "## Ingredients\n\n- 2 leeks",
+            "updated_at": datetime(2024, 5, 1, 12, 0),
+        },
+        {"slug": "secret", "name": "Secret", "is_public": False},
+    )
+
+    exported = await cli._export_recipes(
+        cli._DirectoryWriter(tmp_path), jobs=2, chunk_size=1, public_only=public_only
+    )
+
+    soup = tmp_path / "soup-and-stew" / "leek-soup.md"
+    assert exported == (1 if public_only else 2)
+    assert (tmp_path / "uncategorized" / "secret.md").exists() is not public_only
+    assert soup.stat().st_mtime == datetime(2024, 5, 1, 12, 0).timestamp()
+    recipe = parse_markdown_recipe(soup.read_text(encoding="utf-8")).recipe
+    assert recipe is not None
+    assert (recipe.name, recipe.tags) == ("Leek soup", ["winter"])
+
+
+@pytest.mark.database
+async def test_export_recipes_to_tarball(
+    tmp_path: Path,
+    cli_engine: AsyncSession,
+    add_recipes: Callable[..., Awaitable[None]],
+) -> None:
+    await add_recipes(*({"slug": f"dish-{index}"} for index in range(5)))
+    writer = cli._TarballWriter(tmp_path / "recipes.tar.gz")
+
+    try:
+        exported = await cli._export_recipes(
+            writer, jobs=1, chunk_size=2, public_only=False
+        )
+    finally:
+        writer.close()
+
+    with tarfile.open(tmp_path / "recipes.tar.gz") as tar:
+        names = sorted(tar.getnames())
+    assert exported == 5
+    assert names == [f"uncategorized/dish-{index}.md" for index in range(5)]
+
+
+@pytest.mark.database
+async def test_set_admin(cli_db: AsyncSession) -> None:
+    created = datetime(2024, 5, 1, 12, 0)
+    user = User(
+        email=f"{uuid4().hex}@example.com", created_at=created, updated_at=created
+    )
+    cli_db.add(user)
+    await cli_db.commit()
+
+    assert await cli._set_admin(user.email, is_admin=True)
+    await cli_db.refresh(user)
+    assert user.is_admin
+    assert not await cli._set_admin("nobody@example.com", is_admin=True)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from cookbook.config import Settings
+
+pytestmark = pytest.mark.unit
+
+
+def test_multi_word_section_fields_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("COOKBOOK_CACHE_RECIPE_TTL_SECONDS", "7")
+    monkeypatch.setenv("COOKBOOK_CACHE_RECIPE_LOCAL_MAXSIZE", "16")
+    monkeypatch.setenv("COOKBOOK_SECURITY_AUTH_BASE_URL", "http://auth:8000")
+
+    settings = Settings(_env_file=None)
+
+    assert settings.cache.recipe_ttl_seconds == 7
+    assert settings.cache.recipe_local_maxsize == 16
+    assert settings.security.auth_base_url == "http://auth:8000"
+
+
+def test_database_fields_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("COOKBOOK_DATABASE_POOL_SIZE", "20")
+    monkeypatch.setenv("COOKBOOK_DATABASE_STATEMENT_CACHE_SIZE", "0")
+    monkeypatch.setenv(
+        "COOKBOOK_DATABASE_REPLICA_URLS",
+        '["postgresql+asyncpg://r1/cookbook", "postgresql+asyncpg://r2/cookbook"]',
+    )
+
+    settings = Settings(_env_file=None)
+
+    assert settings.database.pool_size == 20
+    assert settings.database.statement_cache_size == 0
+    assert settings.database.replica_urls == [
+        "postgresql+asyncpg://r1/cookbook",
+        "postgresql+asyncpg://r2/cookbook",
+    ]
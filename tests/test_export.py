@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from uuid import uuid4
+
+import httpx
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+pytestmark = [pytest.mark.database, pytest.mark.recipe]
+
+EXPORT_URL = "/api/recipes/export.ndjson"
+
+
+async def test_export_streams_every_recipe_in_update_order(
+    client: httpx.AsyncClient,
+    admin_headers: dict[str, str],
+    add_recipes: Callable[..., Awaitable[None]],
+) -> None:
+    prefix = uuid4().hex
+    await add_recipes(
+        {"name": f"{prefix} new", "updated_at": datetime(2024, 3, 1)},
+        {"name": f"{prefix} old", "updated_at": datetime(2024, 1, 1)},
+        {
+            "name": f"{prefix} private",
+            "updated_at": datetime(2024, 2, 1),
+            "is_public": False,
+        },
+    )
+
+    response = await client.get(EXPORT_URL, headers=admin_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["name"] for row in rows if row["name"].startswith(prefix)] == [
+        f"{prefix} old",
+        f"{prefix} private",
+        f"{prefix} new",
+    ]
+    assert {"id", "slug", "content", "tags"} <= set(rows[0])
+
+
+async def test_export_selected_fields_updated_since(
+    client: httpx.AsyncClient,
+    admin_headers: dict[str, str],
+    add_recipes: Callable[..., Awaitable[None]],
+) -> None:
+    await add_recipes(
+        {"name": "Old", "updated_at": datetime(2024, 1, 1)},
+        {"name": "New", "updated_at": datetime(2024, 3, 1)},
+    )
+
+    response = await client.get(
+        EXPORT_URL,
+        params={"fields": ["name,slug", "tags"], "updated_since": "2024-02-01T00:00Z"},
+        headers=admin_headers,
+    )
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["name"] for row in rows] == ["New"]
+    assert set(rows[0]) == {"name", "slug", "tags"}
+
+
+async def test_export_rejects_unknown_fields(
+    client: httpx.AsyncClient, admin_headers: dict[str, str]
+) -> None:
+    response = await client.get(
+        EXPORT_URL, params={"fields": "name,secret"}, headers=admin_headers
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown fields: secret"
+
+
+async def test_export_is_admin_only(
+    client: httpx.AsyncClient, user_headers: dict[str, str]
+) -> None:
+    assert (await client.get(EXPORT_URL)).status_code == 401
+    assert (await client.get(EXPORT_URL, headers=user_headers)).status_code == 403
+
+
+@pytest.mark.performance
+def test_export_benchmark(
+    benchmark: BenchmarkFixture,
+    event_loop: asyncio.AbstractEventLoop,
+    client: httpx.AsyncClient,
+    admin_headers: dict[str, str],
+    seed_recipes: Callable[[int], Awaitable[None]],
+) -> None:
+    benchmark.group = "export 100k recipes as NDJSON"
+    event_loop.run_until_complete(seed_recipes(100_000))
+
+    async def export() -> int:
+        lines = 0
+        async with client.stream("GET", EXPORT_URL, headers=admin_headers) as response:
+            async for chunk in response.aiter_bytes():
+                lines += chunk.count(b"\n")
+        return lines
+
+    lines = benchmark.pedantic(
+        lambda: event_loop.run_until_complete(export()), rounds=3
+    )
+    assert lines == 100_000
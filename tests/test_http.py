@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+from cookbook.api.recipes import get_recipe_detail
+from cookbook.core.http import is_not_modified, revalidates_by_date
+from cookbook.crud.recipe import recipe_cache
+
+LAST_MODIFIED = datetime(2024, 5, 1, 12, 0)
+AFTER = "Thu, 02 May 2024 12:00:00 GMT"
+
+
+def make_request(**headers: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "headers": [
+            (name.replace("_", "-").encode(), value.encode())
+            for name, value in headers.items()
+        ],
+    })
+
+
+@pytest.mark.unit
+def test_revalidates_by_date_only_without_entity_tags() -> None:
+    assert revalidates_by_date(make_request(if_modified_since=AFTER))
+    assert not revalidates_by_date(
+        make_request(if_modified_since=AFTER, if_none_match='"abc"')
+    )
+    assert not revalidates_by_date(make_request())
+
+
+@pytest.mark.unit
+def test_if_none_match_takes_precedence() -> None:
+    request = make_request(if_modified_since=AFTER, if_none_match='"abc"')
+
+    assert not is_not_modified(request, last_modified=LAST_MODIFIED)
+    assert is_not_modified(request, etag='"abc"', last_modified=LAST_MODIFIED)
+
+
+@pytest.mark.database
+async def test_recipe_detail_revalidation_with_entity_tags(
+    db: AsyncSession,
+    add_recipes: Callable[..., Awaitable[None]],
+) -> None:
+    plain, conditional = f"dish-{uuid4().hex}", f"dish-{uuid4().hex}"
+    await add_recipes(
+        *(
+            {"slug": slug, "tags": [], "notes": [], "tips": []}
+            for slug in (plain, conditional)
+        )
+    )
+    engine = db.bind.engine.sync_engine
+
+    async def count_queries(request: Request, slug: str) -> int:
+        statements: list[object] = []
+
+        def record(*args: object) -> None:
+            statements.append(args)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = await get_recipe_detail(slug, request, db)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        assert response.status_code == 200
+        return len(statements)
+
+    # A browser sends both validators, so the date alone cannot answer the
+    # request and looking up updated_at first would be a wasted query
+    assert await count_queries(
+        make_request(if_modified_since=AFTER, if_none_match='"stale"'), conditional
+    ) == await count_queries(make_request(), plain)
+
+
+@pytest.mark.database
+@pytest.mark.parametrize(
+    "path", ["/api/recipes/", "/api/recipes/categories", "/api/recipes/editor/schema"]
+)
+async def test_read_endpoints_answer_matching_etags(
+    client: httpx.AsyncClient,
+    add_recipes: Callable[..., Awaitable[None]],
+    path: str,
+) -> None:
+    await add_recipes({"category": "soup"})
+
+    response = await client.get(path)
+    etag = response.headers["ETag"]
+    revalidated = await client.get(path, headers={"If-None-Match": f"W/{etag}"})
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"]
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+    assert revalidated.content == b""
+
+
+@pytest.mark.database
+async def test_recipe_detail_revalidation_by_date(
+    client: httpx.AsyncClient, add_recipes: Callable[..., Awaitable[None]]
+) -> None:
+    slug = f"dish-{uuid4().hex}"
+    await add_recipes({
+        "slug": slug,
+        "tags": [],
+        "notes": [],
+        "tips": [],
+        "updated_at": LAST_MODIFIED,
+    })
+    url = f"/api/recipes/{slug}"
+
+    response = await client.get(url)
+    assert response.headers["Last-Modified"] == "Wed, 01 May 2024 12:00:00 GMT"
+
+    cached = await client.get(url, headers={"If-Modified-Since": AFTER})
+    assert cached.status_code == 304
+    # Without a cached copy, only updated_at is looked up
+    await recipe_cache.delete(f"slug:{slug}")
+    revalidated = await client.get(url, headers={"If-Modified-Since": AFTER})
+    assert revalidated.status_code == 304
+    stale = await client.get(
+        url, headers={"If-Modified-Since": "Tue, 30 Apr 2024 12:00:00 GMT"}
+    )
+    assert stale.status_code == 200
+    missing = await client.get(
+        "/api/recipes/no-such-dish", headers={"If-Modified-Since": AFTER}
+    )
+    assert missing.status_code == 404
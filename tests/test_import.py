@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import io
+import json
+import typing
+import zipfile
+
+import httpx
+import pytest
+
+from cookbook.api import recipes
+
+pytestmark = [pytest.mark.database, pytest.mark.recipe]
+
+IMPORT_URL = "/api/recipes/import"
+
+
+def recipe_file(name: str, category: str = "soup") -> bytes:
+    return (
+        f"---\nname: {name}\ncategory: {category}\n---\n\n## Ingredients\n\n- 1 leek\n"
+    ).encode()
+
+
+def archive(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+async def post_import(
+    client: httpx.AsyncClient,
+    headers: dict[str, str],
+    files: list[tuple[str, bytes]],
+) -> list[dict[str, typing.Any]]:
+    response = await client.post(
+        IMPORT_URL,
+        files=[("files", (name, content)) for name, content in files],
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+async def test_import_files_and_archives(
+    client: httpx.AsyncClient,
+    admin_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(recipes, "IMPORT_CHUNK_SIZE", 2)
+
+    lines = await post_import(
+        client,
+        admin_headers,
+        [
+            ("leek.md", recipe_file("Leek soup")),
+            ("notes.txt", b"not a recipe"),
+            (
+                "more.zip",
+                archive({
+                    "a/pea.md": recipe_file("Pea soup"),
+                    "a/bean.markdown": recipe_file("Bean soup"),
+                    "a/README": b"skipped",
+                    "a/broken.md": b"---\nname: [unclosed\n---\n",
+                }),
+            ),
+            ("bad.zip", b"not a zip"),
+            ("latin1.md", "name: Crêpe".encode("latin-1")),
+        ],
+    )
+
+    assert lines[-1] == {"summary": {"created": 3, "failed": 4}}
+    results = {line["file"]: line for line in lines[:-1]}
+    assert results["leek.md"]["recipe_slug"] == "leek-soup"
+    assert results["more.zip/a/pea.md"]["status"] == "created"
+    assert results["more.zip/a/bean.markdown"]["recipe_name"] == "Bean soup"
+    assert results["notes.txt"]["error"] == "Unsupported file format"
+    assert results["bad.zip"]["error"] == "Invalid zip archive"
+    assert results["latin1.md"]["error"] == "File is not valid UTF-8"
+    assert results["more.zip/a/broken.md"]["error"].startswith("Invalid Markdown")
+    detail = await client.get("/api/recipes/pea-soup")
+    assert detail.json()["category"] == "soup"
+
+
+async def test_import_rejects_oversized_files(
+    client: httpx.AsyncClient,
+    admin_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(recipes.settings, "max_file_size", 10)
+
+    lines = await post_import(
+        client,
+        admin_headers,
+        [
+            ("leek.md", recipe_file("Leek soup")),
+            ("soups.zip", archive({"pea.md": recipe_file("Pea soup")})),
+        ],
+    )
+
+    assert [line.get("error") for line in lines[:-1]] == ["File too large"] * 2
+
+
+async def test_import_reports_recipes_the_database_refuses(
+    client: httpx.AsyncClient, admin_headers: dict[str, str]
+) -> None:
+    lines = await post_import(
+        client,
+        admin_headers,
+        [
+            ("leek.md", recipe_file("Leek soup")),
+            ("long.md", recipe_file("Long soup", category="x" * 60)),
+        ],
+    )
+
+    assert [line.get("status") for line in lines[:-1]] == ["created", "error"]
+    assert lines[1]["error"].startswith("Error creating recipe")
+    assert (await client.get("/api/recipes/leek-soup")).status_code == 200
+
+
+async def test_import_is_admin_only(
+    client: httpx.AsyncClient, user_headers: dict[str, str]
+) -> None:
+    response = await client.post(
+        IMPORT_URL,
+        files=[("files", ("leek.md", recipe_file("Leek soup")))],
+        headers=user_headers,
+    )
+
+    assert response.status_code == 403
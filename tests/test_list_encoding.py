@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+
+import pytest
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cookbook.crud.recipe import get_recipes
+from cookbook.models import Recipe
+from cookbook.schemas.recipe import RecipeListItem, RecipeListParams
+
+pytestmark = [pytest.mark.database, pytest.mark.recipe]
+
+SeedRecipes = Callable[[int], Awaitable[None]]
+
+_list_items = TypeAdapter(list[RecipeListItem])
+
+
+async def orm_page(db: AsyncSession, limit: int) -> bytes:
+    """How list pages were built before: ORM instances validated into models."""
+    result = await db.execute(
+        select(Recipe)
+        .where(Recipe.is_public)
+        .order_by(desc(Recipe.created_at), desc(Recipe.id))
+        .limit(limit)
+    )
+    recipes = [
+        RecipeListItem.model_validate(recipe, from_attributes=True)
+        for recipe in result.scalars()
+    ]
+    return _list_items.dump_json(recipes)
+
+
+async def core_page(db: AsyncSession, limit: int) -> bytes:
+    page = await get_recipes(db, RecipeListParams(limit=limit), public_only=True)
+    return to_json(page.recipes)
+
+
+async def test_core_rows_encode_like_list_items(
+    db: AsyncSession, seed_recipes: SeedRecipes
+) -> None:
+    await seed_recipes(150)
+
+    core = json.loads(await core_page(db, 100))
+
+    assert len(core) == 100
+    assert core == json.loads(await orm_page(db, 100))
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="list page of 100, CPU time", timer=time.process_time)
+@pytest.mark.parametrize("method", ["orm", "core"])
+def test_list_page_benchmark(
+    benchmark: BenchmarkFixture,
+    event_loop: asyncio.AbstractEventLoop,
+    db: AsyncSession,
+    seed_recipes: SeedRecipes,
+    method: str,
+) -> None:
+    event_loop.run_until_complete(seed_recipes(1000))
+    page = orm_page if method == "orm" else core_page
+
+    body = benchmark.pedantic(
+        lambda: event_loop.run_until_complete(page(db, 100)), rounds=50
+    )
+    assert len(json.loads(body)) == 100
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import typing
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cookbook.crud import recipe as crud
+from cookbook.models import Recipe
+from cookbook.schemas.recipe import RecipeListItem, RecipeSearchParams
+
+pytestmark = [pytest.mark.unit, pytest.mark.performance]
+
+# Columns only the full recipe view needs; list routes must never read them
+BODY_COLUMNS = ("content", "ingredients_json", "instructions_json", "changelog")
+
+
+class _EmptyResult:
+    @staticmethod
+    def all() -> list[typing.Any]:
+        return []
+
+    @staticmethod
+    def scalar() -> int:
+        return 0
+
+    @staticmethod
+    def scalar_one_or_none() -> None:
+        return None
+
+
+class _RecordingSession:
+    """Stands in for an AsyncSession, keeping what it is asked to execute."""
+
+    def __init__(self) -> None:
+        self.statements: list[typing.Any] = []
+
+    async def execute(self, statement: typing.Any) -> _EmptyResult:
+        self.statements.append(statement)
+        return _EmptyResult()
+
+
+def _sql(statement: typing.Any) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+ListRoute = Callable[[AsyncSession], Awaitable[object]]
+
+LIST_ROUTES: dict[str, ListRoute] = {
+    "get_recipes": lambda db: crud.get_recipes(db, public_only=True),
+    "get_recipes_by_category": lambda db: crud.get_recipes_by_category(db, "soup"),
+    "get_featured_recipes": crud.get_featured_recipes,
+    "get_recent_recipes": crud.get_recent_recipes,
+    "search_recipes": lambda db: crud.search_recipes(
+        db, RecipeSearchParams(q="chicken soup", fuzzy=True, tags=["quick"])
+    ),
+    "search_recipes_by_time": lambda db: crud.search_recipes(
+        db, RecipeSearchParams(sort="total_time", count="cached")
+    ),
+}
+
+
+@pytest.mark.parametrize("route", LIST_ROUTES.values(), ids=LIST_ROUTES.keys())
+async def test_list_routes_select_only_list_item_columns(route: ListRoute) -> None:
+    db = _RecordingSession()
+
+    await route(typing.cast(AsyncSession, db))
+
+    assert db.statements
+    for statement in db.statements:
+        sql = _sql(statement)
+        for column in BODY_COLUMNS:
+            assert f"recipes.{column}" not in sql
+    page_query = db.statements[0]
+    fields = list(RecipeListItem.model_fields)
+    assert list(page_query.selected_columns.keys())[: len(fields)] == fields
+
+
+def test_body_columns_are_deferred_by_default() -> None:
+    sql = _sql(select(Recipe))
+
+    assert "recipes.name" in sql
+    for column in BODY_COLUMNS:
+        assert f"recipes.{column}" not in sql
+
+
+async def test_detail_route_loads_the_body() -> None:
+    db = _RecordingSession()
+
+    await crud.get_recipe(typing.cast(AsyncSession, db), uuid4())
+
+    [statement] = db.statements
+    sql = _sql(statement)
+    for column in BODY_COLUMNS:
+        assert f"recipes.{column}" in sql
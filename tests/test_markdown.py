@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import random
+import re
+import typing
+from unittest.mock import patch
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import frontmatter
+from cookbook.core.markdown import (
+    MarkdownRecipeParser,
+    parse_markdown_recipe,
+    split_frontmatter,
+)
+from cookbook.schemas.recipe import RecipeCreate
+
+pytestmark = [pytest.mark.unit, pytest.mark.markdown]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        pytest.param(
+            "---\nname: Soup\ntags: [hot, quick]\n---\n## Ingredients\n\n- water\n",
+            id="yaml",
+        ),
+        pytest.param("\n\n  ---\nname: Soup\n---\n\nBody\n\n", id="surrounding-space"),
+        pytest.param("-----  \nname: Soup\n---   \nBody", id="long-fences"),
+        pytest.param("---\r\nname: Soup\r\n---\r\nBody\r\n", id="crlf"),
+        pytest.param("---\nname: Soup\n---\nIntro\n\n---\n\nMore", id="body-rule"),
+        pytest.param("---\n---\nBody", id="empty-header"),
+        pytest.param("---\nname: Soup\nBody without a closing fence", id="unclosed"),
+        pytest.param("---\n- a\n- b\n---\nBody", id="yaml-list"),
+        pytest.param("---\njust a string\n---\nBody", id="yaml-scalar"),
+        pytest.param("---\n42\n---\nBody", id="yaml-number"),
+        pytest.param("# Soup\n\nNo frontmatter at all", id="no-frontmatter"),
+        pytest.param("", id="empty"),
+        pytest.param('+++\nname = "Soup"\n+++\nBody', id="toml"),
+        pytest.param('{\n"name": "Soup"\n}\nBody', id="json"),
+    ],
+)
+def test_split_frontmatter_matches_python_frontmatter(text: str) -> None:
+    assert split_frontmatter(text) == frontmatter.parse(text)
+
+
+WORDS = [
+    "salt",
+    "butter",
+    "flour",
+    "crème",
+    "brûlée",
+    "日本",
+    "lemon",
+    "garlic",
+    "basil",
+]
+DURATIONS = [
+    5,
+    45,
+    "15 minutes",
+    "1 hour",
+    "1.5 hours",
+    "2h",
+    "1 hours 30 minutes",
+    "90 mins",
+    "3 hrs 5 min",
+    "soon",
+    "",
+]
+
+
+def recipe_corpus(size: int) -> list[str]:
+    """Markdown recipes as exported, and as hand-written with looser fences."""
+    rng = random.Random(size)
+
+    def words(count: int) -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(count))
+
+    corpus = []
+    for index in range(size):
+        content = (
+            "## Ingredients\n\n"
+            + "\n".join(f"- {words(3)}" for _ in range(rng.randint(1, 12)))
+            + "\n\n## Instructions\n\n"
+            + "\n".join(f"{step}. {words(10)}" for step in range(1, rng.randint(2, 9)))
+        )
+        tags = rng.sample(WORDS, rng.randint(0, 4))
+        if index % 2:
+            corpus.append(
+                MarkdownRecipeParser.generate_markdown({
+                    "name": words(3).title(),
+                    "description": words(8),
+                    "servings": str(rng.randint(1, 12)),
+                    "prep_time": rng.choice([None, 10, 75]),
+                    "cook_time": rng.choice([None, 30, 95, 120]),
+                    "difficulty": rng.choice(["easy", "medium", "hard"]),
+                    "cuisine": rng.choice(["french", "thai", None]),
+                    "category": "dessert",
+                    "tags": tags,
+                    "notes": [words(5)],
+                    "tips": [],
+                    "is_public": rng.random() < 0.8,
+                    "is_featured": rng.random() < 0.1,
+                    "language": "en",
+                    "content": content,
+                })
+            )
+        else:
+            corpus.append(
+                f"\n  ---  \nname: {words(2)}\n"
+                f"prep_time: {rng.choice(DURATIONS)!r}\n"
+                f"cook_time: {rng.choice(DURATIONS)}\n"
+                f"tags: {', '.join(tags)}\n"
+                f"makes: {words(2)}\n"
+                "-----\n\n"
+                f"{content}\n\n---\n\nServe warm.\n"
+            )
+    return corpus
+
+
+def legacy_duration(value: typing.Any) -> int | None:
+    """parse_duration as it was before its patterns were precompiled."""
+    if not value:
+        return None
+    if isinstance(value, int):
+        return value
+    text = str(value).lower().strip()
+    parts = re.findall(r"(\d+(?:\.\d+)?)\s*(minutes?|mins?|hours?|hrs?|h)\b", text)
+    hours = {"hours", "hour", "hrs", "hr", "h"}
+    if len(parts) > 1:
+        return sum(
+            int(float(number) * 60) if unit in hours else int(float(number))
+            for number, unit in parts
+        )
+    match = re.match(r"(\d+(?:\.\d+)?)\s*(minutes?|mins?|hours?|hrs?|h)?", text)
+    if not match:
+        return None
+    minutes = float(match.group(1))
+    return int(minutes * 60) if match.group(2) in hours else int(minutes)
+
+
+def legacy_parse(text: str) -> RecipeCreate:
+    """The python-frontmatter path parse_recipe took before."""
+    post = frontmatter.loads(text)
+    return MarkdownRecipeParser.recipe_from_parts(post.metadata, post.content)
+
+
+def test_single_pass_parse_matches_python_frontmatter() -> None:
+    corpus = recipe_corpus(400)
+    with patch.object(MarkdownRecipeParser, "parse_duration", legacy_duration):
+        expected = [legacy_parse(text) for text in corpus]
+
+    for text, recipe in zip(corpus, expected, strict=True):
+        assert parse_markdown_recipe(text).recipe == recipe, text
+    for value in DURATIONS:
+        assert MarkdownRecipeParser.parse_duration(value) == legacy_duration(value)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="parse 10k files")
+@pytest.mark.parametrize("path", ["python-frontmatter", "split_frontmatter"])
+def test_parse_corpus_benchmark(benchmark: BenchmarkFixture, path: str) -> None:
+    corpus = recipe_corpus(10_000)
+
+    def parse_all() -> None:
+        if path == "python-frontmatter":
+            with patch.object(MarkdownRecipeParser, "parse_duration", legacy_duration):
+                for text in corpus:
+                    legacy_parse(text)
+        else:
+            for text in corpus:
+                MarkdownRecipeParser.parse_recipe(text)
+
+    benchmark.pedantic(parse_all, rounds=3)
+
+
+def test_generate_markdown_from_structured_data() -> None:
+    text = MarkdownRecipeParser.generate_markdown({
+        "name": "Bread",
+        "description": "Crusty",
+        "prep_time": 30,
+        "cook_time": 150,
+        "tags": ["baking"],
+        "ingredients": [{"part": "Dough", "list": ["flour", "water"]}, "salt"],
+        "instructions": [{"part": "Shape", "list": ["Knead", "Rest"]}, "Bake"],
+        "notes": ["Keeps a week", ""],
+        "tips": ["Use steam"],
+    })
+
+    post = frontmatter.loads(text)
+    assert post.metadata["prep_time"] == "30 minutes"
+    assert post.metadata["cook_time"] == "2 hours 30 minutes"
+    assert post.content == (
+        "Crusty\n\n"
+        "## Ingredients\n\n### Dough\n- flour\n- water\n- salt\n\n"
+        "## Instructions\n\n### Shape\n1. Knead\n2. Rest\n3. Bake\n\n"
+        "## Notes\n\n- Keeps a week\n\n## Tips\n\n- Use steam"
+    )
+    parsed = parse_markdown_recipe(text)
+    assert parsed.errors == []
+    assert parsed.recipe is not None
+    assert (parsed.recipe.prep_time, parsed.recipe.cook_time) == (30, 150)
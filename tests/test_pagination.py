@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from cookbook.core.pagination import decode_cursor, encode_cursor
+
+pytestmark = pytest.mark.unit
+
+TYPES = [float, bool, datetime, UUID]
+
+
+def _raw_cursor(values: list[object]) -> str:
+    raw = json.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def test_round_trip() -> None:
+    values = [0.5, True, datetime(2026, 1, 2, 3, 4, 5), uuid4()]
+    assert decode_cursor(encode_cursor(values), types=TYPES) == values
+
+
+def test_null_sort_keys_are_kept() -> None:
+    values = [0.5, None, datetime(2026, 1, 2), uuid4()]
+    assert decode_cursor(encode_cursor(values), types=TYPES) == values
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        _raw_cursor(["x", "y"]),
+        _raw_cursor([1, True, {"$dt": "2026-01-02T00:00:00"}]),
+        _raw_cursor([
+            "x",
+            True,
+            {"$dt": "2026-01-02T00:00:00"},
+            {"$uuid": str(uuid4())},
+        ]),
+        _raw_cursor([1, 1, {"$dt": "2026-01-02T00:00:00"}, {"$uuid": str(uuid4())}]),
+        _raw_cursor([1, True, {"$dt": 5}, {"$uuid": str(uuid4())}]),
+        _raw_cursor([1, True, {"$dt": "yesterday"}, {"$uuid": str(uuid4())}]),
+        _raw_cursor([1, True, {"$dt": "2026-01-02T00:00:00"}, {"$uuid": "nope"}]),
+        _raw_cursor([1, True, {"$dt": "2026-01-02T00:00:00"}, str(uuid4())]),
+    ],
+)
+def test_tampered_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, types=TYPES)
+
+
+def test_aware_timestamps_are_rejected() -> None:
+    cursor = encode_cursor([datetime(2026, 1, 2, tzinfo=UTC)])
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, types=[datetime])
+
+
+def test_integers_must_fit_int4() -> None:
+    assert decode_cursor(encode_cursor([2**31 - 1]), types=[int]) == [2**31 - 1]
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(encode_cursor([2**31]), types=[int])
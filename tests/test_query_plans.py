@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import typing
+from collections.abc import Awaitable, Callable
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cookbook.crud import recipe as crud
+from cookbook.schemas.recipe import RecipeListParams, RecipeSearchParams
+
+pytestmark = pytest.mark.database
+
+Read = Callable[[AsyncSession], Awaitable[typing.Any]]
+
+
+def search(**params: typing.Any) -> Read:
+    search_params = RecipeSearchParams(**params)
+    return lambda db: crud.search_recipes(db, search_params)
+
+
+# The read queries behind the public endpoints, with typical arguments
+PLAN_CASES: dict[str, Read] = {
+    "list": lambda db: crud.get_recipes(db, public_only=True),
+    "list featured": lambda db: crud.get_recipes(
+        db, RecipeListParams(featured_only=True), public_only=True
+    ),
+    "featured": crud.get_featured_recipes,
+    "recent": crud.get_recent_recipes,
+    "category": lambda db: crud.get_recipes_by_category(db, "main"),
+    "detail by slug": lambda db: crud.get_recipe_by_slug(db, "pancakes"),
+    "search text": search(q="chicken soup"),
+    "search fuzzy": search(q="chiken", fuzzy=True),
+    "search category": search(category="main"),
+    "search cuisine": search(cuisine="italian"),
+    "search difficulty": search(difficulty="easy"),
+    "search tags": search(tags=["vegetarian"]),
+    "search max_total_time": search(max_total_time=30),
+    "search sort total_time": search(sort="total_time"),
+}
+
+
+def seq_scans(plan: dict[str, typing.Any]) -> list[str]:
+    """Relations read by a sequential scan anywhere in an EXPLAIN JSON plan."""
+    found = [plan["Relation Name"]] if plan["Node Type"] == "Seq Scan" else []
+    for child in plan.get("Plans", ()):
+        found.extend(seq_scans(child))
+    return found
+
+
+@pytest.fixture
+async def seeded(
+    db: AsyncSession, add_recipes: Callable[..., Awaitable[None]]
+) -> AsyncSession:
+    categories = ["main", "dessert", "soup", "bread"]
+    await add_recipes(
+        *(
+            {
+                "name": f"Chicken soup {index}" if index % 7 == 0 else f"Dish {index}",
+                "category": categories[index % len(categories)],
+                "cuisine": "italian" if index % 5 == 0 else "thai",
+                "difficulty": "easy" if index % 3 == 0 else "hard",
+                "tags": ["vegetarian"] if index % 4 == 0 else ["meat"],
+                "prep_time": index % 60,
+                "cook_time": index % 90,
+                "is_public": index % 10 != 0,
+                "is_featured": index % 50 == 0,
+            }
+            for index in range(500)
+        )
+    )
+    await db.execute(text("ANALYZE recipes"))
+    return db
+
+
+@pytest.mark.parametrize("name", PLAN_CASES)
+async def test_read_path_uses_indexes(seeded: AsyncSession, name: str) -> None:
+    if "fuzzy" in name:
+        installed = await seeded.scalar(text("SELECT to_regproc('similarity')"))
+        if installed is None:
+            pytest.skip("pg_trgm is not installed")
+
+    conn = await seeded.connection()
+    # With sequential scans priced out, one only shows up where no index can
+    # serve the query, so the check does not depend on table sizes
+    await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+
+    statements: list[tuple[str, typing.Any]] = []
+
+    def record(**event_args: typing.Any) -> None:
+        statements.append((event_args["statement"], event_args["parameters"]))
+
+    event.listen(conn.sync_connection, "before_cursor_execute", record, named=True)
+    try:
+        await PLAN_CASES[name](seeded)
+    finally:
+        event.remove(conn.sync_connection, "before_cursor_execute", record)
+
+    scans = []
+    for statement, parameters in statements:
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        )
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        scans.extend(seq_scans(plan[0]["Plan"]))
+    assert statements
+    assert scans == []
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import typing
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cookbook.crud.recipe import bulk_update_recipes
+from cookbook.models import Recipe
+from cookbook.schemas.recipe import RecipeBulkOperation
+
+pytestmark = pytest.mark.database
+
+
+async def test_bulk_retag(
+    db: AsyncSession, add_recipes: Callable[..., Awaitable[None]]
+) -> None:
+    ids = [uuid4(), uuid4(), uuid4()]
+    await add_recipes(
+        {"id": ids[0], "tags": ["old", "soup", "vegan"]},
+        {"id": ids[1], "tags": None},
+        {"id": ids[2], "tags": ["old"]},
+    )
+
+    updated = await bulk_update_recipes(
+        db,
+        RecipeBulkOperation(ids=ids, add_tags=["vegan", "quick"], remove_tags=["old"]),
+    )
+
+    assert {recipe_id for recipe_id, _ in updated} == set(ids)
+    result = await db.execute(select(Recipe.id, Recipe.tags).where(Recipe.id.in_(ids)))
+    assert dict(result.tuples().all()) == {
+        ids[0]: ["soup", "vegan", "quick"],
+        ids[1]: ["vegan", "quick"],
+        ids[2]: ["vegan", "quick"],
+    }
+
+
+BULK_URL = "/api/recipes/bulk"
+
+
+async def test_bulk_publish_by_filter(
+    client: httpx.AsyncClient,
+    admin_headers: dict[str, str],
+    add_recipes: Callable[..., Awaitable[None]],
+) -> None:
+    category = uuid4().hex[:20]
+    await add_recipes(
+        {"category": category, "difficulty": "easy", "is_public": False},
+        {"category": category, "difficulty": "hard", "is_public": False},
+        {"category": "other", "difficulty": "easy", "is_public": False},
+    )
+
+    response = await client.post(
+        BULK_URL,
+        json={
+            "filter": {"category": category, "difficulty": "easy"},
+            "is_public": True,
+            "is_featured": True,
+            "category": "soup",
+        },
+        headers=admin_headers,
+    )
+
+    assert response.json() == {"affected": 1}
+    featured = (await client.get("/api/recipes/featured")).json()
+    assert [recipe["category"] for recipe in featured] == ["soup"]
+
+
+async def test_bulk_delete_by_ids(
+    client: httpx.AsyncClient,
+    admin_headers: dict[str, str],
+    add_recipes: Callable[..., Awaitable[None]],
+) -> None:
+    ids = [uuid4(), uuid4()]
+    lists = {"tags": [], "notes": [], "tips": []}
+    await add_recipes({"id": ids[0], **lists}, {"id": ids[1], **lists})
+
+    response = await client.post(
+        BULK_URL,
+        json={"ids": [str(ids[0])], "delete": True},
+        headers=admin_headers,
+    )
+
+    assert response.json() == {"affected": 1}
+    assert (await client.get(f"/api/recipes/{ids[0]}")).status_code == 404
+    assert (await client.get(f"/api/recipes/{ids[1]}")).status_code == 200
+
+
+@pytest.mark.parametrize(
+    ("operation", "detail"),
+    [
+        pytest.param({"is_public": True}, "Select recipes by either ids", id="none"),
+        pytest.param(
+            {"ids": [], "filter": {"category": "soup"}, "is_public": True},
+            "Select recipes by either ids",
+            id="both",
+        ),
+        pytest.param(
+            {"filter": {}, "is_public": True}, "at least one criterion", id="empty"
+        ),
+        pytest.param({"ids": []}, "Nothing to change", id="no-change"),
+        pytest.param(
+            {"ids": [], "add_tags": ["a"], "remove_tags": ["a"]},
+            "both added and removed",
+            id="tag-clash",
+        ),
+        pytest.param(
+            {"ids": [], "delete": True, "is_public": True},
+            "cannot change recipes",
+            id="delete-and-change",
+        ),
+    ],
+)
+async def test_bulk_rejects_bad_operations(
+    client: httpx.AsyncClient,
+    admin_headers: dict[str, str],
+    operation: dict[str, typing.Any],
+    detail: str,
+) -> None:
+    response = await client.post(BULK_URL, json=operation, headers=admin_headers)
+
+    assert response.status_code == 400
+    assert detail in response.json()["detail"]
+
+
+async def test_bulk_is_admin_only(
+    client: httpx.AsyncClient, user_headers: dict[str, str]
+) -> None:
+    response = await client.post(
+        BULK_URL, json={"ids": [], "is_public": True}, headers=user_headers
+    )
+
+    assert response.status_code == 403
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import typing
+
+import httpx
+import pytest
+
+pytestmark = [pytest.mark.database, pytest.mark.recipe]
+
+RECIPES_URL = "/api/recipes/"
+
+
+async def create(
+    client: httpx.AsyncClient, headers: dict[str, str], **fields: typing.Any
+) -> dict[str, typing.Any]:
+    response = await client.post(
+        RECIPES_URL, json={"name": "Leek soup", **fields}, headers=headers
+    )
+    assert response.status_code == 200
+    return typing.cast(dict[str, typing.Any], response.json())
+
+
+async def test_update_bumps_version_and_moves_slug(
+    client: httpx.AsyncClient, user_headers: dict[str, str]
+) -> None:
+    recipe = await create(client, user_headers, tags=["soup"])
+    assert recipe["version"] == 1
+
+    response = await client.put(
+        f"{RECIPES_URL}{recipe['id']}",
+        json={"name": "Potato soup", "tags": ["soup", "winter"], "version": 1},
+        headers=user_headers,
+    )
+
+    assert response.status_code == 200
+    updated = response.json()
+    assert updated["version"] == 2
+    assert updated["slug"] == "potato-soup"
+    assert updated["tags"] == ["soup", "winter"]
+    detail = await client.get(f"{RECIPES_URL}potato-soup")
+    assert detail.json()["version"] == 2
+    assert (await client.get(f"{RECIPES_URL}{recipe['slug']}")).status_code == 404
+
+
+async def test_update_keeps_a_fitting_slug(
+    client: httpx.AsyncClient, user_headers: dict[str, str]
+) -> None:
+    await create(client, user_headers)
+    second = await create(client, user_headers)
+    assert second["slug"] == "leek-soup-1"
+
+    response = await client.put(
+        f"{RECIPES_URL}{second['id']}",
+        json={"name": "Leek Soup", "description": "Creamy"},
+        headers=user_headers,
+    )
+
+    assert response.json()["slug"] == "leek-soup-1"
+
+
+async def test_stale_update_conflicts(
+    client: httpx.AsyncClient, user_headers: dict[str, str]
+) -> None:
+    recipe = await create(client, user_headers)
+    url = f"{RECIPES_URL}{recipe['id']}"
+    await client.put(url, json={"servings": "4"}, headers=user_headers)
+
+    response = await client.put(
+        url, json={"servings": "6", "version": 1}, headers=user_headers
+    )
+
+    assert response.status_code == 409
+    assert response.json()["detail"]["version"] == 2
+
+
+async def test_only_author_or_admin_may_edit(
+    client: httpx.AsyncClient,
+    user_headers: dict[str, str],
+    admin_headers: dict[str, str],
+) -> None:
+    recipe = await create(client, admin_headers)
+    url = f"{RECIPES_URL}{recipe['id']}"
+
+    response = await client.put(url, json={"servings": "2"}, headers=user_headers)
+    assert response.status_code == 403
+    assert (await client.delete(url, headers=user_headers)).status_code == 403
+
+    mine = await create(client, user_headers)
+    response = await client.put(
+        f"{RECIPES_URL}{mine['id']}", json={"servings": "2"}, headers=admin_headers
+    )
+    assert response.status_code == 200
+
+
+async def test_missing_recipe_is_not_found(
+    client: httpx.AsyncClient, user_headers: dict[str, str]
+) -> None:
+    url = f"{RECIPES_URL}00000000-0000-0000-0000-000000000000"
+
+    response = await client.put(url, json={"servings": "2"}, headers=user_headers)
+    assert response.status_code == 404
+    assert (await client.delete(url, headers=user_headers)).status_code == 404
+
+
+async def test_delete_checks_version(
+    client: httpx.AsyncClient, user_headers: dict[str, str]
+) -> None:
+    recipe = await create(client, user_headers, tags=["soup"])
+    url = f"{RECIPES_URL}{recipe['id']}"
+    assert (await client.get(url)).status_code == 200
+
+    stale = await client.delete(url, params={"version": 3}, headers=user_headers)
+    assert stale.status_code == 409
+    assert stale.json()["detail"]["version"] == 1
+
+    response = await client.delete(url, params={"version": 1}, headers=user_headers)
+    assert response.status_code == 200
+    assert (await client.get(url)).status_code == 404
+    assert "soup" not in (await client.get(f"{RECIPES_URL}tags")).json()
+
+
+async def test_edits_need_authentication(client: httpx.AsyncClient) -> None:
+    url = f"{RECIPES_URL}00000000-0000-0000-0000-000000000000"
+
+    assert (await client.post(RECIPES_URL, json={"name": "Soup"})).status_code == 401
+    assert (await client.put(url, json={})).status_code == 401
+    assert (await client.delete(url)).status_code == 401
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cookbook.crud.recipe import get_recipes
+from cookbook.schemas.recipe import RecipeListParams
+
+pytestmark = pytest.mark.database
+
+
+async def test_get_recipes_pages_by_cursor(
+    db: AsyncSession, add_recipes: Callable[..., Awaitable[None]]
+) -> None:
+    start = datetime(2024, 5, 1, 12, 0)
+    await add_recipes(
+        *(
+            {"name": f"Dish {day}", "created_at": start + timedelta(days=day)}
+            for day in range(5)
+        )
+    )
+
+    first = await get_recipes(db, RecipeListParams(limit=2))
+    second = await get_recipes(db, RecipeListParams(limit=2, cursor=first.next_cursor))
+    last = await get_recipes(db, RecipeListParams(limit=2, cursor=second.next_cursor))
+    offset = await get_recipes(db, RecipeListParams(limit=2, skip=2))
+
+    pages = [[recipe["name"] for recipe in page.recipes] for page in (first, second)]
+    assert pages == [["Dish 4", "Dish 3"], ["Dish 2", "Dish 1"]]
+    assert [recipe["name"] for recipe in last.recipes] == ["Dish 0"]
+    assert last.next_cursor is None
+    assert offset.recipes == second.recipes
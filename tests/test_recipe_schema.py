@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import typing
+
+import pytest
+import yaml
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import frontmatter
+from cookbook.core.markdown import MarkdownRecipeParser, parse_markdown_recipe
+from cookbook.schemas.recipe_schema import (
+    RECIPE_FRONTMATTER_SCHEMA,
+    FieldError,
+    compile_validator,
+    validate_frontmatter,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.markdown]
+
+strict = compile_validator(RECIPE_FRONTMATTER_SCHEMA)
+
+
+@pytest.mark.parametrize(
+    ("document", "errors"),
+    [
+        pytest.param({"name": "Soup"}, [], id="valid"),
+        pytest.param({}, [FieldError("name", "is required")], id="required"),
+        pytest.param({"name": 3}, [FieldError("name", "must be a string")], id="type"),
+        pytest.param(
+            {"name": "Soup", "difficulty": "extreme"},
+            [FieldError("difficulty", "must be one of: easy, medium, hard")],
+            id="enum",
+        ),
+        pytest.param(
+            {"name": "Soup", "prep_time": "soon"},
+            [FieldError("prep_time", "has an invalid format")],
+            id="pattern",
+        ),
+        pytest.param(
+            {"name": "Soup", "language": "english"},
+            [FieldError("language", "has an invalid format")],
+            id="language-pattern",
+        ),
+        pytest.param(
+            {"name": ""}, [FieldError("name", "must not be empty")], id="min-length"
+        ),
+        pytest.param(
+            {"name": "x" * 201},
+            [FieldError("name", "must be at most 200 characters")],
+            id="max-length",
+        ),
+        pytest.param(
+            {"name": "Soup", "temperature": 900},
+            [FieldError("temperature", "must be at most 600")],
+            id="maximum",
+        ),
+        pytest.param(
+            {"name": "Soup", "cook_time": -5},
+            [FieldError("cook_time", "must be at least 0")],
+            id="minimum",
+        ),
+        pytest.param(
+            {"name": "Soup", "tags": ["hot", 1, "hot"]},
+            [
+                FieldError("tags", "item 2 must be a string"),
+                FieldError("tags", "must not contain duplicates"),
+            ],
+            id="items",
+        ),
+        pytest.param(
+            {"name": "Soup", "prep_time": "1 hour 30 minutes", "tags": "hot"},
+            [],
+            id="type-union",
+        ),
+    ],
+)
+def test_validate_frontmatter(
+    document: dict[str, typing.Any], errors: list[FieldError]
+) -> None:
+    assert validate_frontmatter(document) == errors
+
+
+def test_booleans_are_not_integers() -> None:
+    assert strict({"name": "Soup", "temperature": True}) == [
+        FieldError("temperature", "must be an integer")
+    ]
+    assert strict({"name": "Soup", "public": 1}) == [
+        FieldError("public", "must be true or false")
+    ]
+    assert strict({"name": "Soup", "public": False, "temperature": 180}) == []
+
+
+def test_unknown_fields_only_fail_the_strict_schema() -> None:
+    document = {"name": "Soup", "source": "grandma"}
+
+    assert validate_frontmatter(document) == []
+    assert strict(document) == [FieldError("source", "is not a known field")]
+
+
+def test_frontmatter_must_be_a_mapping() -> None:
+    assert validate_frontmatter(["name"]) == [
+        FieldError("", "Frontmatter must be a mapping of fields")
+    ]
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        pytest.param({"type": "object", "oneOf": []}, id="object-keyword"),
+        pytest.param({"properties": {"a": {"format": "email"}}}, id="field-keyword"),
+        pytest.param({"additionalProperties": {"type": "string"}}, id="additional"),
+    ],
+)
+def test_unsupported_schemas_are_rejected(schema: dict[str, typing.Any]) -> None:
+    with pytest.raises(ValueError, match=r"Unsupported|must be a boolean"):
+        compile_validator(schema)
+
+
+UPLOAD = MarkdownRecipeParser.generate_markdown({
+    "name": "Crème Brûlée",
+    "description": "Rich custard",
+    "servings": "4",
+    "prep_time": 20,
+    "cook_time": 95,
+    "difficulty": "medium",
+    "cuisine": "french",
+    "category": "dessert",
+    "tags": ["custard", "french", "dessert"],
+    "notes": ["Chill overnight"],
+    "tips": ["Use a torch"],
+    "is_public": True,
+    "language": "en",
+    "content": "## Ingredients\n\n- 4 egg yolks\n- 500ml cream\n\n"
+    "## Instructions\n\n1. Whisk\n2. Bake\n" * 5,
+})
+
+
+def validate_then_parse(text: str) -> typing.Any:
+    """What an upload did before: validate (one YAML parse), then parse again."""
+    try:
+        post = frontmatter.loads(text)
+    except yaml.YAMLError:
+        return None
+    metadata = post.metadata
+    if not metadata.get("name"):
+        return None
+    for field in ("prep_time", "cook_time"):
+        if field in metadata and not MarkdownRecipeParser.parse_duration(
+            metadata[field]
+        ):
+            return None
+    if "ingredients" not in post.content.lower():
+        return None
+    return MarkdownRecipeParser.parse_recipe(text)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="upload parse")
+@pytest.mark.parametrize("path", ["validate-then-parse", "single-pass"])
+def test_upload_parse_benchmark(benchmark: BenchmarkFixture, path: str) -> None:
+    if path == "single-pass":
+        parsed = benchmark(parse_markdown_recipe, UPLOAD)
+        assert parsed.errors == []
+    else:
+        assert benchmark(validate_then_parse, UPLOAD) is not None
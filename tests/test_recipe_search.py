@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+from collections.abc import Awaitable, Callable
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy import Select, desc, func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cookbook.config import settings
+from cookbook.crud.recipe import (
+    get_search_facets,
+    get_search_suggestions,
+    search_recipes,
+)
+from cookbook.models import Recipe
+from cookbook.schemas.recipe import RecipeSearchParams
+
+pytestmark = [pytest.mark.database, pytest.mark.recipe]
+
+AddRecipes = Callable[..., Awaitable[None]]
+SeedRecipes = Callable[[int], Awaitable[None]]
+
+
+async def test_search_facets(db: AsyncSession, add_recipes: AddRecipes) -> None:
+    await add_recipes(
+        {"category": "dessert", "tags": ["sweet", "french"], "prep_time": 20},
+        {"category": "dessert", "tags": ["sweet"], "cook_time": 50},
+        {"category": "main", "cuisine": "thai", "tags": [], "prep_time": 90},
+        {"category": "main", "tags": ["sweet"], "is_public": False},
+    )
+
+    facets = await get_search_facets(db, RecipeSearchParams())
+
+    assert facets["category"] == {"dessert": 2, "main": 1}
+    assert facets["cuisine"] == {"thai": 1}
+    assert facets["tags"] == {"sweet": 2, "french": 1}
+    assert facets["total_time"] == {"15": 0, "30": 1, "60": 2, "120": 3}
+
+
+async def test_search_facets_follow_filters(
+    db: AsyncSession, add_recipes: AddRecipes
+) -> None:
+    await add_recipes(
+        {"category": "dessert", "tags": ["sweet", "french"]},
+        {"category": "main", "tags": ["savory"]},
+    )
+
+    facets = await get_search_facets(db, RecipeSearchParams(category="dessert"))
+
+    assert facets["tags"] == {"sweet": 1, "french": 1}
+    assert facets["category"] == {"dessert": 1}
+
+
+async def test_search_sorts_quickest_first(
+    db: AsyncSession, add_recipes: AddRecipes
+) -> None:
+    await add_recipes(
+        {"name": "Stew", "prep_time": 20, "cook_time": 100},
+        {"name": "Salad", "prep_time": 10},
+        {"name": "Toast", "cook_time": 5},
+        {"name": "Mystery"},
+    )
+
+    first = await search_recipes(db, RecipeSearchParams(sort="total_time", limit=2))
+    rest = await search_recipes(
+        db, RecipeSearchParams(sort="total_time", cursor=first.next_cursor)
+    )
+
+    assert first.total == 3
+    assert [(recipe["name"], recipe["total_time"]) for recipe in first.recipes] == [
+        ("Toast", 5),
+        ("Salad", 10),
+    ]
+    assert [recipe["name"] for recipe in rest.recipes] == ["Stew"]
+
+
+async def test_search_count_strategies(
+    db: AsyncSession, add_recipes: AddRecipes, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await add_recipes(*({"category": "soup"} for _ in range(3)))
+    soup = {"category": "soup", "limit": 2}
+
+    exact = await search_recipes(db, RecipeSearchParams(**soup))
+    after_cursor = await search_recipes(
+        db, RecipeSearchParams(cursor=exact.next_cursor, **soup)
+    )
+    past_end = await search_recipes(db, RecipeSearchParams(offset=10, **soup))
+    filled = await search_recipes(db, RecipeSearchParams(count="cached", **soup))
+    await add_recipes({"category": "soup"})
+    cached = await search_recipes(db, RecipeSearchParams(count="cached", **soup))
+    monkeypatch.setattr(settings.cache, "estimate_exact_threshold", 0)
+    estimate = await search_recipes(db, RecipeSearchParams(count="estimate", **soup))
+
+    assert [exact.total, after_cursor.total, past_end.total] == [3, 3, 3]
+    assert (filled.total, filled.total_strategy) == (3, "exact")
+    assert (cached.total, cached.total_strategy) == (3, "cached")
+    assert estimate.total_strategy == "estimate"
+
+
+async def test_fuzzy_search_and_suggestions(
+    db: AsyncSession, add_recipes: AddRecipes
+) -> None:
+    if await db.scalar(text("SELECT to_regproc('similarity')")) is None:
+        pytest.skip("pg_trgm is not installed")
+    await add_recipes(
+        {"name": "Chocolate cake"},
+        {"name": "Carrot soup"},
+        {"name": "Chocolate mousse", "is_public": False},
+    )
+
+    strict = await search_recipes(db, RecipeSearchParams(q="choclate"))
+    fuzzy = await search_recipes(db, RecipeSearchParams(q="choclate", fuzzy=True))
+
+    assert (strict[1], fuzzy[1]) == (0, 1)
+    assert await get_search_suggestions(db, "choclate") == ["Chocolate cake"]
+
+
+def ilike_search(q: str) -> Select[typing.Any]:
+    """The ILIKE '%q%' search that full-text search replaced."""
+    pattern = f"%{q}%"
+    return (
+        select(Recipe)
+        .where(
+            Recipe.is_public,
+            or_(
+                Recipe.name.ilike(pattern),
+                Recipe.description.ilike(pattern),
+                Recipe.content.ilike(pattern),
+            ),
+        )
+        .order_by(desc(Recipe.is_featured), desc(Recipe.created_at))
+        .limit(20)
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "case",
+    [(method, size) for size in (10_000, 100_000) for method in ("ilike", "fts")],
+    ids="{0[0]}-{0[1]}".format,
+)
+def test_search_benchmark(
+    benchmark: BenchmarkFixture,
+    event_loop: asyncio.AbstractEventLoop,
+    db: AsyncSession,
+    seed_recipes: SeedRecipes,
+    case: tuple[str, int],
+) -> None:
+    method, size = case
+    benchmark.group = f"search {size} recipes"
+    event_loop.run_until_complete(seed_recipes(size))
+
+    async def search() -> int:
+        if method == "fts":
+            result = await search_recipes(db, RecipeSearchParams(q="saffron"))
+            return len(result[0])
+        pattern = ilike_search("saffron")
+        total = await db.scalar(
+            select(func.count()).select_from(pattern.order_by(None).limit(None))
+        )
+        assert total
+        return len((await db.execute(pattern)).scalars().all())
+
+    found = benchmark.pedantic(
+        lambda: event_loop.run_until_complete(search()), rounds=10
+    )
+    assert found == 20
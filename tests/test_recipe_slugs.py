@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cookbook.crud.recipe import create_recipe, create_recipes
+from cookbook.models import Recipe
+from cookbook.schemas.recipe import RecipeCreate
+
+pytestmark = pytest.mark.database
+
+
+@pytest.fixture
+def base() -> str:
+    return f"dish-{uuid4().hex[:8]}x"
+
+
+async def test_slugs_skip_past_highest_suffix(
+    db: AsyncSession, add_recipes: Callable[..., Awaitable[None]], base: str
+) -> None:
+    await add_recipes(
+        {"slug": base},
+        {"slug": f"{base}-3"},
+        {"slug": f"{base}-fried"},
+        {"slug": f"{base}x-9"},
+    )
+
+    saved = await create_recipes(db, [RecipeCreate(name=base), RecipeCreate(name=base)])
+
+    assert [recipe.slug for recipe in saved] == [f"{base}-4", f"{base}-5"]
+
+
+async def test_slugs_continue_suffixes_after_free_base(
+    db: AsyncSession, add_recipes: Callable[..., Awaitable[None]], base: str
+) -> None:
+    await add_recipes({"slug": f"{base}-1"})
+
+    saved = await create_recipes(db, [RecipeCreate(name=base)] * 3)
+
+    assert [recipe.slug for recipe in saved] == [base, f"{base}-2", f"{base}-3"]
+
+
+async def test_create_recipes_with_repeated_names(db: AsyncSession, base: str) -> None:
+    await create_recipe(db, RecipeCreate(name=base))
+
+    saved = await create_recipes(db, [RecipeCreate(name=base), RecipeCreate(name=base)])
+
+    assert [recipe.slug for recipe in saved] == [f"{base}-1", f"{base}-2"]
+
+
+async def test_create_recipes_upsert_keeps_input_order(
+    db: AsyncSession, base: str
+) -> None:
+    existing = await create_recipe(db, RecipeCreate(name=base, tags=["old"]))
+
+    saved = await create_recipes(
+        db,
+        [
+            RecipeCreate(name=f"{base}-new"),
+            RecipeCreate(name=base, tags=["new"]),
+            RecipeCreate(name=f"{base}-other"),
+        ],
+        upsert=True,
+    )
+
+    assert saved == [
+        (saved[0].id, f"{base}-new", True),
+        (existing.id, base, False),
+        (saved[2].id, f"{base}-other", True),
+    ]
+
+
+async def probing_create(db: AsyncSession, recipe: RecipeCreate) -> Recipe:
+    """How recipes were created before: one lookup per taken slug suffix."""
+    slug = base_slug = recipe.name.lower().replace(" ", "-")
+    counter = 1
+    while await db.scalar(select(Recipe.id).where(Recipe.slug == slug)):
+        slug = f"{base_slug}-{counter}"
+        counter += 1
+    db_recipe = Recipe(name=recipe.name, slug=slug)
+    db.add(db_recipe)
+    await db.commit()
+    return db_recipe
+
+
+@pytest.mark.performance
+def test_create_same_name_benchmark(
+    benchmark: BenchmarkFixture,
+    event_loop: asyncio.AbstractEventLoop,
+    db: AsyncSession,
+    base: str,
+) -> None:
+    benchmark.group = "1000 creates of one name"
+
+    async def create_all() -> str:
+        for _ in range(1000):
+            recipe = await create_recipe(db, RecipeCreate(name=base))
+        return recipe.slug
+
+    slug = benchmark.pedantic(
+        lambda: event_loop.run_until_complete(create_all()), rounds=1
+    )
+    assert slug == f"{base}-999"
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("method", ["probing", "single-query"])
+def test_create_after_many_benchmark(
+    benchmark: BenchmarkFixture,
+    event_loop: asyncio.AbstractEventLoop,
+    db: AsyncSession,
+    base: str,
+    method: str,
+) -> None:
+    benchmark.group = "create with 1000 slugs taken"
+    taken = [base, *(f"{base}-{n}" for n in range(1, 1000))]
+    event_loop.run_until_complete(
+        db.execute(insert(Recipe), [{"name": base, "slug": slug} for slug in taken])
+    )
+    create = probing_create if method == "probing" else create_recipe
+
+    recipe = benchmark.pedantic(
+        lambda: event_loop.run_until_complete(create(db, RecipeCreate(name=base))),
+        rounds=5,
+    )
+    assert int(recipe.slug.removeprefix(f"{base}-")) >= 1000
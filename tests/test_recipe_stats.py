@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+
+pytestmark = [pytest.mark.database, pytest.mark.recipe]
+
+STATS_URL = "/api/recipes/stats/summary"
+
+
+async def test_stats_count_every_dimension(
+    client: httpx.AsyncClient,
+    admin_headers: dict[str, str],
+    add_recipes: Callable[..., Awaitable[None]],
+) -> None:
+    now = datetime.now(UTC).replace(tzinfo=None)
+    await add_recipes(
+        {"category": "soup", "cuisine": "thai", "created_at": now},
+        {"category": "soup", "is_featured": True, "created_at": now},
+        {"category": "bread", "is_public": False, "created_at": now},
+        {"category": "soup", "created_at": now - timedelta(weeks=30)},
+    )
+
+    response = await client.get(STATS_URL, headers=admin_headers)
+
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["total_recipes"] == 4
+    assert stats["public_recipes"] == 3
+    assert stats["private_recipes"] == 1
+    assert stats["featured_recipes"] == 1
+    assert stats["by_category"] == [
+        {"value": "soup", "total": 3, "public": 3, "featured": 1},
+        {"value": "bread", "total": 1, "public": 0, "featured": 0},
+    ]
+    assert stats["by_cuisine"] == [
+        {"value": None, "total": 3, "public": 2, "featured": 1},
+        {"value": "thai", "total": 1, "public": 1, "featured": 0},
+    ]
+    [week] = stats["created_per_week"]
+    assert week["total"] == 3
+    assert datetime.fromisoformat(week["value"]).weekday() == 0
+
+
+async def test_stats_are_cached(
+    client: httpx.AsyncClient,
+    admin_headers: dict[str, str],
+    add_recipes: Callable[..., Awaitable[None]],
+) -> None:
+    await add_recipes({})
+    first = await client.get(STATS_URL, params={"weeks": 4}, headers=admin_headers)
+    await add_recipes({})
+
+    second = await client.get(STATS_URL, params={"weeks": 4}, headers=admin_headers)
+
+    assert second.json() == first.json()
+    assert second.json()["total_recipes"] == 1
+
+
+async def test_stats_are_admin_only(
+    client: httpx.AsyncClient, user_headers: dict[str, str]
+) -> None:
+    assert (await client.get(STATS_URL, headers=user_headers)).status_code == 403
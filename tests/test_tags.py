@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+pytestmark = [pytest.mark.database, pytest.mark.recipe]
+
+RECIPES_URL = "/api/recipes/"
+
+
+async def test_tag_counts_follow_recipe_writes(
+    client: httpx.AsyncClient,
+    user_headers: dict[str, str],
+    admin_headers: dict[str, str],
+) -> None:
+    created = []
+    for fields in (
+        {"name": "Leek soup", "tags": ["soup", "quick"]},
+        {"name": "Pea soup", "tags": ["soup"]},
+        {"name": "Secret soup", "tags": ["soup", "secret"], "is_public": False},
+    ):
+        response = await client.post(RECIPES_URL, json=fields, headers=user_headers)
+        created.append(response.json()["id"])
+
+    async def tags(**params: str) -> list[str]:
+        response = await client.get(f"{RECIPES_URL}tags", params=params)
+        return list(response.json())
+
+    assert await tags() == ["quick", "soup"]
+    assert await tags(sort="popular") == ["soup", "quick"]
+
+    leek, pea, secret = created
+    await client.put(
+        f"{RECIPES_URL}{leek}", json={"tags": ["winter"]}, headers=admin_headers
+    )
+    await client.put(
+        f"{RECIPES_URL}{secret}", json={"is_public": True}, headers=admin_headers
+    )
+    await client.delete(f"{RECIPES_URL}{pea}", headers=admin_headers)
+
+    assert await tags(sort="popular") == ["secret", "soup", "winter"]
+    assert await tags(sort="popular", limit="1") == ["secret"]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cookbook.crud.user import get_user, set_user_admin, user_cache
+from cookbook.models.user import User
+
+pytestmark = pytest.mark.database
+
+
+async def test_get_user_round_trips_through_cache(db: AsyncSession) -> None:
+    user = User(
+        email=f"{uuid4().hex}@example.com",
+        full_name="Ada",
+        is_admin=True,
+        created_at=datetime(2024, 5, 1, 12, 0),
+        updated_at=datetime(2024, 5, 2, 12, 0),
+    )
+    db.add(user)
+    await db.flush()
+
+    loaded = await get_user(db, user.id)
+    assert await user_cache.get(str(user.id)) is not None
+    cached = await get_user(db, user.id)
+
+    assert loaded is user
+    assert cached is not None
+    assert cached is not user
+    assert (cached.id, cached.email, cached.full_name, cached.is_admin) == (
+        user.id,
+        user.email,
+        "Ada",
+        True,
+    )
+    assert (cached.created_at, cached.updated_at) == (
+        user.created_at,
+        user.updated_at,
+    )
+
+
+async def test_admins_are_not_cached_per_process(db: AsyncSession) -> None:
+    created = datetime(2024, 5, 1, 12, 0)
+    admin = User(
+        email=f"{uuid4().hex}@example.com",
+        is_admin=True,
+        created_at=created,
+        updated_at=created,
+    )
+    member = User(
+        email=f"{uuid4().hex}@example.com", created_at=created, updated_at=created
+    )
+    db.add_all([admin, member])
+    await db.flush()
+
+    await get_user(db, admin.id)
+    await get_user(db, member.id)
+
+    assert user_cache.local.get(str(admin.id)) is None
+    assert user_cache.local.get(str(member.id)) is not None
+    assert await user_cache.get(str(admin.id)) is not None
+
+
+async def test_revoked_admin_is_seen_at_once(db: AsyncSession) -> None:
+    admin = User(
+        email=f"{uuid4().hex}@example.com",
+        is_admin=True,
+        created_at=datetime(2024, 5, 1, 12, 0),
+        updated_at=datetime(2024, 5, 1, 12, 0),
+    )
+    db.add(admin)
+    await db.flush()
+    await get_user(db, admin.id)
+
+    assert await set_user_admin(db, admin.email, is_admin=False)
+    user = await get_user(db, admin.id)
+
+    assert user is not None
+    assert not user.is_admin
+    assert not await set_user_admin(db, "nobody@example.com", is_admin=True)
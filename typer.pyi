@@ -6,6 +6,7 @@ class Exit(Exception):
 
 def echo(*args: Any, **kwargs: Any) -> None: ...
 def Argument(*args: Any, **kwargs: Any) -> Any: ...
+def Option(*args: Any, **kwargs: Any) -> Any: ...
 
 # ruff: noqa: N818,N802
 